@@ -1,12 +1,24 @@
-"""Speedwagon."""
+"""Speedwagon.
 
-from speedwagon import tasks
-from speedwagon import startup
-from speedwagon.exceptions import JobCancelled
-from speedwagon.runner_strategies import simple_api_run_workflow
-from speedwagon.job import Workflow, available_workflows
-from speedwagon import frontend, config, validators
-from speedwagon.plugin_hook import hookimpl
+The public API is imported the first time it is used, so that importing
+speedwagon on its own does not pay for the frontend, the plugin system or
+the configuration backends.
+"""
+
+from __future__ import annotations
+
+import importlib
+import typing
+from typing import Any, Dict, List, Tuple
+
+if typing.TYPE_CHECKING:
+    from speedwagon import tasks
+    from speedwagon import startup
+    from speedwagon.exceptions import JobCancelled
+    from speedwagon.runner_strategies import simple_api_run_workflow
+    from speedwagon.job import Workflow, available_workflows
+    from speedwagon import frontend, config, validators
+    from speedwagon.plugin_hook import hookimpl
 
 __all__ = [
     "Workflow",
@@ -20,3 +32,36 @@ __all__ = [
     'hookimpl',
     "validators"
 ]
+
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "Workflow": ("speedwagon.job", "Workflow"),
+    "available_workflows": ("speedwagon.job", "available_workflows"),
+    "simple_api_run_workflow": (
+        "speedwagon.runner_strategies",
+        "simple_api_run_workflow",
+    ),
+    "JobCancelled": ("speedwagon.exceptions", "JobCancelled"),
+    "hookimpl": ("speedwagon.plugin_hook", "hookimpl"),
+}
+
+_LAZY_SUBMODULES = frozenset(
+    {"tasks", "startup", "frontend", "config", "validators", "job"}
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a part of the public API the first time it is used."""
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the package, including those not imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,311 @@
+"""Journal of finished subtasks, used to resume interrupted jobs.
+
+When a job is run with checkpointing, every subtask that finishes
+successfully is written to a journal on disk, along with its result. When
+the same job is resumed with the same options, subtasks found in the
+journal are restored from it instead of being run a second time.
+
+Subtasks are identified by their class, their path within the task that
+created them and their arguments. Subtasks with arguments that cannot be
+written the same way from run to run are never journaled. Anything a
+subtask leaves in the job's temporary working directory is not kept, so
+subtasks that rely on files written there by other subtasks should not be
+skipped this way.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import threading
+from typing import Any, Mapping, Optional
+
+import speedwagon.tasks.tasks
+
+__all__ = [
+    "SubtaskJournal",
+    "open_job_journal",
+    "subtask_key",
+]
+
+JOURNAL_DIRECTORY_NAME = "journals"
+
+RUNTIME_SUBTASK_ATTRIBUTES = frozenset(
+    {
+        "_status",
+        "_working_dir",
+        "_working_dir_created",
+        "_created_working_dir",
+        "task_working_dir",
+        "_parent_task_log_q",
+        "_result",
+        "_dependencies",
+        "_dependency_results",
+        "log",
+    }
+)
+"""Subtask attributes set while a job runs that are not arguments."""
+
+logger = logging.getLogger(__name__)
+
+
+def _stable_repr(value: Any) -> str:
+    if callable(value):
+        module = getattr(value, "__module__", "")
+        name = getattr(value, "__qualname__", type(value).__qualname__)
+        return f"{module}.{name}"
+    return repr(value)
+
+
+class UnstableArgument(TypeError):
+    """A subtask argument has no representation that is the same each run."""
+
+
+_MEMORY_ADDRESS = re.compile(r"0x[0-9a-fA-F]{4,}")
+
+
+def _stable_argument(value: Any) -> str:
+    if callable(value):
+        return _stable_repr(value)
+    if type(value).__repr__ is object.__repr__:
+        raise UnstableArgument(type(value).__qualname__)
+    representation = repr(value)
+    if _MEMORY_ADDRESS.search(representation):
+        raise UnstableArgument(type(value).__qualname__)
+    return representation
+
+
+def subtask_key(
+    subtask: speedwagon.tasks.tasks.AbsSubtask,
+) -> Optional[str]:
+    """Get an identity for a subtask that is the same from run to run.
+
+    The numbering of tasks is left out of the subtask's path, because it
+    depends on how many jobs have been run before.
+
+    Returns:
+        None if any of the subtask's arguments can only be represented by
+        something that changes between runs, such as a memory address.
+    """
+    attributes = vars(subtask)
+    task_working_dir = attributes.get("task_working_dir", "")
+    working_dir = attributes.get("_working_dir", "")
+    subtask_path = (
+        os.path.relpath(working_dir, task_working_dir)
+        if working_dir and task_working_dir
+        else working_dir
+    )
+    try:
+        arguments = json.dumps(
+            {
+                key: value
+                for key, value in attributes.items()
+                if key not in RUNTIME_SUBTASK_ATTRIBUTES
+            },
+            sort_keys=True,
+            default=_stable_argument,
+        )
+    except (UnstableArgument, ValueError) as error:
+        logger.debug(
+            "Not journaling %s, argument has no stable form: %s",
+            type(subtask).__name__,
+            error,
+        )
+        return None
+    subtask_class = type(subtask)
+    identity = "\0".join(
+        [
+            f"{subtask_class.__module__}.{subtask_class.__qualname__}",
+            subtask_path.replace(os.sep, "/"),
+            arguments,
+        ]
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class SubtaskJournal:
+    """Record of the subtasks of a job that have finished successfully.
+
+    The journal is stored in a SQLite database. Each subtask is committed as
+    soon as it is recorded, so nothing recorded is lost if the job crashes.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open a journal, creating it if it does not exist.
+
+        Args:
+            path: File path to the journal database.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS subtasks "
+            "(key TEXT PRIMARY KEY, has_result INTEGER, result BLOB)"
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> SubtaskJournal:
+        """Use the journal as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the journal, keeping it on disk."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Get the number of subtasks recorded."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM subtasks"
+            ).fetchone()[0]
+
+    def record(
+        self,
+        subtask: speedwagon.tasks.tasks.AbsSubtask,
+        key: Optional[str] = None,
+    ) -> bool:
+        """Record a subtask as finished.
+
+        Args:
+            subtask: Subtask that finished successfully.
+            key: Identity of the subtask, as it was before it ran. Defaults
+                to :py:func:`subtask_key` of the subtask.
+
+        Returns:
+            True if the subtask was recorded. Subtasks with results that
+            cannot be pickled, or without a stable key, are not recorded, so
+            they run again on resume.
+        """
+        if not hasattr(subtask, "set_results"):
+            return False
+        key = key or subtask_key(subtask)
+        if key is None:
+            return False
+        task_result = subtask.task_result
+        try:
+            result = (
+                pickle.dumps(task_result.data)
+                if task_result is not None
+                else None
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            logger.debug("Unable to journal subtask result: %s", error)
+            return False
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO subtasks (key, has_result, result) "
+                "VALUES (?, ?, ?)",
+                (key, task_result is not None, result),
+            )
+            self._connection.commit()
+        return True
+
+    def restore(
+        self,
+        subtask: speedwagon.tasks.tasks.AbsSubtask,
+        key: Optional[str] = None,
+    ) -> bool:
+        """Mark a subtask as finished if it is in the journal.
+
+        The result recorded for the subtask is set on it.
+
+        Args:
+            subtask: Subtask to look up.
+            key: Identity of the subtask. Defaults to :py:func:`subtask_key`
+                of the subtask.
+
+        Returns:
+            True if the subtask was restored and does not need to run. A
+            subtask without a stable key, or with a recorded result that can
+            no longer be loaded, is not restored and runs again.
+        """
+        if not hasattr(subtask, "set_results"):
+            return False
+        key = key or subtask_key(subtask)
+        if key is None:
+            return False
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT has_result, result FROM subtasks WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return False
+        has_result, result = row
+        restored: Any = subtask
+        if has_result:
+            try:
+                data = pickle.loads(result)
+            except Exception as error:  # pylint: disable=broad-except
+                logger.debug(
+                    "Unable to restore journaled subtask result: %s", error
+                )
+                return False
+            restored.set_results(data)
+        restored.status = speedwagon.tasks.tasks.TaskStatus.SUCCESS
+        return True
+
+    def close(self) -> None:
+        """Close the journal, keeping it on disk to resume from."""
+        with self._lock:
+            self._connection.close()
+
+    def discard(self) -> None:
+        """Close the journal and delete it."""
+        self.close()
+        for path in (self.path, f"{self.path}-wal", f"{self.path}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def job_journal_path(
+    directory: str, workflow_name: str, options: Mapping[str, Any]
+) -> str:
+    """Get the path to the journal of a job.
+
+    Jobs running the same workflow with the same options share a journal.
+    """
+    options_hash = hashlib.sha256(
+        json.dumps(options, sort_keys=True, default=_stable_repr).encode(
+            "utf-8"
+        )
+    ).hexdigest()[:16]
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", workflow_name).strip("_")
+    return os.path.join(directory, f"{safe_name}-{options_hash}.sqlite")
+
+
+def open_job_journal(
+    directory: str,
+    workflow_name: str,
+    options: Mapping[str, Any],
+    resume: bool = False,
+) -> SubtaskJournal:
+    """Open the journal of a job.
+
+    Args:
+        directory: Directory where journals are kept.
+        workflow_name: Name of the workflow the job runs.
+        options: Options the job runs with.
+        resume: Keep the subtasks recorded by an earlier run of the same
+            job. Otherwise, the job starts with an empty journal.
+    """
+    os.makedirs(directory, exist_ok=True)
+    path = job_journal_path(directory, workflow_name, options)
+    if not resume and os.path.exists(path):
+        SubtaskJournal(path).discard()
+    journal = SubtaskJournal(path)
+    if resume:
+        logger.info(
+            "Resuming %s, %d subtask(s) already finished",
+            workflow_name,
+            len(journal),
+        )
+    return journal
@@ -33,11 +33,11 @@ except ImportError:  # pragma: no cover
 
 from types import TracebackType
 
-import speedwagon.job
 import speedwagon.info
 from .common import DEFAULT_CONFIG_DIRECTORY_NAME
 
 if typing.TYPE_CHECKING:
+    import speedwagon.job
     from .common import SettingsData, FullSettingsData, SettingsDataType
 
 
@@ -221,6 +221,9 @@ def generate_default(config_file: str) -> None:
     }
     with open(config_file, "w", encoding="utf-8") as file:
         config.write(file)
+    # Avoid circular imports!  pylint: disable=import-outside-toplevel
+    import speedwagon.job
+
     ensure_keys(config_file, speedwagon.job.all_required_workflow_keys())
 
 
@@ -451,6 +454,20 @@ class CliArgsSetter(AbsSetting):
             help="Run job from json file",
         )
 
+        run_parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the work already finished by an earlier run of the "
+            "same job that was interrupted. Implies --checkpoint",
+        )
+
+        run_parser.add_argument(
+            "--checkpoint",
+            action="store_true",
+            help="Keep a record of finished work while the job runs, so "
+            "that it can be resumed with --resume if it is interrupted",
+        )
+
         return parser
 
     @staticmethod
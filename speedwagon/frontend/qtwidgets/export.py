@@ -8,6 +8,7 @@ import typing
 from typing import Dict, Callable, Iterable, List, Tuple
 import sys
 
+import speedwagon.job
 from speedwagon import config
 
 if sys.version_info < (3, 10):  # pragma: no cover
@@ -106,6 +107,7 @@ def write_plugins_config_file(
     serialized_data = serialization_strategy(config_file, data)
     with open(config_file, "w", encoding="utf-8") as f:
         f.write(serialized_data)
+    speedwagon.job.invalidate_workflow_registry()
     on_success_save_updated_settings()
     return True
 
@@ -25,9 +25,9 @@ import speedwagon.runner_strategies
 from speedwagon.config import StandardConfig, FullSettingsData
 
 if TYPE_CHECKING:
-    from speedwagon.job import Workflow
     from speedwagon.frontend.qtwidgets import widgets
     from speedwagon.frontend.qtwidgets.tabs import ItemTabsWidget
+    from speedwagon.workflow_metadata import WorkflowType
 
 __all__ = ["MainWindow3"]
 
@@ -70,6 +70,7 @@ class MainWindow3(MainWindow3UI):
 
     submit_job = QtCore.Signal(str, dict)
     export_job_config = QtCore.Signal(str, dict, QtWidgets.QWidget)
+    workflow_selected = QtCore.Signal(object)
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         """Create a new widget.
@@ -101,6 +102,7 @@ class MainWindow3(MainWindow3UI):
         ###########################################################
         self.action_export_job.triggered.connect(self._export_job_config)
         self.tab_widget.submit_job.connect(self.submit_job)
+        self.tab_widget.workflow_selected.connect(self.workflow_selected)
         self.tab_widget.session_config = self.session_config
         self.submit_job.connect(lambda *args: print("got it"))
 
@@ -147,12 +149,23 @@ class MainWindow3(MainWindow3UI):
         self.tab_widget.clear_tabs()
 
     def add_tab(
-        self, tab_name: str, workflows: typing.Dict[str, typing.Type[Workflow]]
+        self, tab_name: str, workflows: typing.Mapping[str, WorkflowType]
     ) -> None:
         """Add tab."""
         self.tab_widget.session_config = self.session_config
         self.tab_widget.add_workflows_tab(tab_name, list(workflows.values()))
 
+    def set_workflow_validation(
+        self,
+        workflow_name: str,
+        validating: bool = False,
+        error: typing.Optional[str] = None,
+    ) -> None:
+        """Set if a workflow is being validated, or why it is invalid."""
+        self.tab_widget.set_workflow_validation(
+            workflow_name, validating, error
+        )
+
     def set_active_workflow(self, workflow_name: str) -> None:
         """Set active workflow."""
         tab_index = self.locate_tab_index_by_name("All")
@@ -39,6 +39,7 @@ import importlib.metadata
 
 from PySide6 import QtWidgets, QtCore
 
+import speedwagon.checkpoint
 import speedwagon.job
 from speedwagon.frontend.qtwidgets.models.tabs import TabDataModelConfigLoader
 from speedwagon.workflow import initialize_workflows
@@ -58,6 +59,8 @@ from speedwagon.utils import get_desktop_path, validate_user_input
 from speedwagon.tasks import system as system_tasks
 from speedwagon import info, startup
 import speedwagon.plugins
+import speedwagon.workflow_metadata
+from speedwagon.workflow_validation import WorkflowValidator
 from . import user_interaction
 from . import dialog
 from . import runners
@@ -80,6 +83,7 @@ if typing.TYPE_CHECKING:
     from speedwagon.config.tabs import AbsTabsConfigDataManagement
     from speedwagon.tasks.system import AbsSystemTask
     from speedwagon.workflow import AbsOutputOptionDataType
+    from speedwagon.workflow_metadata import WorkflowType
     import pluggy
 
 __all__ = ["AbsGuiStarter", "StartQtThreaded", "SingleWorkflowJSON"]
@@ -235,6 +239,23 @@ def get_active_workflows(
     return speedwagon.job.available_workflows(workflow_finder)
 
 
+def get_active_workflow_descriptors(
+    config_file: str,
+) -> Dict[str, WorkflowType]:
+    """Get the workflows of activated plugins, without importing them.
+
+    Workflows are listed from the workflow metadata cache where possible.
+    Each workflow's class is only imported when it is selected or run.
+    """
+    workflow_finder = speedwagon.job.OnlyActivatedPluginsWorkflows(
+        plugin_settings=plugin_config.read_settings_file_plugins(config_file)
+    )
+    return {
+        name: speedwagon.workflow_metadata.WorkflowDescriptor(metadata)
+        for name, metadata in workflow_finder.locate_metadata().items()
+    }
+
+
 def _setup_config_tab(
     yaml_file: str, config_ini: str
 ) -> dialog.settings.TabsConfigurationTab:
@@ -243,7 +264,7 @@ def _setup_config_tab(
         tabs_manager=CustomTabsYamlConfig(yaml_file)
     )
     model_loader.get_all_active_workflows_strategy = functools.partial(
-        get_active_workflows, config_file=config_ini
+        get_active_workflow_descriptors, config_file=config_ini
     )
     tabs_config.load_tab_data_model_strategy = model_loader
     tabs_config.editor.load_data()
@@ -439,6 +460,121 @@ def import_workflow_config(
     parent.set_current_workflow_settings(data)
 
 
+def _workflow_imported(workflow: WorkflowType) -> bool:
+    if isinstance(workflow, speedwagon.workflow_metadata.WorkflowDescriptor):
+        return workflow.loaded or workflow.metadata["module"] in sys.modules
+    return True
+
+
+class WorkflowValidationRunner(QtCore.QObject):
+    """Validates workflows on background threads.
+
+    Each workflow is reported as soon as it has been checked. Validations
+    started before the last reset are no longer reported.
+    """
+
+    validated = QtCore.Signal(str, object)
+    """Emitted in the GUI thread with a workflow name and error or None."""
+
+    finished = QtCore.Signal()
+    """Emitted in the GUI thread once no validation is running."""
+
+    failed = QtCore.Signal(object, object)
+    """Emitted in the GUI thread with the exception if validation failed.
+
+    The workflows that were not reported before it failed are also given.
+    """
+
+    _validated = QtCore.Signal(int, str, object)
+    _done = QtCore.Signal(int, object, object)
+
+    def __init__(
+        self,
+        validator: Optional[WorkflowValidator] = None,
+        parent: Optional[QtCore.QObject] = None,
+    ) -> None:
+        """Create a new validation runner."""
+        super().__init__(parent)
+        self.validator = validator or WorkflowValidator()
+        self._generation = 0
+        self._pending = 0
+        self._validated.connect(self._report_result)
+        self._done.connect(self._report_done)
+
+    @property
+    def running(self) -> bool:
+        """Check if any validation started since the last reset is running."""
+        return self._pending > 0
+
+    def reset(self) -> None:
+        """Stop reporting the validations that have already been started."""
+        self._generation += 1
+        self._pending = 0
+
+    def start(
+        self,
+        workflows: Mapping[str, WorkflowType],
+        global_settings: Mapping[str, object],
+    ) -> None:
+        """Start validating workflows alongside any already running."""
+        self._pending += 1
+        generation = self._generation
+
+        def validate() -> None:
+            reported: typing.Set[str] = set()
+
+            def on_result(workflow_name: str, error: Optional[str]) -> None:
+                reported.add(workflow_name)
+                self._validated.emit(generation, workflow_name, error)
+
+            try:
+                self.validator.validate(
+                    workflows, global_settings, on_result=on_result
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                self._done.emit(
+                    generation,
+                    error,
+                    {
+                        workflow_name: workflow
+                        for workflow_name, workflow in workflows.items()
+                        if workflow_name not in reported
+                    },
+                )
+            else:
+                self._done.emit(generation, None, {})
+
+        threading.Thread(
+            target=validate, name="Validate workflows", daemon=True
+        ).start()
+
+    def _report_result(
+        self, generation: int, workflow_name: str, error: Optional[str]
+    ) -> None:
+        if generation == self._generation:
+            self.validated.emit(workflow_name, error)
+
+    def _report_done(
+        self,
+        generation: int,
+        error: Optional[BaseException],
+        unreported: Dict[str, WorkflowType],
+    ) -> None:
+        if generation != self._generation:
+            return
+        self._pending -= 1
+        if error is not None:
+            # Raising here would only reach Qt's handler for exceptions in
+            # slots, never the user.
+            logging.getLogger(__name__).error(
+                "Unable to validate workflows",
+                exc_info=(type(error), error, error.__traceback__),
+            )
+            self.failed.emit(error, unreported)
+        if not self._pending:
+            self.finished.emit()
+
+
 class StartQtThreaded(AbsGuiStarter):
     """Start a Qt Widgets base app using threads for job workers."""
 
@@ -477,6 +613,13 @@ class StartQtThreaded(AbsGuiStarter):
 
         speedwagon.frontend.qtwidgets.gui.set_app_display_metadata(self.app)
         self._request_window = user_interaction.QtRequestMoreInfo(self.windows)
+        self.workflow_validation = WorkflowValidationRunner()
+        self.workflow_validation.validated.connect(self._workflow_validated)
+        self.workflow_validation.finished.connect(self._workflows_validated)
+        self.workflow_validation.failed.connect(
+            self._workflow_validation_failed
+        )
+        self._unvalidated_workflows: Dict[str, WorkflowType] = {}
         self.startup_tasks: List[
             AbsSystemTask
             | Callable[[AbsConfigSettings, SettingsLocations], None]
@@ -528,43 +671,117 @@ class StartQtThreaded(AbsGuiStarter):
 
         self.logger.debug("Loading Workflows")
         loading_workflows_stream = io.StringIO()
-        self.windows.clear_tabs()
 
         with contextlib.redirect_stderr(loading_workflows_stream):
-            all_workflows = speedwagon.job.available_workflows(
-                strategy=speedwagon.job.OnlyActivatedPluginsWorkflows(
-                    plugin_settings=plugin_config.read_settings_file_plugins(
-                        self.config_locations.get_config_file()
-                    )
-                )
+            all_workflows = get_active_workflow_descriptors(
+                self.config_locations.get_config_file()
             )
 
-        for workflow_name, error in self._find_invalid(all_workflows):
-            error_message = (
-                f"Unable to load workflow '{workflow_name}'. Reason: {error}"
-            )
+        # Workflows are shown while they are validated, so that a slow
+        # workflow does not keep the window from responding. Workflows
+        # that have not been imported yet are only validated once they are
+        # selected, so that they are not all imported at start up.
+        self._show_workflows(all_workflows)
+        self.workflow_validation.reset()
+        self._unvalidated_workflows = {
+            workflow_name: workflow
+            for workflow_name, workflow in all_workflows.items()
+            if not _workflow_imported(workflow)
+        }
+        self._validate_workflows(
+            {
+                workflow_name: workflow
+                for workflow_name, workflow in all_workflows.items()
+                if workflow_name not in self._unvalidated_workflows
+            }
+        )
+
+        workflow_errors_msg = loading_workflows_stream.getvalue().strip()
+        if workflow_errors_msg:
+            for line in workflow_errors_msg.split("\n"):
+                self.logger.warning(line)
 
-            self.logger.error(error_message)
-            self.windows.console.add_message(error_message)
-            del all_workflows[workflow_name]
+    def _show_workflows(self, workflows: Dict[str, WorkflowType]) -> None:
+        if self.windows is None:
+            return
+        self.windows.clear_tabs()
 
         # Load every user configured tab
         self.load_custom_tabs(
-            self.windows, self.config_locations.get_tabs_file(), all_workflows
+            self.windows, self.config_locations.get_tabs_file(), workflows
         )
 
         # All Workflows tab
-        self.load_all_workflows_tab(self.windows, all_workflows)
+        self.load_all_workflows_tab(self.windows, workflows)
 
-        workflow_errors_msg = loading_workflows_stream.getvalue().strip()
-        if workflow_errors_msg:
-            for line in workflow_errors_msg.split("\n"):
-                self.logger.warning(line)
+    def _validate_workflows(
+        self, workflows: Mapping[str, WorkflowType]
+    ) -> None:
+        if self.windows is None or not workflows:
+            return
+        for workflow_name in workflows:
+            self.windows.set_workflow_validation(
+                workflow_name, validating=True
+            )
+        self.windows.statusBar().showMessage(
+            f"Validating {len(workflows)} workflow(s)..."
+        )
+        self.workflow_validation.start(
+            workflows, self.settings.get("GLOBAL", {})
+        )
+
+    def _validate_selected_workflow(
+        self, workflow: Optional[WorkflowType]
+    ) -> None:
+        if workflow is None or workflow.name is None:
+            return
+        unvalidated = self._unvalidated_workflows.pop(workflow.name, None)
+        if unvalidated is not None:
+            self._validate_workflows({workflow.name: unvalidated})
+
+    def _workflow_validated(
+        self, workflow_name: str, error: Optional[str]
+    ) -> None:
+        if self.windows is None:
+            return
+        self.windows.set_workflow_validation(workflow_name, error=error)
+        if error is None:
+            return
+        error_message = (
+            f"Unable to load workflow '{workflow_name}'. Reason: {error}"
+        )
+        self.logger.error(error_message)
+        self.windows.console.add_message(error_message)
+
+    def _workflows_validated(self) -> None:
+        if self.windows is not None:
+            self.windows.statusBar().clearMessage()
+
+    def _workflow_validation_failed(
+        self,
+        error: BaseException,
+        unreported: Dict[str, WorkflowType],
+    ) -> None:
+        if self.windows is None:
+            return
+        # Whatever was not checked is checked again when it is selected.
+        for workflow_name in unreported:
+            self.windows.set_workflow_validation(workflow_name)
+        self._unvalidated_workflows.update(unreported)
+        self.windows.console.add_message(
+            f"Unable to validate workflows. Reason: {error}"
+        )
+        report_exception_dialog(
+            exc=error,
+            parent=self.windows,
+            dialog_box_title="Unable to Validate Workflows",
+            is_fatal=False,
+        )
 
     def load_all_workflows_tab(
         self,
         application: gui.MainWindow3,
-        loaded_workflows: typing.Dict[str, Type[speedwagon.job.Workflow]],
+        loaded_workflows: typing.Dict[str, WorkflowType],
     ) -> None:
         """Load tab that contains all workflows."""
         print("Loading Tab All")
@@ -577,7 +794,7 @@ class StartQtThreaded(AbsGuiStarter):
         self,
         main_window: gui.MainWindow3,
         tabs_file: str,
-        loaded_workflows: typing.Dict[str, Type[speedwagon.job.Workflow]],
+        loaded_workflows: typing.Dict[str, WorkflowType],
     ) -> None:
         """Load custom tabs."""
         tabs_file_size = os.path.getsize(tabs_file)
@@ -695,7 +912,9 @@ class StartQtThreaded(AbsGuiStarter):
         builder.submit_job = functools.partial(
             self.submit_job, job_manager, main_app=self.windows
         )
-        return builder.build()
+        window = builder.build()
+        window.workflow_selected.connect(self._validate_selected_workflow)
+        return window
 
     @staticmethod
     def abort_job(
@@ -810,16 +1029,14 @@ class StartQtThreaded(AbsGuiStarter):
         threaded_events.started.set()
 
     def _find_invalid(
-        self, workflows: typing.Dict[str, typing.Type[speedwagon.job.Workflow]]
+        self, workflows: typing.Dict[str, WorkflowType]
     ) -> typing.Iterable[typing.Tuple[str, str]]:
-        for title, workflow in workflows.copy().items():
-            try:
-                workflow(global_settings=self.settings.get("GLOBAL", {}))
-            except (
-                speedwagon.exceptions.SpeedwagonException,
-                AttributeError,
-            ) as error:
-                yield title, str(error)
+        errors = self.workflow_validation.validator.validate(
+            workflows, self.settings.get("GLOBAL", {})
+        )
+        for title, error in errors.items():
+            if error is not None:
+                yield title, error
 
 
 def report_exception_dialog(
@@ -969,6 +1186,8 @@ class SingleWorkflowJSON(AbsGuiStarter):
         ] = None
         self.options: typing.Optional[SettingsData] = None
         self.workflow: typing.Optional[AbsWorkflow] = None
+        self.resume = False
+        self.checkpoint = False
         self.logger = logger or logging.getLogger(__name__)
 
     def load_json_string(self, data: str) -> None:
@@ -1008,6 +1227,16 @@ class SingleWorkflowJSON(AbsGuiStarter):
         with (
             speedwagon.runner_strategies.BackgroundJobManager() as job_manager
         ):
+            if self.resume or self.checkpoint:
+                job_manager.journal_factory = functools.partial(
+                    speedwagon.checkpoint.open_job_journal,
+                    os.path.join(
+                        job_manager.config_file_location_strategy
+                        .get_app_data_dir(),
+                        speedwagon.checkpoint.JOURNAL_DIRECTORY_NAME,
+                    ),
+                    resume=self.resume,
+                )
             self._run_workflow(job_manager, self.workflow, self.options)
             if app is not None:
                 app.quit()
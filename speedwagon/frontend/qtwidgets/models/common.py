@@ -7,7 +7,6 @@ from __future__ import annotations
 import abc
 from typing import (
     Optional,
-    Type,
     Union,
     Any,
     Generic,
@@ -23,7 +22,7 @@ from copy import deepcopy
 from PySide6 import QtGui, QtCore
 
 if TYPE_CHECKING:
-    from speedwagon.job import Workflow
+    from speedwagon.workflow_metadata import WorkflowType
 
 __all__ = [
     "WorkflowItem",
@@ -40,7 +39,7 @@ class AbsWorkflowList(  # pylint: disable=too-few-public-methods
 ):
     """Abstract workflow list model."""
 
-    def add_workflow(self, workflow: Type[Workflow]) -> None:
+    def add_workflow(self, workflow: WorkflowType) -> None:
         """Add a workflow to the model."""
         raise NotImplementedError
 
@@ -48,14 +47,17 @@ class AbsWorkflowList(  # pylint: disable=too-few-public-methods
 class WorkflowItem(QtGui.QStandardItem):
     """Workflow metadata data."""
 
-    def __init__(self, workflow: Optional[Type[Workflow]]) -> None:
+    def __init__(self, workflow: Optional[WorkflowType]) -> None:
         """Create a new Workflow item.
 
         Args:
-            workflow:  Speedwagon Workflow
+            workflow:  Speedwagon Workflow class, or a descriptor that stands
+                in for one until it is used.
         """
         super().__init__()
         self.workflow = workflow
+        self.validating = False
+        self.validation_error: Optional[str] = None
         if workflow is not None and workflow.name is not None:
             self.setText(workflow.name)
 
@@ -68,13 +70,18 @@ class WorkflowItem(QtGui.QStandardItem):
         """Get the name used by the workflow."""
         return None if self.workflow is None else self.workflow.name
 
+    @property
+    def usable(self) -> bool:
+        """Check that the workflow is not being validated or invalid."""
+        return not self.validating and self.validation_error is None
+
 
 class AbsWorkflowItemData(abc.ABC):  # noqa: B024 pylint: disable=R0903
     """Abstract base class for workflow item data."""
 
     def data(  # noqa: B027
         self,
-        workflow: Type[Workflow],
+        workflow: WorkflowType,
         role: Union[int, QtCore.Qt.ItemDataRole],
     ) -> Any:
         """Get the data from workflow.
@@ -93,7 +100,7 @@ class WorkflowItemData(  # pylint: disable=too-few-public-methods
 
     def data(
         self,
-        workflow: Type[Workflow],
+        workflow: WorkflowType,
         role: Union[int, QtCore.Qt.ItemDataRole],
     ) -> Any:
         """Get the data from workflow."""
@@ -6,7 +6,6 @@ import abc
 from typing import (
     Callable,
     Optional,
-    Type,
     Union,
     overload,
     Dict,
@@ -14,6 +13,7 @@ from typing import (
     cast,
     Iterator,
     Any,
+    Mapping,
     TYPE_CHECKING,
 )
 
@@ -24,6 +24,7 @@ import speedwagon.job
 from .common import WorkflowItem, WorkflowClassRole
 if TYPE_CHECKING:
     from speedwagon.config import AbsTabsConfigDataManagement
+    from speedwagon.workflow_metadata import WorkflowType
 
 __all__ = ["TabsTreeModel", "TabStandardItem", "TabProxyModel"]
 
@@ -46,7 +47,7 @@ class TabsTreeModel(QtCore.QAbstractItemModel):
     def append_workflow_tab(
         self,
         name: str,
-        workflows: Optional[List[Type[speedwagon.job.Workflow]]] = None,
+        workflows: Optional[List[WorkflowType]] = None,
     ) -> None:
         """Add a new tab."""
         self.beginResetModel()
@@ -142,6 +143,10 @@ class TabsTreeModel(QtCore.QAbstractItemModel):
                     if item.workflow is None
                     else str(item.workflow.description or "")
                 )
+        if role == QtGui.Qt.ItemDataRole.ToolTipRole:
+            if item.validating:
+                return "Validating..."
+            return item.validation_error
         return item.workflow if role == WorkflowClassRole else None
 
     def data(
@@ -159,6 +164,43 @@ class TabsTreeModel(QtCore.QAbstractItemModel):
             return self.get_workflow_item_data(item, index.column(), role)
         return None
 
+    def flags(
+        self, index: Union[QtCore.QModelIndex, QtCore.QPersistentModelIndex]
+    ) -> QtCore.Qt.ItemFlag:
+        """Get item flags.
+
+        Workflows being validated or found to be invalid are disabled.
+        """
+        flags = super().flags(index)
+        item = self.get_item(index)
+        if isinstance(item, WorkflowItem) and not item.usable:
+            return flags & ~QtCore.Qt.ItemFlag.ItemIsEnabled
+        return flags
+
+    def set_workflow_validation(
+        self,
+        workflow_name: str,
+        validating: bool = False,
+        error: Optional[str] = None,
+    ) -> None:
+        """Set if a workflow is being validated, or why it is invalid.
+
+        Only the items of the workflow are changed, in every tab it is in.
+        """
+        for tab_row_id in range(self.rowCount()):
+            tab_index = self.index(tab_row_id, 0)
+            for row_id in range(self.rowCount(tab_index)):
+                index = self.index(row_id, 0, tab_index)
+                item = self.get_item(index)
+                if (
+                    not isinstance(item, WorkflowItem)
+                    or item.name != workflow_name
+                ):
+                    continue
+                item.validating = validating
+                item.validation_error = error
+                self.dataChanged.emit(index, self.index(row_id, 1, tab_index))
+
     def get_item(
         self,
         index: Union[
@@ -198,7 +240,7 @@ class TabsTreeModel(QtCore.QAbstractItemModel):
         return None
 
     def append_workflow_to_tab(
-        self, tab_name: str, workflow: Type[speedwagon.Workflow]
+        self, tab_name: str, workflow: WorkflowType
     ) -> None:
         """Append a workflow to a tab with a given name."""
         tab = self.get_tab(tab_name)
@@ -290,7 +332,7 @@ class TabProxyModel(QtCore.QAbstractProxyModel):
         super().__init__(parent)
         self.source_tab: Optional[str] = None
 
-    def add_workflow(self, workflow: Type[speedwagon.Workflow]) -> None:
+    def add_workflow(self, workflow: WorkflowType) -> None:
         """Add workflow to list."""
         if self.source_tab is None:
             raise RuntimeError("source_tab not set")
@@ -305,7 +347,7 @@ class TabProxyModel(QtCore.QAbstractProxyModel):
             item.append_workflow(workflow)
             self.endResetModel()
 
-    def remove_workflow(self, workflow: Type[speedwagon.Workflow]):
+    def remove_workflow(self, workflow: WorkflowType):
         """Remove workflow from list."""
         if self.source_tab is None:
             raise RuntimeError("source_tab not set")
@@ -342,6 +384,29 @@ class TabProxyModel(QtCore.QAbstractProxyModel):
             item.sortChildren(column, order)
         super().sort(column, order)
 
+    def setSourceModel(  # pylint: disable=invalid-name
+        self, sourceModel: QtCore.QAbstractItemModel
+    ) -> None:
+        """Set the source model and follow changes to its data."""
+        super().setSourceModel(sourceModel)
+        sourceModel.dataChanged.connect(self._source_data_changed)
+
+    def _source_data_changed(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: Optional[List[int]] = None,
+    ) -> None:
+        if self.source_tab is None or not top_left.isValid():
+            return
+        if top_left.parent() != self.get_source_tab_index(self.source_tab):
+            return
+        self.dataChanged.emit(
+            self.mapFromSource(top_left),
+            self.mapFromSource(bottom_right),
+            roles or [],
+        )
+
     def set_source_tab(self, tab_name: str) -> None:
         """Set the source tab from the source model to use."""
         self.beginResetModel()
@@ -467,7 +532,7 @@ class AbsTabDataModelYAMLLoader(AbsLoadTabDataModelStrategy, abc.ABC):
     def __init__(self) -> None:
         super().__init__()
         self.get_all_active_workflows_strategy: Callable[
-            [], Dict[str, Type[speedwagon.Workflow]]
+            [], Mapping[str, WorkflowType]
         ] = speedwagon.job.available_workflows
 
     @staticmethod
@@ -475,9 +540,9 @@ class AbsTabDataModelYAMLLoader(AbsLoadTabDataModelStrategy, abc.ABC):
         data_load_strategy: AbsTabsConfigDataManagement,
         get_all_active_workflows_strategy: Callable[
             [],
-            Dict[str, Type[speedwagon.Workflow]]
+            Mapping[str, WorkflowType]
         ] = speedwagon.job.available_workflows,
-    ) -> Dict[str, List[Type[speedwagon.Workflow]]]:
+    ) -> Dict[str, List[WorkflowType]]:
         all_workflows = get_all_active_workflows_strategy()
 
         sorted_workflows = sorted(
@@ -488,7 +553,7 @@ class AbsTabDataModelYAMLLoader(AbsLoadTabDataModelStrategy, abc.ABC):
             )
         )
 
-        workflow_tabs_data: Dict[str, List[Type[speedwagon.Workflow]]] = {
+        workflow_tabs_data: Dict[str, List[WorkflowType]] = {
             "All": sorted_workflows
         }
         for tab_data in data_load_strategy.data():
@@ -542,7 +607,7 @@ class TabDataModelConfigLoader(AbsTabDataModelYAMLLoader):
         super().__init__()
         self.tabs_manager = tabs_manager
         self.get_all_active_workflows_strategy: Callable[
-            [], Dict[str, Type[speedwagon.Workflow]]
+            [], Mapping[str, WorkflowType]
         ] = speedwagon.job.available_workflows
 
     def load(self, model: TabsTreeModel) -> None:
@@ -564,7 +629,7 @@ class TabStandardItem(QtGui.QStandardItem):
     def __init__(
         self,
         name: Optional[str] = None,
-        workflows: Optional[List[Type[speedwagon.Workflow]]] = None,
+        workflows: Optional[List[WorkflowType]] = None,
     ) -> None:
         """Create a new TabStandardItem."""
         super().__init__()
@@ -606,13 +671,13 @@ class TabStandardItem(QtGui.QStandardItem):
         """Get the name used by the tab."""
         return self.text()
 
-    def append_workflow(self, workflow: Type[speedwagon.Workflow]) -> None:
+    def append_workflow(self, workflow: WorkflowType) -> None:
         """Add a workflow to the list."""
         if workflow not in self:
             self.appendRow(WorkflowItem(workflow))
             self.emitDataChanged()
 
-    def __contains__(self, workflow: Type[speedwagon.Workflow]) -> bool:
+    def __contains__(self, workflow: WorkflowType) -> bool:
         """Check if workflow in already in item."""
         for row_id in range(self.rowCount()):
             item = cast(WorkflowItem, self.child(row_id, 0))
@@ -620,7 +685,7 @@ class TabStandardItem(QtGui.QStandardItem):
                 return True
         return False
 
-    def remove_workflow(self, workflow: Type[speedwagon.Workflow]) -> None:
+    def remove_workflow(self, workflow: WorkflowType) -> None:
         """Remove workflow from list."""
 
         def _find_row_with_matching_workflow() -> Optional[int]:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import typing
 from typing import (
-    Type,
     Optional,
     List,
     cast,
@@ -24,6 +23,9 @@ from .common import (
 )
 from .tabs import TabStandardItem, TabsTreeModel
 
+if typing.TYPE_CHECKING:
+    from speedwagon.workflow_metadata import WorkflowType
+
 __all__ = [
     "WorkflowList",
     "WorkflowListProxyModel",
@@ -42,7 +44,7 @@ class WorkflowList(AbsWorkflowList):
             parent: Parent widget to control widget lifespan
         """
         super().__init__(parent)
-        self._workflows: List[Type[speedwagon.job.Workflow]] = []
+        self._workflows: List[WorkflowType] = []
         self.data_strategy: AbsWorkflowItemData = WorkflowItemData()
 
     def rowCount(  # pylint: disable=invalid-name
@@ -54,7 +56,7 @@ class WorkflowList(AbsWorkflowList):
         """Get the number of workflows in the list."""
         return len(self._workflows)
 
-    def add_workflow(self, workflow: Type[speedwagon.job.Workflow]) -> None:
+    def add_workflow(self, workflow: WorkflowType) -> None:
         """Add workflow to list."""
         self._workflows.append(workflow)
         self.dataChanged.emit(len(self._workflows), len(self._workflows), 0)
@@ -260,7 +262,7 @@ class WorkflowListProxyModel(QtCore.QAbstractProxyModel):
             else self._current_tab_item.name
         )
 
-    def add_workflow(self, workflow: Type[speedwagon.job.Workflow]) -> None:
+    def add_workflow(self, workflow: WorkflowType) -> None:
         """Add workflow to list."""
         if self._current_tab_item is None:
             raise RuntimeError("model not set")
@@ -277,7 +279,7 @@ class WorkflowListProxyModel(QtCore.QAbstractProxyModel):
         )
         self.endInsertRows()
 
-    def remove_workflow(self, workflow: Type[speedwagon.job.Workflow]) -> None:
+    def remove_workflow(self, workflow: WorkflowType) -> None:
         """Remove workflow from list."""
         if self._current_tab_item is None:
             raise RuntimeError("model not set")
@@ -24,6 +24,7 @@ from speedwagon.config import (
 
 if typing.TYPE_CHECKING:
     import speedwagon.job
+    from speedwagon.workflow_metadata import WorkflowType
     from speedwagon.frontend.qtwidgets.widgets import (
         Workspace,
         SelectWorkflow,
@@ -78,6 +79,10 @@ class WorkflowsTab3(WorkflowsTab3UI):
         """Set the current model used by the tab."""
         self._model = model
         self.workflow_selector.model = self._model
+        self._model.dataChanged.connect(self._model_data_changed)
+
+    def _model_data_changed(self, *_: object) -> None:
+        self.settings_changed.emit()
 
     def _handle_selector_changed(self, index: QtCore.QModelIndex) -> None:
         workflow = self._model.data(index, WorkflowClassRole)
@@ -122,8 +127,19 @@ class WorkflowsTab3(WorkflowsTab3UI):
     def _update_okay_button(self) -> None:
         if self._workflow_selected is None:
             self.start_button.setEnabled(False)
-        else:
-            self.start_button.setEnabled(True)
+            return
+        # The selected workflow is disabled while it is validated, or if it
+        # was found to be invalid.
+        current_index = (
+            self.workflow_selector.workflowSelectionView.currentIndex()
+        )
+        self.start_button.setEnabled(
+            not current_index.isValid()
+            or bool(
+                self._model.flags(current_index)
+                & QtCore.Qt.ItemFlag.ItemIsEnabled
+            )
+        )
 
     def submit_job(self) -> None:
         """Submit new job."""
@@ -184,6 +200,7 @@ class ItemTabsWidget(ItemTabsUI):
 
     tabs: QtWidgets.QTabWidget
     submit_job = QtCore.Signal(str, dict)
+    workflow_selected = QtCore.Signal(object)
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         """Create new widget.
@@ -211,6 +228,7 @@ class ItemTabsWidget(ItemTabsUI):
             workflows_tab = WorkflowsTab3(parent=self.tabs)
             workflows_tab.session_config = self.session_config
             workflows_tab.start_workflow.connect(self.submit_job)
+            workflows_tab.workflow_selected.connect(self.workflow_selected)
 
             workflow_klasses = {}
             for workflow_row_id in range(self._model.rowCount(tab_index)):
@@ -232,11 +250,20 @@ class ItemTabsWidget(ItemTabsUI):
         self.tabs.addTab(tab, name)
 
     def add_workflows_tab(
-            self, name: str, workflows: List[Type[speedwagon.Workflow]]
+            self, name: str, workflows: List[WorkflowType]
     ) -> None:
         """Add workflow tab."""
         self._model.append_workflow_tab(name, workflows)
 
+    def set_workflow_validation(
+        self,
+        workflow_name: str,
+        validating: bool = False,
+        error: Optional[str] = None,
+    ) -> None:
+        """Set if a workflow is being validated, or why it is invalid."""
+        self._model.set_workflow_validation(workflow_name, validating, error)
+
     def clear_tabs(self) -> None:
         """Clear all tabs."""
         self._model.clear()
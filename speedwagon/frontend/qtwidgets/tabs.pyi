@@ -1,12 +1,12 @@
 # pylint: disable=unused-argument
 
-from typing import List, Type, Optional, Dict
+from typing import List, Optional, Dict
 
 from PySide6 import QtWidgets, QtCore
-import speedwagon
 
 from speedwagon.frontend.qtwidgets.widgets import UserDataType, Workspace
 from speedwagon.config import AbsConfigSettings
+from speedwagon.workflow_metadata import WorkflowType
 
 class ItemTabsUI(QtWidgets.QWidget):
     def layout(self) -> QtWidgets.QVBoxLayout: ...
@@ -25,11 +25,12 @@ class WorkflowsTab3(WorkflowsTab3UI):
 
 class ItemTabsWidget(ItemTabsUI):
     submit_job: QtCore.Signal
+    workflow_selected: QtCore.Signal
     tabs: QtWidgets.QTabWidget
     session_config: AbsConfigSettings
 
     def add_workflows_tab(
-        self, name: str, workflows: List[Type[speedwagon.Workflow]]
+        self, name: str, workflows: List[WorkflowType]
     ) -> None:
         ...
 
@@ -37,5 +38,13 @@ class ItemTabsWidget(ItemTabsUI):
     def current_tab(self) -> Optional[WorkflowsTab3]:
         ...
 
+    def set_workflow_validation(
+        self,
+        workflow_name: str,
+        validating: bool = ...,
+        error: Optional[str] = ...,
+    ) -> None:
+        ...
+
     def clear_tabs(self) -> None:
         ...
@@ -11,24 +11,27 @@ import json
 import logging
 import os
 import sys
+import threading
 import typing
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
     Mapping,
-    Sequence,
     TypeVar,
     Generic,
 )
 
 
 import speedwagon.plugins
+import speedwagon.workflow_metadata
 
 from speedwagon.config import common, StandardConfigFileLocator
 import speedwagon.workflows
@@ -51,6 +54,9 @@ __all__ = [
     "all_required_workflow_keys",
     "AbsJobConfigSerializationStrategy",
     "AbsWorkflowFinder",
+    "WorkflowRegistry",
+    "get_workflow_registry",
+    "invalidate_workflow_registry",
 ]
 
 _T = TypeVar("_T", bound=Mapping[str, object])
@@ -77,7 +83,7 @@ class AbsWorkflow(Generic[_T], metaclass=abc.ABCMeta):
         initial_results: List[Result],
         additional_data: Mapping[str, Any],
         user_args: _T,
-    ) -> Sequence[Mapping[str, object]]:
+    ) -> Iterable[Mapping[str, object]]:
         """Generate data or parameters needed for upcoming tasks.
 
         Generate data or parameters needed for task to complete based on
@@ -86,13 +92,26 @@ class AbsWorkflow(Generic[_T], metaclass=abc.ABCMeta):
         Return a list of dictionaries of types that can be serialized,
             preferably strings.
 
+        This can also be an iterator, such as a generator. Iterators are
+        consumed a few items at a time while the job runs, so tasks can start
+        before every item has been found and only a bounded number of items
+        is held in memory. Implementing ``__length_hint__`` on the iterator
+        lets the job report its progress more accurately.
+
         """
 
     def completion_task(  # noqa: B027
-        self, task_builder: TaskBuilder, results: List[Result], user_args: _T
+        self,
+        task_builder: TaskBuilder,
+        results: Sequence[Result],
+        user_args: _T,
     ) -> None:
         """Last task after Job is completed.
 
+        The results of large jobs may be stored on disk instead of in memory,
+        so treat them as a read-only sequence rather than a list. Reading
+        them one at a time, in a for loop, keeps memory use low.
+
         By default, this method is a no-op unless overridden.
         """
 
@@ -137,10 +156,13 @@ class AbsWorkflow(Generic[_T], metaclass=abc.ABCMeta):
 
     @classmethod  # noqa: B027
     def generate_report(
-        cls, results: List[Result], user_args: _T
+        cls, results: Sequence[Result], user_args: _T
     ) -> Optional[str]:
         r"""Generate a text report for the results of the workflow.
 
+        As with :py:meth:`completion_task`, the results are a read-only
+        sequence that may be stored on disk.
+
         Example:
             .. code-block::
 
@@ -352,14 +374,18 @@ class OnlyActivatedPluginsWorkflows(AbsWorkflowFinder):
             group=cls.entry_points_group
         )
 
+    def is_activated(self, entry_point: importlib.metadata.EntryPoint) -> bool:
+        """Check if a plugin is activated in the plugin settings."""
+        return (
+            entry_point.module in self.settings
+            and entry_point.name in self.settings[entry_point.module]
+            and self.settings[entry_point.module][entry_point.name] is True
+        )
+
     def locate(self) -> Dict[str, Type[Workflow]]:
         all_active_workflows: Dict[str, Type[Workflow]] = {}
         for entry_point in self.iter_plugins():
-            if (
-                entry_point.module in self.settings
-                and entry_point.name in self.settings[entry_point.module]
-                and self.settings[entry_point.module][entry_point.name] is True
-            ):
+            if self.is_activated(entry_point):
                 all_active_workflows = {
                     **all_active_workflows,
                     **speedwagon.plugins.get_workflows_from_plugin(
@@ -369,46 +395,193 @@ class OnlyActivatedPluginsWorkflows(AbsWorkflowFinder):
                 }
         return all_active_workflows
 
+    def locate_metadata(
+        self,
+        cache: Optional[
+            speedwagon.workflow_metadata.WorkflowMetadataCache
+        ] = None,
+    ) -> Dict[str, speedwagon.workflow_metadata.WorkflowMetadata]:
+        """Locate the workflows of activated plugins, without importing them.
+
+        Plugins are only imported if their workflows are not in the cache.
+        Use :py:func:`speedwagon.workflow_metadata.load_workflow_class` to
+        import a workflow when it is needed.
+
+        Args:
+            cache: Workflow metadata cache. Defaults to the one in the app
+                data directory.
+        """
+        if cache is None:
+            cache = (
+                speedwagon.workflow_metadata.open_workflow_metadata_cache()
+            )
+        all_active_workflows: Dict[
+            str, speedwagon.workflow_metadata.WorkflowMetadata
+        ] = {}
+        for entry_point in self.iter_plugins():
+            if not self.is_activated(entry_point):
+                continue
+            for metadata in cache.plugin_workflows(
+                entry_point, inclusion_filter=lambda workflow: workflow.active
+            ):
+                all_active_workflows[metadata["name"]] = metadata
+        try:
+            cache.save()
+        except OSError as error:
+            logging.getLogger(__name__).warning(
+                "Unable to save workflow metadata cache %s: %s",
+                cache.path,
+                error,
+            )
+        return all_active_workflows
+
+
+PluginWhitelist = FrozenSet[Tuple[str, str]]
+
+
+class WorkflowRegistry:
+    """Workflows from plugins, kept for the life of the process.
+
+    Loading plugins imports every setuptools entry point and reads the
+    config file, which is too slow to repeat for every job submitted. A
+    plugin manager is built once for each set of whitelisted plugins, and
+    the whitelist in a config file is only read again after the file's
+    modification time or size changes.
+
+    Call :py:meth:`invalidate` after plugins are installed, removed or
+    enabled so that they are loaded again.
+    """
+
+    def __init__(self) -> None:
+        """Create a new registry with nothing loaded."""
+        self._lock = threading.RLock()
+        self._whitelists: Dict[
+            str, Tuple[Tuple[int, int], PluginWhitelist]
+        ] = {}
+        self._plugin_managers: Dict[PluginWhitelist, PluginManager] = {}
+        self._workflows: Dict[PluginWhitelist, Dict[str, Type[Workflow]]] = {}
+
+    def whitelist(self, config_file: str) -> PluginWhitelist:
+        """Get the plugins whitelisted in a config file."""
+        try:
+            stat_result = os.stat(config_file)
+            file_key: Optional[Tuple[int, int]] = (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+            )
+        except OSError:
+            file_key = None
+        with self._lock:
+            cached = self._whitelists.get(config_file)
+            if file_key is not None and cached is not None \
+                    and cached[0] == file_key:
+                return cached[1]
+
+            # Avoid circular imports!  pylint: disable=import-outside-toplevel
+            from speedwagon.config import plugins as plugin_config
+
+            whitelist = frozenset(
+                plugin_config.get_whitelisted_plugins_from_config_file(
+                    find_config_file_strategy=lambda: config_file
+                )
+            )
+            if file_key is not None:
+                self._whitelists[config_file] = (file_key, whitelist)
+            return whitelist
+
+    def plugin_manager(self, config_file: str) -> PluginManager:
+        """Get a plugin manager with the plugins enabled in a config file."""
+        whitelist = self.whitelist(config_file)
+        with self._lock:
+            plugin_manager = self._plugin_managers.get(whitelist)
+            if plugin_manager is None:
+                plugin_manager = speedwagon.plugins.get_plugin_manager(
+                    functools.partial(
+                        speedwagon.plugins.register_whitelisted_plugins,
+                        get_whitelist_strategy=lambda: set(whitelist),
+                    )
+                )
+                self._plugin_managers[whitelist] = plugin_manager
+            return plugin_manager
+
+    def workflows(self, config_file: str) -> Dict[str, Type[Workflow]]:
+        """Get the workflows of the plugins enabled in a config file."""
+        whitelist = self.whitelist(config_file)
+        with self._lock:
+            workflows = self._workflows.get(whitelist)
+            if workflows is None:
+                workflows = _registered_workflows(
+                    self.plugin_manager(config_file)
+                )
+                self._workflows[whitelist] = workflows
+            return dict(workflows)
+
+    def invalidate(self) -> None:
+        """Forget everything loaded, so it is loaded again when needed."""
+        with self._lock:
+            self._whitelists.clear()
+            self._plugin_managers.clear()
+            self._workflows.clear()
+
+
+_workflow_registry = WorkflowRegistry()
+
+
+def get_workflow_registry() -> WorkflowRegistry:
+    """Get the workflow registry shared by the process."""
+    return _workflow_registry
+
+
+def invalidate_workflow_registry() -> None:
+    """Load plugins again the next time workflows are located.
+
+    Call this after the plugin settings have been changed.
+    """
+    _workflow_registry.invalidate()
+
+
+def _registered_workflows(
+    plugin_manager: PluginManager,
+) -> Dict[str, Type[Workflow]]:
+    return {
+        workflow_name: workflow
+        for plugin_workflows in plugin_manager.hook.registered_workflows()
+        for workflow_name, workflow in plugin_workflows.items()
+    }
+
 
 class FindAllWorkflowsPluggyStrategy(AbsWorkflowFinder):
     def __init__(
         self,
         config_file: Optional[str] = None,
         plugin_manager: Optional[PluginManager] = None,
+        registry: Optional[WorkflowRegistry] = None,
     ) -> None:
         super().__init__()
         self.config_file = config_file or StandardConfigFileLocator(
             config_directory_prefix=common.DEFAULT_CONFIG_DIRECTORY_NAME
         ).get_config_file()
-        self.plugin_manager: PluginManager = (
-            plugin_manager or self.get_plugin_manager()
-        )
+        self.registry = registry or get_workflow_registry()
+        self._plugin_manager = plugin_manager
 
-    def get_plugin_manager(self) -> PluginManager:
+    @property
+    def plugin_manager(self) -> PluginManager:
+        """Plugin manager used to locate workflows."""
+        if self._plugin_manager is None:
+            return self.get_plugin_manager()
+        return self._plugin_manager
 
-        def get_whitelist_with_config_file():
-            # Avoid circular imports!  pylint: disable=import-outside-toplevel
-            from speedwagon.config import (
-                plugins as plugin_config
-            )
-            return plugin_config.get_whitelisted_plugins_from_config_file(
-                find_config_file_strategy=lambda: self.config_file
-            )
+    @plugin_manager.setter
+    def plugin_manager(self, value: PluginManager) -> None:
+        self._plugin_manager = value
 
-        register_strategy =\
-            functools.partial(
-                speedwagon.plugins.register_whitelisted_plugins,
-                get_whitelist_strategy=get_whitelist_with_config_file
-            )
-        return speedwagon.plugins.get_plugin_manager(register_strategy)
+    def get_plugin_manager(self) -> PluginManager:
+        return self.registry.plugin_manager(self.config_file)
 
     def locate(self) -> Dict[str, Type[Workflow]]:
-        registered_workflows = self.plugin_manager.hook.registered_workflows()
-        return {
-            workflow_name: workflow
-            for plugin_workflows in registered_workflows
-            for workflow_name, workflow in plugin_workflows.items()
-        }
+        if self._plugin_manager is None:
+            return self.registry.workflows(self.config_file)
+        return _registered_workflows(self._plugin_manager)
 
 
 def available_workflows(
@@ -0,0 +1,399 @@
+"""Storage for the results of a running job.
+
+A job can produce far more results than comfortably fit in memory. A result
+store keeps them in the order they were added and lets them be read back as
+many times as needed, either from memory or from a temporary file on disk.
+"""
+
+from __future__ import annotations
+
+import abc
+import array
+import collections.abc
+import io
+import itertools
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import typing
+import warnings
+import weakref
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+__all__ = [
+    "AbsResultStore",
+    "InMemoryResultStore",
+    "SQLiteResultStore",
+    "AppendOnlyFileResultStore",
+    "SpillingResultStore",
+]
+
+DEFAULT_SPILL_THRESHOLD = 10_000
+
+ITERATION_BATCH_SIZE = 256
+
+
+class AbsResultStore(collections.abc.Sequence, abc.ABC):
+    """Ordered, append-only storage for task results.
+
+    Stores are read-only sequences to the code consuming them, so they can
+    be passed to :py:meth:`speedwagon.Workflow.generate_report` and
+    :py:meth:`speedwagon.Workflow.completion_task` in place of a list.
+    """
+
+    @abc.abstractmethod
+    def append(self, result: Any) -> None:
+        """Add a result to the end of the store."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove every result from the store."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the store.
+
+        By default, this method is a no-op unless overridden.
+        """
+
+    def __enter__(self) -> AbsResultStore:
+        """Use the store as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Release the store's resources."""
+        self.close()
+
+    @abc.abstractmethod
+    def _get_item(self, index: int) -> Any:
+        """Get a single result by its position, already range checked."""
+
+    @typing.overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """Get a result, or a list of results for a slice."""
+        if isinstance(index, slice):
+            return [
+                self._get_item(i) for i in range(*index.indices(len(self)))
+            ]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("result store index out of range")
+        return self._get_item(index)
+
+
+class InMemoryResultStore(AbsResultStore):
+    """Keep results in a list."""
+
+    def __init__(self) -> None:
+        """Create a new in-memory result store."""
+        self._results: List[Any] = []
+
+    def append(self, result: Any) -> None:
+        """Add a result to the end of the store."""
+        self._results.append(result)
+
+    def clear(self) -> None:
+        """Remove every result from the store."""
+        self._results.clear()
+
+    def _get_item(self, index: int) -> Any:
+        return self._results[index]
+
+    def __len__(self) -> int:
+        """Get the number of results in the store."""
+        return len(self._results)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the results in the order they were added."""
+        return iter(self._results)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class SQLiteResultStore(AbsResultStore):
+    """Keep results pickled in a temporary SQLite database.
+
+    The database file is deleted when the store is closed or garbage
+    collected.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """Create a new SQLite result store.
+
+        Args:
+            directory: Where to create the database file. Defaults to the
+                system's temporary directory.
+        """
+        file_handle, self.path = tempfile.mkstemp(
+            prefix="speedwagon_results_", suffix=".sqlite", dir=directory
+        )
+        os.close(file_handle)
+        self._lock = threading.Lock()
+        self._length = 0
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=OFF")
+        self._connection.execute("PRAGMA synchronous=OFF")
+        self._connection.execute(
+            "CREATE TABLE results (id INTEGER PRIMARY KEY, data BLOB)"
+        )
+        self._finalizer = weakref.finalize(
+            self, self._release, self._connection, self.path
+        )
+
+    @staticmethod
+    def _release(connection: sqlite3.Connection, path: str) -> None:
+        connection.close()
+        _remove_file(path)
+
+    def append(self, result: Any) -> None:
+        """Add a result to the end of the store."""
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO results (id, data) VALUES (?, ?)",
+                (self._length, data),
+            )
+            self._length += 1
+
+    def clear(self) -> None:
+        """Remove every result from the store."""
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._length = 0
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        self._finalizer()
+
+    def _get_item(self, index: int) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM results WHERE id = ?", (index,)
+            ).fetchone()
+        return pickle.loads(row[0])
+
+    def __len__(self) -> int:
+        """Get the number of results in the store."""
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the results in the order they were added."""
+        position = 0
+        while True:
+            with self._lock:
+                end = min(position + ITERATION_BATCH_SIZE, self._length)
+                rows = self._connection.execute(
+                    "SELECT data FROM results WHERE id >= ? AND id < ? "
+                    "ORDER BY id",
+                    (position, end),
+                ).fetchall()
+            if not rows:
+                return
+            position += len(rows)
+            for (data,) in rows:
+                yield pickle.loads(data)
+
+
+class AppendOnlyFileResultStore(AbsResultStore):
+    """Keep results pickled, one after another, in a temporary file.
+
+    Only the file offset of each result is kept in memory. The file is
+    deleted when the store is closed or garbage collected.
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """Create a new append-only file result store.
+
+        Args:
+            directory: Where to create the file. Defaults to the system's
+                temporary directory.
+        """
+        self._lock = threading.Lock()
+        self._file: io.BufferedRandom = typing.cast(
+            io.BufferedRandom,
+            tempfile.TemporaryFile(
+                prefix="speedwagon_results_", dir=directory
+            ),
+        )
+        self._offsets = array.array("q")
+        self._finalizer = weakref.finalize(self, self._file.close)
+
+    def append(self, result: Any) -> None:
+        """Add a result to the end of the store."""
+        with self._lock:
+            offset = self._file.seek(0, io.SEEK_END)
+            try:
+                pickle.dump(
+                    result, self._file, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            except BaseException:
+                # Drop anything partially written so the file only ever
+                # holds complete results.
+                self._file.seek(offset)
+                self._file.truncate()
+                raise
+            self._offsets.append(offset)
+
+    def clear(self) -> None:
+        """Remove every result from the store."""
+        with self._lock:
+            self._file.seek(0)
+            self._file.truncate()
+            self._offsets = array.array("q")
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        self._finalizer()
+
+    def _get_item(self, index: int) -> Any:
+        with self._lock:
+            self._file.seek(self._offsets[index])
+            return pickle.load(self._file)
+
+    def __len__(self) -> int:
+        """Get the number of results in the store."""
+        return len(self._offsets)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the results in the order they were added."""
+        position = 0
+        while True:
+            with self._lock:
+                end = min(position + ITERATION_BATCH_SIZE, len(self._offsets))
+                if position >= end:
+                    return
+                self._file.seek(self._offsets[position])
+                batch = [pickle.load(self._file) for _ in range(position, end)]
+            position = end
+            yield from batch
+
+
+class SpillingResultStore(AbsResultStore):
+    """Keep results in memory until there are too many, then move to disk.
+
+    Once the number of results reaches the threshold, every result is moved
+    into a store created by ``spill_store_factory`` and any further results
+    are added there.
+
+    Spilling requires results to be picklable. If a result cannot be
+    pickled, a :py:class:`RuntimeWarning` is issued and every result is
+    kept in memory from then on.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_SPILL_THRESHOLD,
+        spill_store_factory: Callable[
+            [], AbsResultStore
+        ] = AppendOnlyFileResultStore,
+    ) -> None:
+        """Create a new spilling result store.
+
+        Args:
+            threshold: Number of results kept in memory before spilling.
+            spill_store_factory: Creates the store to spill results into.
+        """
+        self.threshold = threshold
+        self.spill_store_factory = spill_store_factory
+        self._store: AbsResultStore = InMemoryResultStore()
+        self._spilling_disabled = False
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the results have been moved out of memory."""
+        return not isinstance(self._store, InMemoryResultStore)
+
+    def append(self, result: Any) -> None:
+        """Add a result to the end of the store."""
+        try:
+            if (
+                not self.spilled
+                and not self._spilling_disabled
+                and len(self._store) >= self.threshold
+            ):
+                self._spill()
+            self._store.append(result)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            if not self.spilled:
+                raise
+            self._return_to_memory(str(error))
+            self._store.append(result)
+
+    def _spill(self) -> None:
+        spill_store = self.spill_store_factory()
+        try:
+            for existing in self._store:
+                spill_store.append(existing)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            spill_store.close()
+            self._keep_in_memory(str(error))
+            return
+        self._store = spill_store
+
+    def _return_to_memory(self, reason: str) -> None:
+        in_memory = InMemoryResultStore()
+        for existing in self._store:
+            in_memory.append(existing)
+        self._store.close()
+        self._store = in_memory
+        self._keep_in_memory(reason)
+
+    def _keep_in_memory(self, reason: str) -> None:
+        self._spilling_disabled = True
+        warnings.warn(
+            f"Unable to move results to disk ({reason}). Keeping every "
+            f"result in memory instead.",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+
+    def clear(self) -> None:
+        """Remove every result from the store."""
+        self._store.close()
+        self._store = InMemoryResultStore()
+        self._spilling_disabled = False
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        self.clear()
+
+    def _get_item(self, index: int) -> Any:
+        return self._store[index]
+
+    def __len__(self) -> int:
+        """Get the number of results in the store."""
+        return len(self._store)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the results in the order they were added."""
+        position = 0
+        store = self._store
+        results = iter(store)
+        while True:
+            if store is not self._store:
+                # Spilled while iterating, continue from the new store.
+                store = self._store
+                results = itertools.islice(store, position, None)
+            try:
+                result = next(results)
+            except StopIteration:
+                if store is self._store:
+                    return
+                continue
+            position += 1
+            yield result
@@ -2,27 +2,40 @@
 from __future__ import annotations
 
 import abc
+import collections
+import collections.abc
+import concurrent.futures
 import contextlib
 import dataclasses
 import enum
 
 import logging
+import math
+import operator
 import os
+import pickle
 import queue
+import shutil
 import sys
 import tempfile
 import threading
+import time
 import traceback
 import typing
 import warnings
 from types import TracebackType
 from typing import List, Any, Dict, Optional, Type, TypeVar, Mapping, Callable
 import functools
+import itertools
 
 import speedwagon.config
 from speedwagon.config import StandardConfigFileLocator
 from speedwagon.config.common import DEFAULT_CONFIG_DIRECTORY_NAME
+import speedwagon.checkpoint
 import speedwagon.exceptions
+import speedwagon.job
+import speedwagon.tasks
+from speedwagon.result_store import AbsResultStore, SpillingResultStore
 from speedwagon import runner
 
 _T = TypeVar("_T", bound=Mapping[str, object])
@@ -31,9 +44,10 @@ if typing.TYPE_CHECKING:
     from speedwagon.job import AbsWorkflow, Workflow
     from speedwagon.config import SettingsData
     from speedwagon.config.config import AbsSettingLocator
-    import speedwagon.tasks
 
 __all__ = [
+    "InProcessSubtaskExecutor",
+    "ProcessPoolSubtaskExecutor",
     "RunRunner",
     "TaskDispatcher",
     "TaskScheduler",
@@ -44,6 +58,17 @@ module_logger = logging.getLogger(__name__)
 
 USER_ABORTED_MESSAGE = "User Aborted"
 
+STOP_DISPATCHING = object()
+"""Sentinel placed on a job queue to tell a task dispatcher to stop."""
+
+DEFAULT_METADATA_PREFETCH = 64
+"""Default number of task metadata items read ahead from an iterator."""
+
+FINISHED_TASK_STATUSES = (
+    speedwagon.tasks.tasks.TaskStatus.SUCCESS,
+    speedwagon.tasks.tasks.TaskStatus.FAILED,
+)
+
 
 class AbsEvents(abc.ABC):
     @abc.abstractmethod
@@ -132,6 +157,219 @@ class RunRunner:
         self._strategy.run(tool, options, logger, completion_callback)
 
 
+def collect_finished_results(
+    pending: typing.Deque[speedwagon.tasks.tasks.BaseTask],
+    results: typing.Union[
+        List[speedwagon.tasks.Result[Any, Any]], AbsResultStore
+    ],
+    wait: bool = False,
+    on_finished: Optional[
+        Callable[[speedwagon.tasks.tasks.BaseTask], None]
+    ] = None,
+) -> None:
+    """Move results of finished tasks into results, keeping task order.
+
+    Tasks are only removed from the front of pending, so results are added
+    in the order the tasks were created even if they finished out of order.
+
+    Args:
+        pending: Tasks that have been handed off to be run, oldest first.
+        results: List or result store to append the task results to.
+        wait: Collect all pending tasks, regardless of status. Use this once
+            all pending tasks are known to be complete.
+        on_finished: Called with each task as it is removed from pending.
+    """
+    while pending:
+        if not wait and pending[0].status not in FINISHED_TASK_STATUSES:
+            break
+        task = pending.popleft()
+        if on_finished is not None:
+            on_finished(task)
+        if task.task_result:
+            results.append(task.task_result)
+
+
+class WorkingDirectoryTracker:
+    """Remove task working directories as soon as they are no longer used.
+
+    Every subtask created by the same task builder shares a task working
+    directory, which holds the working directories of the subtasks. Once
+    every subtask added for a task has finished, the directories that the
+    subtasks created are removed, instead of waiting for the whole job to
+    finish. Directories that already existed are left alone.
+    """
+
+    def __init__(self) -> None:
+        """Create a new tracker with no working directories."""
+        self._unfinished: typing.Counter[str] = collections.Counter()
+        self._created: Dict[str, typing.Set[str]] = {}
+        self.removed = 0
+
+    def add(self, task: speedwagon.tasks.tasks.AbsSubtask) -> None:
+        """Count a subtask that uses its task's working directory."""
+        working_directory = getattr(task, "task_working_dir", "")
+        if working_directory:
+            self._unfinished[working_directory] += 1
+
+    def finished(self, task: speedwagon.tasks.tasks.AbsSubtask) -> None:
+        """Count a subtask as finished, removing unused directories."""
+        working_directory = getattr(task, "task_working_dir", "")
+        if working_directory not in self._unfinished:
+            return
+        created = getattr(task, "created_working_dir", None)
+        if created:
+            self._created.setdefault(working_directory, set()).add(
+                self._owned_directory(working_directory, created)
+            )
+        self._unfinished[working_directory] -= 1
+        if self._unfinished[working_directory] > 0:
+            return
+        del self._unfinished[working_directory]
+        for directory in sorted(self._created.pop(working_directory, ())):
+            if os.path.isdir(directory):
+                shutil.rmtree(directory, ignore_errors=True)
+                self.removed += 1
+
+    @staticmethod
+    def _owned_directory(working_directory: str, created: str) -> str:
+        # A subtask that also had to create the job's working directory
+        # only owns the task working directory inside of it.
+        working_directory = os.path.abspath(working_directory)
+        created = os.path.abspath(created)
+        if os.path.commonpath([working_directory, created]) == created:
+            return working_directory
+        return created
+
+
+def dependencies_finished(task: speedwagon.tasks.tasks.AbsSubtask) -> bool:
+    """Check if every subtask that a subtask depends on has finished.
+
+    Subtasks that cannot have dependencies are always ready.
+    """
+    return bool(getattr(task, "dependencies_finished", True))
+
+
+def release_ready_tasks(
+    blocked: List[speedwagon.tasks.tasks.BaseTask],
+) -> typing.Generator[
+    speedwagon.tasks.tasks.BaseTask,
+    None,
+    List[speedwagon.tasks.tasks.BaseTask],
+]:
+    """Yield blocked subtasks whose dependencies have finished.
+
+    Returns:
+        The subtasks that are still blocked, in their original order.
+    """
+    still_blocked = []
+    for task in blocked:
+        if dependencies_finished(task):
+            yield task
+        else:
+            still_blocked.append(task)
+    return still_blocked
+
+
+def estimate_total_tasks(
+    subtasks_created: int, entries_used: int, expected_entries: int
+) -> int:
+    """Estimate the total number of subtasks a job will create.
+
+    The number of subtasks for the task metadata entries not used yet is
+    assumed to be the average of the entries used so far.
+
+    Args:
+        subtasks_created: Number of subtasks created so far.
+        entries_used: Number of task metadata entries used so far.
+        expected_entries: Total number of task metadata entries expected, or
+            0 if unknown.
+    """
+    remaining_entries = expected_entries - entries_used
+    if remaining_entries <= 0 or entries_used == 0:
+        return subtasks_created
+    return subtasks_created + round(
+        remaining_entries * subtasks_created / entries_used
+    )
+
+
+_PREFETCH_END = object()
+
+
+class PrefetchIterator(typing.Iterator[Any]):
+    """Pull items from an iterator on a background thread.
+
+    At most ``window`` items are read ahead of the consumer, so slow sources
+    such as directory walks overlap with the work being done on their items
+    without being loaded into memory all at once. Exceptions raised by the
+    source are raised again by :py:meth:`__next__`.
+    """
+
+    def __init__(
+        self, source: typing.Iterable[Any], window: int, poll: float = 0.1
+    ) -> None:
+        """Start reading from source.
+
+        Args:
+            source: Iterable to read items from.
+            window: Maximum number of items to read ahead.
+            poll: How often, in seconds, a producer blocked on a full window
+                checks if the consumer has closed the iterator.
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, not {window}")
+        self._source = source
+        self._poll = poll
+        self._buffer: "queue.Queue[typing.Tuple[Any, Any]]" = queue.Queue(
+            maxsize=window
+        )
+        self._closed = threading.Event()
+        self._finished = False
+        self._thread = threading.Thread(
+            name="task_metadata_prefetch", target=self._produce, daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: Any, error: Optional[BaseException]) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._buffer.put((item, error), timeout=self._poll)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            for item in self._source:
+                if not self._put(item, None):
+                    return
+        except BaseException as error:  # pylint: disable=broad-except
+            self._put(_PREFETCH_END, error)
+            return
+        self._put(_PREFETCH_END, None)
+
+    def __length_hint__(self) -> int:
+        """Get the length hint of the source, if it has one."""
+        return operator.length_hint(self._source)
+
+    def __next__(self) -> Any:
+        """Get the next item from the source."""
+        if self._finished:
+            raise StopIteration
+        item, error = self._buffer.get()
+        if item is _PREFETCH_END:
+            self._finished = True
+            if error is not None:
+                raise error
+            raise StopIteration
+        return item
+
+    def close(self) -> None:
+        """Stop reading from the source."""
+        self._finished = True
+        self._closed.set()
+
+
 class TaskGenerator:
     def __init__(
         self,
@@ -139,28 +377,75 @@ class TaskGenerator:
         options: typing.Mapping[str, Any],
         working_directory: str,
         caller: typing.Optional["TaskScheduler"] = None,
+        streaming: bool = False,
+        metadata_prefetch: int = DEFAULT_METADATA_PREFETCH,
+        result_store_factory: Callable[
+            [], AbsResultStore
+        ] = SpillingResultStore,
+        clean_working_directories: bool = False,
     ) -> None:
+        """Create a new task generator.
+
+        Args:
+            workflow: Workflow to generate tasks for.
+            options: User options for the workflow.
+            working_directory: Path used for temporary task data.
+            caller: Scheduler that runs the tasks.
+            streaming: Yield main subtasks as soon as they are created
+                instead of creating every subtask first. In this mode,
+                ``total_task`` starts as an estimate, based on the length of
+                the task metadata when it is known, and becomes exact once
+                all task metadata has been used. This is always done when
+                the workflow's discover_task_metadata returns an iterator.
+            metadata_prefetch: Number of task metadata items read ahead, on
+                a separate thread, when discover_task_metadata returns an
+                iterator. Set to 0 to read them on the calling thread.
+            result_store_factory: Creates the store that holds the results
+                of the main tasks until they are passed to the workflow's
+                completion_task.
+            clean_working_directories: Remove the working directories
+                created for each main task as soon as all of its subtasks
+                have finished. Only use this for workflows whose results do
+                not refer to files left there.
+        """
         self.workflow = workflow
         self.options = options
         self.working_directory = working_directory
         self.current_task: typing.Optional[int] = None
         self.total_task: typing.Optional[int] = None
         self.caller = caller
+        self.streaming = streaming
+        self.metadata_prefetch = metadata_prefetch
+        self.result_store_factory = result_store_factory
+        self.working_directories: Optional[WorkingDirectoryTracker] = (
+            WorkingDirectoryTracker() if clean_working_directories else None
+        )
 
     def generate_report(
-        self, results: List[speedwagon.tasks.Result]
+        self, results: typing.Sequence[speedwagon.tasks.Result]
     ) -> typing.Optional[str]:
         return self.workflow.generate_report(results, **self.options)
 
+    def wait_for_pending_tasks(self) -> None:
+        """Block until every task yielded so far has finished running."""
+        if self.caller is not None:
+            self.caller.wait_for_pending_tasks()
+
     def tasks(self) -> typing.Iterable[speedwagon.tasks.tasks.BaseTask]:
         pretask_results: List[speedwagon.tasks.Result[Any, Any]] = []
 
-        results = []
+        results = self.result_store_factory()
 
-        for pre_task in self.get_pre_tasks(self.working_directory):
+        pending: typing.Deque[speedwagon.tasks.tasks.BaseTask] = (
+            collections.deque()
+        )
+        for pre_task in self.order_by_dependencies(
+            self.get_pre_tasks(self.working_directory)
+        ):
             yield pre_task
-            if pre_task.task_result:
-                pretask_results.append(pre_task.task_result)
+            pending.append(pre_task)
+        self.wait_for_pending_tasks()
+        collect_finished_results(pending, pretask_results, wait=True)
 
         if self.caller is not None:
             additional_data = self.caller.request_more_info(
@@ -170,20 +455,71 @@ class TaskGenerator:
             warnings.warn("No way to request info from user", stacklevel=2)
             additional_data = {}
 
-        for task in self.get_main_tasks(
-            self.working_directory,
-            pretask_results=pretask_results,
-            additional_data=additional_data,
+        for task in self.order_by_dependencies(
+            self.get_main_tasks(
+                self.working_directory,
+                pretask_results=pretask_results,
+                additional_data=additional_data,
+            )
         ):
             yield task
-            if task.task_result:
-                results.append(task.task_result)
+            pending.append(task)
+            collect_finished_results(
+                pending, results, on_finished=self._main_task_finished
+            )
+        self.wait_for_pending_tasks()
+        collect_finished_results(
+            pending, results, wait=True, on_finished=self._main_task_finished
+        )
 
-        yield from self.get_post_tasks(
-            working_directory=self.working_directory,
-            results=results,
+        yield from self.order_by_dependencies(
+            self.get_post_tasks(
+                working_directory=self.working_directory,
+                results=results,
+            )
         )
 
+    def _main_task_finished(
+        self, task: speedwagon.tasks.tasks.BaseTask
+    ) -> None:
+        if self.working_directories is not None:
+            self.working_directories.finished(task)
+
+    def order_by_dependencies(
+        self, tasks: typing.Iterable[speedwagon.tasks.tasks.BaseTask]
+    ) -> typing.Iterable[speedwagon.tasks.tasks.BaseTask]:
+        """Hold back subtasks until the subtasks they depend on have finished.
+
+        Subtasks without unfinished dependencies are yielded straight away,
+        so they are not kept waiting behind the subtasks that are held
+        back. Held back subtasks are yielded, in the order they were
+        created, as soon as their dependencies have finished.
+
+        Raises:
+            RuntimeError: If the dependencies of a subtask can never finish,
+                for example, because they were never added to the job.
+        """
+        blocked: List[speedwagon.tasks.tasks.BaseTask] = []
+        for task in tasks:
+            if blocked:
+                blocked = yield from release_ready_tasks(blocked)
+            if dependencies_finished(task):
+                yield task
+            else:
+                blocked.append(task)
+
+        while blocked:
+            still_blocked = yield from release_ready_tasks(blocked)
+            if len(still_blocked) == len(blocked):
+                self.wait_for_pending_tasks()
+                still_blocked = yield from release_ready_tasks(blocked)
+                if len(still_blocked) == len(blocked):
+                    raise RuntimeError(
+                        f"{len(blocked)} subtask(s) depend on subtasks that "
+                        f"can never finish"
+                    )
+            blocked = still_blocked
+
     def get_pre_tasks(
         self, working_directory: str
     ) -> typing.Iterable[speedwagon.tasks.tasks.BaseTask]:
@@ -209,16 +545,31 @@ class TaskGenerator:
             )
             or []
         )
+        if isinstance(metadata_tasks, collections.abc.Iterator):
+            if self.metadata_prefetch > 0:
+                metadata_tasks = PrefetchIterator(
+                    metadata_tasks, window=self.metadata_prefetch
+                )
+            try:
+                yield from self._stream_main_tasks(
+                    working_directory, metadata_tasks
+                )
+            finally:
+                if isinstance(metadata_tasks, PrefetchIterator):
+                    metadata_tasks.close()
+            return
+
+        if self.streaming:
+            yield from self._stream_main_tasks(
+                working_directory, metadata_tasks
+            )
+            return
 
         subtasks_generated = []
         for task_metadata in metadata_tasks:
-            task_builder = speedwagon.tasks.TaskBuilder(
-                speedwagon.tasks.MultiStageTaskBuilder(working_directory),
-                working_directory,
+            subtasks_generated += self._build_main_subtasks(
+                working_directory, task_metadata
             )
-            self.workflow.create_new_task(task_builder, task_metadata)
-            subtasks = task_builder.build_task()
-            subtasks_generated += subtasks.main_subtasks
 
         self.current_task = 0
         self.total_task = len(subtasks_generated)
@@ -226,10 +577,50 @@ class TaskGenerator:
             self.current_task += 1
             yield task
 
+    def _build_main_subtasks(
+        self, working_directory: str, task_metadata: Mapping[str, object]
+    ) -> List[speedwagon.tasks.tasks.BaseTask]:
+        task_builder = speedwagon.tasks.TaskBuilder(
+            speedwagon.tasks.MultiStageTaskBuilder(working_directory),
+            working_directory,
+        )
+        self.workflow.create_new_task(task_builder, task_metadata)
+        subtasks = task_builder.build_task().main_subtasks
+        if self.working_directories is not None:
+            # Counted before any are run, so the directory is not removed
+            # while subtasks held back by their dependencies still need it.
+            for subtask in subtasks:
+                self.working_directories.add(subtask)
+        return subtasks
+
+    def _stream_main_tasks(
+        self,
+        working_directory: str,
+        metadata_tasks: typing.Iterable[Mapping[str, object]],
+    ) -> typing.Iterable[speedwagon.tasks.tasks.BaseTask]:
+        expected_entries = operator.length_hint(metadata_tasks)
+        entries_used = 0
+        subtasks_created = 0
+        self.current_task = 0
+        self.total_task = expected_entries or None
+        for task_metadata in metadata_tasks:
+            subtasks = self._build_main_subtasks(
+                working_directory, task_metadata
+            )
+            entries_used += 1
+            subtasks_created += len(subtasks)
+            self.total_task = estimate_total_tasks(
+                subtasks_created, entries_used, expected_entries
+            )
+            for task in subtasks:
+                self.current_task += 1
+                yield task
+        self.total_task = subtasks_created
+
     def get_post_tasks(
         self,
         working_directory: str,
-        results: typing.List[speedwagon.tasks.Result],
+        results: typing.Sequence[speedwagon.tasks.Result],
     ) -> typing.Iterable[speedwagon.tasks.tasks.BaseTask]:
         task_builder = speedwagon.tasks.TaskBuilder(
             speedwagon.tasks.MultiStageTaskBuilder(working_directory),
@@ -242,6 +633,118 @@ class TaskGenerator:
         yield from task_builder.build_task().main_subtasks
 
 
+class AbsSubtaskExecutor(contextlib.AbstractContextManager, abc.ABC):
+    """Strategy for how a task dispatcher runs a single subtask."""
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback_: Optional[TracebackType],
+    ) -> None:
+        """Release any resources held by the executor."""
+
+    @abc.abstractmethod
+    def exec(self, task: speedwagon.tasks.tasks.AbsSubtask) -> None:
+        """Execute the subtask and update it with the outcome."""
+
+
+class InProcessSubtaskExecutor(AbsSubtaskExecutor):
+    """Run subtasks on the calling thread."""
+
+    def exec(self, task: speedwagon.tasks.tasks.AbsSubtask) -> None:
+        """Execute the subtask directly."""
+        task.exec()
+
+
+class ProcessPoolSubtaskExecutor(AbsSubtaskExecutor):
+    """Run subtasks in a pool of worker processes.
+
+    This is for CPU-bound subtasks that would otherwise be serialized by the
+    GIL. Each subtask is pickled, executed in a worker process and the
+    resulting state, including its results, is copied back onto the original
+    subtask object. Messages logged by the subtask are replayed through its
+    ``log`` method once it finishes.
+
+    Subtasks that cannot be pickled, such as ones defined inside a function
+    or holding open file handles, are run in-process instead and a
+    :py:class:`RuntimeWarning` is issued.
+
+    Use with a :py:class:`TaskScheduler` that has more than one worker so
+    that several subtasks are sent to the pool at the same time.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """Create a new process pool executor.
+
+        Args:
+            max_workers: Number of worker processes. Defaults to the number
+                of processors on the machine.
+        """
+        super().__init__()
+        self.max_workers = max_workers
+        self._pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ProcessPoolSubtaskExecutor":
+        """Start the process pool."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback_: Optional[TracebackType],
+    ) -> None:
+        """Shut down the process pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+
+    def _get_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self._pool
+
+    @staticmethod
+    def _run_in_process(
+        task: speedwagon.tasks.tasks.AbsSubtask, reason: str
+    ) -> None:
+        warnings.warn(
+            f"Unable to run {task.__class__.__name__} in a separate process "
+            f"({reason}). Running it in-process instead.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        task.exec()
+
+    def exec(self, task: speedwagon.tasks.tasks.AbsSubtask) -> None:
+        """Execute the subtask in a worker process."""
+        try:
+            data = speedwagon.tasks.tasks.serialize_subtask(task)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            self._run_in_process(task, str(error))
+            return
+
+        outcome = (
+            self._get_pool()
+            .submit(speedwagon.tasks.tasks.run_serialized_subtask, data)
+            .result()
+        )
+        if outcome is None:
+            self._run_in_process(task, "it could not be loaded by the worker")
+            return
+
+        attributes, messages = outcome
+        task.__dict__.update(attributes)
+        for message in messages:
+            task.log(message)
+
+
 class AbsTaskDispatcherState(abc.ABC):
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
@@ -290,30 +793,59 @@ class TaskDispatcherRunning(AbsTaskDispatcherState):
     def run_thread(self) -> None:
         logger = logging.getLogger(__name__)
 
-        logger.debug("Starting processing thread")
-        self.parent.thread = threading.Thread(
-            name="processing_thread",
-            target=self.processing_process,
-            kwargs={
-                "stop_event": self.parent.signals["stop"],
-                "job_finished_event": self.parent.signals["finished"],
-            },
+        logger.debug(
+            "Starting %d processing thread(s)", self.parent.workers
         )
-        self.parent.thread.start()
+        threads = []
+        for worker_number in range(self.parent.workers):
+            threads.append(
+                threading.Thread(
+                    name=(
+                        "processing_thread"
+                        if self.parent.workers == 1
+                        else f"processing_thread_{worker_number}"
+                    ),
+                    target=self.processing_process,
+                    kwargs={
+                        "stop_event": self.parent.signals["stop"],
+                        "job_finished_event": self.parent.signals["finished"],
+                    },
+                )
+            )
+        self.parent.threads = threads
+        self.parent.workers_running = len(threads)
+        for thread in threads:
+            thread.start()
 
     def processing_process(
         self, stop_event: threading.Event, job_finished_event: threading.Event
     ) -> None:
+        """Run tasks from the job queue until told to stop.
+
+        The thread blocks on the queue while it is empty, so an idle
+        dispatcher does not use any CPU. Stopping is done by placing
+        :py:data:`STOP_DISPATCHING` on the queue, which is processed after
+        any tasks that are already waiting.
+
+        Any exception raised by a task is stored in the dispatcher's
+        ``errors`` attribute so that the scheduler can re-raise it.
+        """
         logger = self.parent.logger
+        worker_name = threading.current_thread().name
         logger.debug("Processing thread is available")
 
-        while not stop_event.is_set():
-            if self.parent.job_queue.empty():
-                continue
+        while True:
+            item = self.parent.job_queue.get()
+            if item is STOP_DISPATCHING:
+                self.parent.job_queue.task_done()
+                logger.debug(
+                    "Processing thread received stop signal. Stop event "
+                    "set: %s",
+                    stop_event.is_set()
+                )
+                break
 
-            task = typing.cast(
-                speedwagon.tasks.Subtask, self.parent.job_queue.get()
-            )
+            task = typing.cast(speedwagon.tasks.Subtask, item)
 
             task_description = task.task_description()
             if task_description is not None:
@@ -326,17 +858,31 @@ class TaskDispatcherRunning(AbsTaskDispatcherState):
             )
 
             self.parent.current_task = task
+            self.parent.current_tasks[worker_name] = task
             task.log = lambda message: logger.info(msg=message)
-            task.exec()
-            logger.debug("Threaded worker completed task: [%s]", task.name)
+            try:
+                self.parent.executor.exec(task)
+                logger.debug(
+                    "Threaded worker completed task: [%s]", task.name
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                logger.debug(
+                    "Threaded worker failed task: [%s]",
+                    task.name,
+                    exc_info=True
+                )
+                self.parent.errors.append(error)
+            finally:
+                self.parent.current_tasks[worker_name] = None
+                self.parent.job_queue.task_done()
 
-            self.parent.job_queue.task_done()
-        job_finished_event.set()
+        with self.parent.lock:
+            self.parent.workers_running -= 1
+            if self.parent.workers_running <= 0:
+                job_finished_event.set()
 
     def active(self) -> bool:
-        if self.parent.thread is None:
-            return False
-        return self.parent.thread.is_alive()
+        return any(thread.is_alive() for thread in self.parent.threads)
 
     def stop(self) -> None:
         state = TaskDispatcherStopping(self.parent)
@@ -352,16 +898,18 @@ class TaskDispatcherStopping(AbsTaskDispatcherState):
 
     def halt_dispatching(self) -> None:
         self.parent.signals["stop"].set()
-        if self.parent.thread is not None:
+        if self.parent.threads:
             self.parent.logger.debug("Processing thread is stopping")
-            self.parent.thread.join()
+            for thread in self.parent.threads:
+                if thread.is_alive():
+                    self.parent.job_queue.put(STOP_DISPATCHING)
+            for thread in self.parent.threads:
+                thread.join()
         self.parent.logger.debug("Processing thread has stopped")
         self.parent.current_state = TaskDispatcherIdle(self.parent)
 
     def active(self) -> bool:
-        if self.parent.thread is None:
-            return False
-        return self.parent.thread.is_alive()
+        return any(thread.is_alive() for thread in self.parent.threads)
 
     def stop(self) -> None:
         self.parent.logger.warning("Processing thread is currently stopping")
@@ -379,19 +927,48 @@ class TaskDispatcher:
         self,
         job_queue: queue.Queue,
         logger: typing.Optional[logging.Logger] = None,
+        workers: int = 1,
+        executor: Optional[AbsSubtaskExecutor] = None,
     ) -> None:
-        """Create a new task dispatcher object."""
+        """Create a new task dispatcher object.
+
+        Args:
+            job_queue: Queue that subtasks are read from.
+            logger: Logger used by the worker threads.
+            workers: Number of threads used to run subtasks concurrently.
+            executor: How each subtask is run. Defaults to running it on the
+                worker thread.
+        """
         super().__init__()
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, not {workers}")
         self.job_queue = job_queue
+        self.workers = workers
+        self.executor: AbsSubtaskExecutor = (
+            executor or InProcessSubtaskExecutor()
+        )
         self.signals: typing.Mapping[str, threading.Event] = {
             "stop": threading.Event(),
             "finished": threading.Event(),
         }
-        self.thread: typing.Optional[threading.Thread] = None
+        self.threads: List[threading.Thread] = []
+        self.workers_running = 0
+        self.lock = threading.Lock()
         self.current_task: Optional[speedwagon.tasks.Subtask] = None
+        self.current_tasks: Dict[str, Optional[speedwagon.tasks.Subtask]] = {}
+        self.errors: List[BaseException] = []
         self.logger = logger or logging.getLogger(__name__)
         self.current_state: AbsTaskDispatcherState = TaskDispatcherIdle(self)
 
+    @property
+    def thread(self) -> Optional[threading.Thread]:
+        """Get the first processing thread, if any."""
+        return self.threads[0] if self.threads else None
+
+    @thread.setter
+    def thread(self, value: Optional[threading.Thread]) -> None:
+        self.threads = [] if value is None else [value]
+
     @property
     def active(self) -> bool:
         """Get if currently active."""
@@ -417,7 +994,7 @@ class TaskDispatcher:
 
 class AbsTaskGeneratorStrategy(abc.ABC):
     @abc.abstractmethod
-    def results(self) -> List[Any]:
+    def results(self) -> typing.Sequence[Any]:
         """Results of the job."""
 
     @abc.abstractmethod
@@ -438,16 +1015,28 @@ class AbsTaskGeneratorStrategy(abc.ABC):
         self,
         workflow: Workflow,
         options: typing.Mapping[str, Any],
-        results: List[Any],
+        results: typing.Sequence[Any],
     ) -> Optional[str]:
         """Generate Text Report."""
 
 
 class TaskGeneratorStrategy(AbsTaskGeneratorStrategy):
-    def __init__(self) -> None:
-        self._results: List[Any] = []
+    def __init__(
+        self,
+        streaming: bool = False,
+        metadata_prefetch: int = DEFAULT_METADATA_PREFETCH,
+        result_store_factory: Callable[
+            [], AbsResultStore
+        ] = SpillingResultStore,
+        clean_working_directories: bool = False,
+    ) -> None:
+        self.result_store_factory = result_store_factory
+        self._results = result_store_factory()
+        self.streaming = streaming
+        self.metadata_prefetch = metadata_prefetch
+        self.clean_working_directories = clean_working_directories
 
-    def results(self) -> List[Any]:
+    def results(self) -> AbsResultStore:
         return self._results
 
     def clear_results(self) -> None:
@@ -457,7 +1046,7 @@ class TaskGeneratorStrategy(AbsTaskGeneratorStrategy):
         self,
         workflow: Workflow,
         options: typing.Mapping[str, Any],
-        results: List[Any],
+        results: typing.Sequence[Any],
     ) -> Optional[str]:
         return workflow.generate_report(results, user_args=options)
 
@@ -473,23 +1062,99 @@ class TaskGeneratorStrategy(AbsTaskGeneratorStrategy):
             working_directory=task_scheduler.working_directory,
             options=options,
             caller=task_scheduler,
+            streaming=self.streaming,
+            metadata_prefetch=self.metadata_prefetch,
+            result_store_factory=self.result_store_factory,
+            clean_working_directories=self.clean_working_directories,
         )
+        pending: typing.Deque[speedwagon.tasks.tasks.BaseTask] = (
+            collections.deque()
+        )
+        journal = task_scheduler.journal
+        journal_keys: Dict[int, str] = {}
+
+        def record_in_journal(task: speedwagon.tasks.tasks.BaseTask) -> None:
+            key = journal_keys.pop(id(task), None)
+            if (
+                journal is not None
+                and key is not None
+                and task.status == speedwagon.tasks.tasks.TaskStatus.SUCCESS
+            ):
+                journal.record(task, key)
+
+        on_finished = record_in_journal if journal is not None else None
         for task in task_generator.tasks():
             task_scheduler.total_tasks = task_generator.total_task
-            yield task
-            if task.task_result:
-                self._results.append(task.task_result)
+            restored = False
+            key = (
+                speedwagon.checkpoint.subtask_key(task)
+                if journal is not None
+                else None
+            )
+            if journal is not None and key is not None:
+                restored = journal.restore(task, key)
+                if not restored:
+                    journal_keys[id(task)] = key
+            if not restored:
+                yield task
+            pending.append(task)
+            collect_finished_results(
+                pending, self._results, on_finished=on_finished
+            )
             task_scheduler.current_task_progress = task_generator.current_task
+        task_scheduler.wait_for_pending_tasks()
+        collect_finished_results(
+            pending, self._results, wait=True, on_finished=on_finished
+        )
+
+
+class TaskQueue(queue.Queue):
+    """Job queue that signals every time a task is marked as done.
+
+    :py:attr:`task_finished` shares the queue's lock so that
+    ``unfinished_tasks`` can be checked and waited on without missing a
+    notification.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Create a new task queue."""
+        super().__init__(maxsize)
+        self.task_finished = threading.Condition(self.mutex)
+
+    def task_done(self) -> None:
+        """Mark a task as done and wake up anything waiting on it."""
+        super().task_done()
+        with self.task_finished:
+            self.task_finished.notify_all()
 
 
 class TaskScheduler:
     """Task scheduler."""
 
-    def __init__(self, working_directory: str) -> None:
-        """Create a new task scheduler."""
+    def __init__(self, working_directory: str, workers: int = 1) -> None:
+        """Create a new task scheduler.
+
+        Args:
+            working_directory: Path used for temporary task data.
+            workers: Number of subtasks that can run at the same time when
+                using :py:meth:`run`. Subtasks run on threads, so this helps
+                with I/O-bound tasks.
+
+        Set :py:attr:`journal` to record subtasks as they finish and to skip
+        the subtasks already recorded by an earlier, interrupted run.
+
+        While waiting on subtasks, the reporter is refreshed at most
+        ``reporter_refresh_rate`` times per second and cancellation is
+        checked at least every ``cancel_check_interval`` seconds.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, not {workers}")
         self.task_generator_strategy: AbsTaskGeneratorStrategy = (
             TaskGeneratorStrategy()
         )
+        self.workers = workers
+        self.subtask_executor: AbsSubtaskExecutor = InProcessSubtaskExecutor()
+        self.journal: Optional[speedwagon.checkpoint.SubtaskJournal] = None
 
         self.logger = logging.getLogger(__name__)
         self.working_directory = working_directory
@@ -499,7 +1164,14 @@ class TaskScheduler:
 
         self.current_task_progress: typing.Optional[int] = None
         self.total_tasks: typing.Optional[int] = None
-        self._task_queue: "queue.Queue" = queue.Queue(maxsize=1)
+        self._task_queue = TaskQueue(maxsize=workers)
+        self.reporter_refresh_rate = 10.0
+        self.cancel_check_interval = 0.1
+        self._last_reporter_refresh = -math.inf
+        self._task_dispatcher: Optional[TaskDispatcher] = None
+        self._active_reporter: Optional[
+            speedwagon.frontend.reporter.RunnerDisplay
+        ] = None
 
         self._request_more_info: typing.Callable[
             [
@@ -570,25 +1242,76 @@ class TaskScheduler:
     ) -> None:
         """Add job tasks to queue.
 
-        This blocks until the task finished is called.
+        This blocks until the task finished is called. Up to ``workers``
+        subtasks are allowed to be queued or running at the same time.
         """
-        for subtask in self.iter_tasks(workflow, options):
-            self._task_queue.put(subtask)
-            self.logger.debug("Task added to queue: [%s]", subtask.name)
-
-            while self._task_queue.unfinished_tasks > 0:
-                if reporter is not None:
-                    reporter.refresh()
-                    if reporter.user_canceled is True:
-                        raise speedwagon.exceptions.JobCancelled(
-                            USER_ABORTED_MESSAGE, expected=True
-                        )
+        self._active_reporter = reporter
+        try:
+            for subtask in self.iter_tasks(workflow, options):
+                self._task_queue.put(subtask)
+                self.logger.debug("Task added to queue: [%s]", subtask.name)
+                self._wait_for_unfinished_tasks(limit=self.workers - 1)
+        finally:
+            self._active_reporter = None
+
+    def wait_for_pending_tasks(self) -> None:
+        """Block until all tasks added to the queue have finished."""
+        self._wait_for_unfinished_tasks(limit=0)
+
+    def _wait_for_unfinished_tasks(self, limit: int) -> None:
+        task_finished = self._task_queue.task_finished
+        while True:
+            self._raise_task_errors()
+            timeout = self._update_reporter()
+            with task_finished:
+                if self._task_queue.unfinished_tasks <= limit:
+                    break
+                task_finished.wait(timeout)
+        self._raise_task_errors()
+
+    def _update_reporter(self) -> float:
+        """Refresh the reporter if it is due and check for cancellation.
+
+        Returns:
+            Number of seconds until the reporter needs attention again.
+        """
+        reporter = self._active_reporter
+        if reporter is None:
+            return self.cancel_check_interval
+
+        now = time.monotonic()
+        refresh_interval = 1 / self.reporter_refresh_rate
+        if now - self._last_reporter_refresh >= refresh_interval:
+            reporter.refresh()
+            self._last_reporter_refresh = now
+
+        if reporter.user_canceled is True:
+            raise speedwagon.exceptions.JobCancelled(
+                USER_ABORTED_MESSAGE, expected=True
+            )
+        return max(
+            0.0,
+            min(
+                self.cancel_check_interval,
+                self._last_reporter_refresh + refresh_interval - now,
+            )
+        )
+
+    def _raise_task_errors(self) -> None:
+        if self._task_dispatcher is not None and self._task_dispatcher.errors:
+            raise self._task_dispatcher.errors[0]
 
     def run(self, workflow: Workflow, options: Dict[str, Any]) -> None:
         """Run workflow with given options."""
-        task_dispatcher = TaskDispatcher(self._task_queue, self.logger)
+        task_dispatcher = TaskDispatcher(
+            self._task_queue,
+            self.logger,
+            workers=self.workers,
+            executor=self.subtask_executor,
+        )
+        self._task_dispatcher = task_dispatcher
         try:
-            with task_dispatcher as task_runner:
+            with self.subtask_executor, task_dispatcher as task_runner:
                 if self.reporter is not None:
                     self.reporter.task_runner = task_runner
                     self.reporter.task_scheduler = self
@@ -603,6 +1326,7 @@ class TaskScheduler:
                     self.run_workflow_jobs(workflow, options)
         finally:
             self._task_queue.join()
+            self._task_dispatcher = None
 
 
 class TerminateConsumerThread(Exception):
@@ -627,6 +1351,32 @@ class JobManagerLiaison:
     events: "ThreadedEvents"
 
 
+class JobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+
+
+@dataclasses.dataclass
+class JobRecord:
+    """Information about a job submitted to a job manager.
+
+    Attributes:
+        job_id: Unique id of the job within its job manager.
+        workflow_name: Name of the workflow being run.
+        status: Whether the job is queued, running or finished.
+        result: How the job finished, None until it has.
+        working_directory: Temporary directory used only by this job. It
+            is removed once the job finishes.
+    """
+
+    job_id: int
+    workflow_name: str
+    status: JobStatus = JobStatus.QUEUED
+    result: Optional[JobSuccess] = None
+    working_directory: Optional[str] = None
+
+
 class AbsJobManager2(contextlib.AbstractContextManager):
     def __init__(self) -> None:
         super().__init__()
@@ -639,7 +1389,7 @@ class AbsJobManager2(contextlib.AbstractContextManager):
         app: speedwagon.startup.AbsStarter,
         liaison: JobManagerLiaison,
         options: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Optional[JobRecord]:
         """Submit job to worker."""
 
 
@@ -667,12 +1417,33 @@ class Run(TaskScheduler):
 
 
 class BackgroundJobManager(AbsJobManager2):
-    def __init__(self) -> None:
+    def __init__(self, max_concurrent_jobs: int = 1) -> None:
+        """Create a new job manager.
+
+        Args:
+            max_concurrent_jobs: Number of jobs that are allowed to run at
+                the same time. Jobs submitted while this many are running
+                are queued and started in the order they were submitted.
+        """
         super().__init__()
+        if max_concurrent_jobs < 1:
+            raise ValueError(
+                f"max_concurrent_jobs must be at least 1, "
+                f"not {max_concurrent_jobs}"
+            )
         self.logger = logging.getLogger(__name__)
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.working_directory_root: Optional[str] = None
         self._exec: Optional[BaseException] = None
         self.valid_workflows = None
-        self._background_thread: Optional[threading.Thread] = None
+        self._job_ids = itertools.count(1)
+        self._jobs: Dict[int, JobRecord] = {}
+        self._pending_jobs: typing.Deque[
+            typing.Tuple[JobRecord, Dict[str, Any]]
+        ] = collections.deque()
+        self._job_threads: Dict[int, threading.Thread] = {}
+        self._finished_threads: List[threading.Thread] = []
+        self._jobs_changed = threading.Condition()
         self.request_more_info: Callable[
             [
                 Workflow[Any],
@@ -685,27 +1456,82 @@ class BackgroundJobManager(AbsJobManager2):
         self.global_settings: Optional[SettingsData] = None
         self.config_file_location_strategy: AbsSettingLocator =\
             StandardConfigFileLocator(DEFAULT_CONFIG_DIRECTORY_NAME)
+        self.journal_factory: Optional[
+            Callable[
+                [str, Mapping[str, Any]],
+                speedwagon.checkpoint.SubtaskJournal,
+            ]
+        ] = None
+        """Opens a journal for each job, from its workflow name and options.
+
+        Jobs that finish successfully delete their journal. Otherwise, it is
+        kept so that the job can be resumed.
+        """
 
     def __enter__(self) -> "BackgroundJobManager":
         self._exec = None
-        self._background_thread = None
         return self
 
+    def jobs(self, status: Optional[JobStatus] = None) -> List[JobRecord]:
+        """Get the jobs submitted to this manager, in submission order.
+
+        Args:
+            status: Only include jobs with this status.
+        """
+        with self._jobs_changed:
+            return [
+                job
+                for job in self._jobs.values()
+                if status is None or job.status == status
+            ]
+
+    def queued_jobs(self) -> List[JobRecord]:
+        """Get jobs waiting for a free slot to run."""
+        return self.jobs(JobStatus.QUEUED)
+
+    def running_jobs(self) -> List[JobRecord]:
+        """Get jobs that are currently running."""
+        return self.jobs(JobStatus.RUNNING)
+
+    def finished_jobs(self) -> List[JobRecord]:
+        """Get jobs that have finished running."""
+        return self.jobs(JobStatus.FINISHED)
+
+    def _job_finished(
+        self,
+        liaison: JobManagerLiaison,
+        job: Optional[JobRecord],
+        result: JobSuccess,
+    ) -> None:
+        if job is not None:
+            job.result = result
+        liaison.callbacks.finished(result)
+
     def run_job_on_thread(
         self,
         workflow_name: str,
         options: Dict[str, Dict[str, Any]],
         liaison: JobManagerLiaison,
+        job: Optional[JobRecord] = None,
+        request_more_info: Optional[Callable[..., Any]] = None,
+        config_locator: Optional[AbsSettingLocator] = None,
     ) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        config_locator = config_locator or self.config_file_location_strategy
+        request_more_info = request_more_info or self.request_more_info
+        with tempfile.TemporaryDirectory(
+            prefix=(
+                f"speedwagon_job{job.job_id}_" if job is not None else None
+            ),
+            dir=self.working_directory_root,
+        ) as tmp_dir:
+            if job is not None:
+                job.working_directory = tmp_dir
+            journal: Optional[speedwagon.checkpoint.SubtaskJournal] = None
             try:
                 task_scheduler = Run(tmp_dir)
                 job_lookup_strategy =\
                     speedwagon.job.FindAllWorkflowsPluggyStrategy(
-                        config_file=(
-                            self.config_file_location_strategy
-                            .get_config_file()
-                        )
+                        config_file=config_locator.get_config_file()
                     )
 
                 task_scheduler.workflow_loader_strategy =\
@@ -713,7 +1539,7 @@ class BackgroundJobManager(AbsJobManager2):
                         job_lookup_strategy
                     )
                 task_scheduler.request_more_info = functools.partial(
-                    self.request_more_info
+                    request_more_info
                 )
 
                 # Makes testing easier
@@ -725,12 +1551,17 @@ class BackgroundJobManager(AbsJobManager2):
                 )
                 options_backend = speedwagon.config.YAMLWorkflowConfigBackend()
                 backend_yaml = os.path.join(
-                    self.config_file_location_strategy.get_app_data_dir(),
+                    config_locator.get_app_data_dir(),
                     speedwagon.config.WORKFLOWS_SETTINGS_YML_FILE_NAME,
                 )
                 options_backend.workflow = workflow
                 options_backend.yaml_file = backend_yaml
                 workflow.set_options_backend(options_backend)
+                if self.journal_factory is not None:
+                    journal = self.journal_factory(
+                        workflow_name, options["options"]
+                    )
+                    task_scheduler.journal = journal
                 liaison.events.started.wait()
 
                 for task in task_scheduler.iter_tasks(
@@ -755,14 +1586,18 @@ class BackgroundJobManager(AbsJobManager2):
                         current=task_scheduler.current_task_progress,
                         total=task_scheduler.total_tasks,
                     )
-                liaison.callbacks.finished(JobSuccess.SUCCESS)
+                else:
+                    if journal is not None:
+                        journal.discard()
+                        journal = None
+                self._job_finished(liaison, job, JobSuccess.SUCCESS)
 
             except speedwagon.exceptions.JobCancelled as job_cancelled:
-                liaison.callbacks.finished(JobSuccess.ABORTED)
+                self._job_finished(liaison, job, JobSuccess.ABORTED)
                 logging.debug("Job canceled: %s", job_cancelled)
 
             except speedwagon.exceptions.MissingConfiguration as config_error:
-                liaison.callbacks.finished(JobSuccess.ABORTED)
+                self._job_finished(liaison, job, JobSuccess.ABORTED)
                 if config_error.key and config_error.workflow:
                     logging.debug(
                         'Unable to start job with missing configurations: '
@@ -784,12 +1619,15 @@ class BackgroundJobManager(AbsJobManager2):
 
                 self._exec = exception_thrown
 
-                liaison.callbacks.finished(JobSuccess.FAILURE)
+                self._job_finished(liaison, job, JobSuccess.FAILURE)
                 liaison.callbacks.error(
                     exc=exception_thrown, traceback_string=traceback_info
                 )
 
                 raise
+            finally:
+                if journal is not None:
+                    journal.close()
             liaison.events.done()
 
     def __exit__(
@@ -804,10 +1642,45 @@ class BackgroundJobManager(AbsJobManager2):
         logging.debug("thread threw no exceptions")
 
     def clean_up_thread(self) -> None:
-        if self._background_thread is not None:
+        """Block until every submitted job, including queued ones, is done."""
+        with self._jobs_changed:
+            self._jobs_changed.wait_for(
+                lambda: not self._pending_jobs and not self._job_threads
+            )
+            finished_threads = self._finished_threads
+            self._finished_threads = []
+        for thread in finished_threads:
+            thread.join()
             logging.debug("Background thread joined")
-            self._background_thread.join()
-            self._background_thread = None
+
+    def _run_job(self, job: JobRecord, job_kwargs: Dict[str, Any]) -> None:
+        try:
+            self.run_job_on_thread(job=job, **job_kwargs)
+        finally:
+            with self._jobs_changed:
+                job.status = JobStatus.FINISHED
+                self._finished_threads.append(
+                    self._job_threads.pop(job.job_id)
+                )
+                logging.debug("Background thread for job %d done", job.job_id)
+                self._start_queued_jobs()
+                self._jobs_changed.notify_all()
+
+    def _start_queued_jobs(self) -> None:
+        # Must be called while holding self._jobs_changed
+        while (
+            self._pending_jobs
+            and len(self._job_threads) < self.max_concurrent_jobs
+        ):
+            job, job_kwargs = self._pending_jobs.popleft()
+            job.status = JobStatus.RUNNING
+            new_thread = threading.Thread(
+                name=f"speedwagon_job{job.job_id}",
+                target=self._run_job,
+                kwargs={"job": job, "job_kwargs": job_kwargs},
+            )
+            self._job_threads[job.job_id] = new_thread
+            new_thread.start()
 
     def submit_job(
         self,
@@ -815,25 +1688,37 @@ class BackgroundJobManager(AbsJobManager2):
         app: speedwagon.startup.AbsStarter,
         liaison: JobManagerLiaison,
         options: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        if (
-            self._background_thread is None
-            or self._background_thread.is_alive() is False
-        ):
-            new_thread = threading.Thread(
-                target=self.run_job_on_thread,
-                kwargs={
-                    "workflow_name": workflow_name,
-                    "liaison": liaison,
-                    "options": {
-                        "options": options,
-                        "global_settings": self.global_settings,
-                    },
-                },
-            )
-            new_thread.start()
-            self._background_thread = new_thread
-            liaison.callbacks.start()
+    ) -> JobRecord:
+        """Submit a job to be run in the background.
+
+        The job starts right away if fewer than ``max_concurrent_jobs`` are
+        running, otherwise it is queued.
+
+        Returns:
+            Record used to follow the status of the job.
+        """
+        job = JobRecord(
+            job_id=next(self._job_ids), workflow_name=workflow_name
+        )
+        job_kwargs: Dict[str, Any] = {
+            "workflow_name": workflow_name,
+            "liaison": liaison,
+            "options": {
+                "options": options,
+                "global_settings": self.global_settings,
+            },
+            "request_more_info": self.request_more_info,
+            "config_locator": self.config_file_location_strategy,
+        }
+        liaison.callbacks.start()
+        with self._jobs_changed:
+            self._jobs[job.job_id] = job
+            self._pending_jobs.append((job, job_kwargs))
+            self._start_queued_jobs()
+            if job.status == JobStatus.QUEUED:
+                liaison.callbacks.status("Waiting for other jobs to finish")
+            self._jobs_changed.notify_all()
+        return job
 
 
 class ThreadedEvents(AbsEvents):
@@ -866,6 +1751,7 @@ def simple_api_run_workflow(
     request_factory: Optional[
         speedwagon.frontend.interaction.UserRequestFactory
     ] = None,
+    journal: Optional[speedwagon.checkpoint.SubtaskJournal] = None,
 ) -> None:
     """Run a workflow and block until finished.
 
@@ -876,8 +1762,11 @@ def simple_api_run_workflow(
         workflow_options: dictionary of options
         logger: file stream handle for logging data
         request_factory: factory for generating the user input mid-job
+        journal: record finished subtasks here and skip the ones already
+            recorded. See :py:mod:`speedwagon.checkpoint`.
     """
     task_scheduler = speedwagon.runner_strategies.TaskScheduler(".")
+    task_scheduler.journal = journal
     log_handler = None
 
     if logger is None:
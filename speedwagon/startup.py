@@ -30,13 +30,13 @@ from typing import (
     Callable,
     Any,
     Collection,
-    TypeVar,
     Mapping,
     Union,
     Iterable,
     Sequence,
 )
 
+import speedwagon.checkpoint
 import speedwagon.job
 import speedwagon.config
 import speedwagon.info
@@ -54,6 +54,7 @@ from speedwagon import plugins
 
 if TYPE_CHECKING:
     import speedwagon.frontend.qtwidgets.gui_startup
+    from speedwagon.workflow_metadata import WorkflowType
     from speedwagon.config.common import SettingsData
     from speedwagon.config.config import (
         AbsSettingLocator,
@@ -65,9 +66,6 @@ __all__ = [
     "ApplicationLauncher",
 ]
 
-_T = TypeVar("_T", bound=Mapping[str, object])
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -77,9 +75,7 @@ def parse_args() -> argparse.ArgumentParser:
 
 
 class AbsTabFileReader(abc.ABC):  # pylint: disable=too-few-public-methods
-    def __init__(
-        self, all_workflows: Dict[str, Type[speedwagon.job.Workflow]]
-    ) -> None:
+    def __init__(self, all_workflows: Mapping[str, WorkflowType]) -> None:
         """Load all workflows supported.
 
         Args:
@@ -105,9 +101,7 @@ class AbsTabFileReader(abc.ABC):  # pylint: disable=too-few-public-methods
 class CustomTabsFileReader(AbsTabFileReader):
     """Reads the tab file data."""
 
-    def _load_workflow(
-        self, workflow_name: str
-    ) -> Type[speedwagon.job.Workflow[_T]]:
+    def _load_workflow(self, workflow_name: str) -> WorkflowType:
         workflow = self.all_workflows[workflow_name]
         if workflow.active is False:
             logger.warning("Loading workflow that is not active")
@@ -152,8 +146,8 @@ class CustomTabsFileReader(AbsTabFileReader):
 
     def gather_registered_workflows(
         self, workflow_names: Collection[str]
-    ) -> Dict[str, Type[speedwagon.job.Workflow[_T]]]:
-        new_tab_items: Dict[str, Type[speedwagon.job.Workflow[_T]]] = {}
+    ) -> Dict[str, WorkflowType]:
+        new_tab_items: Dict[str, WorkflowType] = {}
         for item_name in workflow_names:
             try:
                 if item_name not in self.all_workflows:
@@ -171,7 +165,7 @@ class CustomTabsFileReader(AbsTabFileReader):
 
 
 def get_custom_tabs(
-    all_workflows: Dict[str, Type[speedwagon.job.Workflow]],
+    all_workflows: Mapping[str, WorkflowType],
     yaml_file: str,
     reader_klass: Type[AbsTabFileReader] = CustomTabsFileReader,
 ) -> Iterator[Tuple[str, dict]]:
@@ -337,6 +331,10 @@ class RunCommand(SubCommand):
             startup_strategy = SingleWorkflowJSON()
 
         startup_strategy.global_settings = self.global_settings
+        startup_strategy.resume = "resume" in self.args and self.args.resume
+        startup_strategy.checkpoint = (
+            "checkpoint" in self.args and self.args.checkpoint
+        )
         startup_strategy.load(self.args.json)
         self._run_strategy(startup_strategy)
 
@@ -457,6 +455,8 @@ class SingleWorkflowJSON(AbsStarter):
         self.options: Optional[Dict[str, Any]] = None
         self.global_settings: Optional[SettingsData] = None
         self.workflow: Optional[speedwagon.job.Workflow] = None
+        self.resume = False
+        self.checkpoint = False
         self.config_files_locator: AbsSettingLocator = (
             StandardConfigFileLocator(
                 config_directory_prefix=DEFAULT_CONFIG_DIRECTORY_NAME
@@ -471,11 +471,28 @@ class SingleWorkflowJSON(AbsStarter):
         return speedwagon.config.StandardConfig(config_name)
 
     def run(self) -> int:
-        if self.workflow:
-            speedwagon.simple_api_run_workflow(
-                self.workflow,
-                self.options,
+        if self.workflow and not (self.resume or self.checkpoint):
+            speedwagon.simple_api_run_workflow(self.workflow, self.options)
+        elif self.workflow:
+            journal = speedwagon.checkpoint.open_job_journal(
+                os.path.join(
+                    self.config_files_locator.get_app_data_dir(),
+                    speedwagon.checkpoint.JOURNAL_DIRECTORY_NAME,
+                ),
+                self.workflow.name or "",
+                self.options or {},
+                resume=self.resume,
             )
+            try:
+                speedwagon.simple_api_run_workflow(
+                    self.workflow,
+                    self.options,
+                    journal=journal,
+                )
+            except BaseException:
+                journal.close()
+                raise
+            journal.discard()
         return 0
 
     def load(self, file_pointer: io.TextIOBase) -> None:
@@ -0,0 +1,397 @@
+"""Cache of file checksums that is kept between jobs.
+
+Checksums are stored in a SQLite database, by the path, device, inode,
+size and modification time of the file they were calculated from. A file
+that has not changed since it was last hashed is not read again. Files on
+filesystems that do not report inode numbers are never cached, and a
+cached checksum is only used for the path it was calculated from, in case
+the inode numbers of a filesystem are not stable.
+
+The cache is kept to a maximum number of checksums and a maximum number
+of bytes of database pages, evicting the least recently used first.
+
+Files modified moments before they are hashed are not cached, because a
+change made later within the same tick of the filesystem clock would not
+change their modification time.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from speedwagon.config.common import DEFAULT_CONFIG_DIRECTORY_NAME
+from speedwagon.config.config import StandardConfigFileLocator
+
+__all__ = [
+    "CacheStatistics",
+    "ChecksumCache",
+    "default_checksum_cache_path",
+    "open_checksum_cache",
+]
+
+CHECKSUM_CACHE_FILE_NAME = "checksum_cache.sqlite"
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+"""Number of checksums kept before the least recently used are evicted."""
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+"""Bytes of database pages in use before the least recently used checksums
+are evicted."""
+
+DEFAULT_MAX_AGE = 90 * 24 * 60 * 60
+"""Seconds a checksum is kept without being used."""
+
+RACY_WINDOW_NS = 2_000_000_000
+"""Files modified this recently, in nanoseconds, are not cached."""
+
+TOUCH_INTERVAL = 24 * 60 * 60
+"""Seconds between updates to when a cached checksum was last used."""
+
+SCHEMA_VERSION = 1
+"""Version of the cache's tables. Older caches are emptied when opened."""
+
+FileIdentity = Tuple[int, int, int, int]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class CacheStatistics:
+    """Number of files found in the cache and not found in the cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        """Get the statistics as text for a log message."""
+        return f"{self.hits} hit(s), {self.misses} miss(es)"
+
+
+def file_identity(file_path: str) -> FileIdentity:
+    """Get the device, inode, size and modification time of a file."""
+    stat_result = os.stat(file_path)
+    return (
+        stat_result.st_dev,
+        stat_result.st_ino,
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+    )
+
+
+def _normalize_path(file_path: str) -> str:
+    return os.path.normcase(os.path.abspath(file_path))
+
+
+class ChecksumCache:
+    """Checksums of files, by algorithm, stored in a SQLite database.
+
+    The cache can be shared by threads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: float = DEFAULT_MAX_AGE,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Open a checksum cache, creating it if it does not exist.
+
+        Args:
+            path: File path to the cache database.
+            max_entries: Number of checksums kept by :py:meth:`evict`.
+            max_age: Seconds a checksum is kept by :py:meth:`evict` without
+                being used.
+            max_bytes: Bytes of database pages kept in use by
+                :py:meth:`evict`.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.statistics = CacheStatistics()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        (schema_version,) = self._connection.execute(
+            "PRAGMA user_version"
+        ).fetchone()
+        if schema_version < SCHEMA_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS checksums")
+            self._connection.execute(
+                f"PRAGMA user_version = {SCHEMA_VERSION}"
+            )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS checksums ("
+            "device INTEGER, inode INTEGER, size INTEGER, mtime_ns INTEGER, "
+            "algorithm TEXT, hash_value TEXT, path TEXT, last_used REAL, "
+            "PRIMARY KEY (path, device, inode, size, mtime_ns, algorithm))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS checksums_last_used "
+            "ON checksums (last_used)"
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> ChecksumCache:
+        """Use the cache as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the cache database."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Get the number of checksums in the cache."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM checksums"
+            ).fetchone()[0]
+
+    def get(
+        self,
+        identity: FileIdentity,
+        algorithm: str,
+        file_path: Optional[str] = None,
+    ) -> Optional[str]:
+        """Get the cached checksum of a file.
+
+        Args:
+            identity: Identity of the file, from :py:func:`file_identity`.
+            algorithm: Name of the hash algorithm.
+            file_path: Path to the file. If given, a checksum cached for a
+                file at another path is not used.
+
+        Returns:
+            The hash value, or None if it is not in the cache.
+        """
+        now = time.time()
+        query = (
+            "SELECT rowid, hash_value, last_used FROM checksums WHERE "
+            "device = ? AND inode = ? AND size = ? AND mtime_ns = ? "
+            "AND algorithm = ?"
+        )
+        parameters: Tuple[object, ...] = (*identity, algorithm)
+        if file_path is not None:
+            query += " AND path = ?"
+            parameters += (_normalize_path(file_path),)
+        with self._lock:
+            row = self._connection.execute(query, parameters).fetchone()
+            if row is None:
+                return None
+            rowid, hash_value, last_used = row
+            if now - last_used > TOUCH_INTERVAL:
+                self._connection.execute(
+                    "UPDATE checksums SET last_used = ? WHERE rowid = ?",
+                    (now, rowid),
+                )
+                self._connection.commit()
+        return str(hash_value)
+
+    def put(
+        self,
+        identity: FileIdentity,
+        hash_values: Dict[str, str],
+        file_path: str = "",
+    ) -> None:
+        """Add the checksums of a file to the cache.
+
+        Args:
+            identity: Identity of the file, from :py:func:`file_identity`.
+            hash_values: Hash values, by algorithm name.
+            file_path: Path to the file, checked by :py:meth:`get`.
+        """
+        now = time.time()
+        if file_path:
+            file_path = _normalize_path(file_path)
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO checksums (device, inode, size, "
+                "mtime_ns, algorithm, hash_value, path, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (*identity, algorithm, hash_value, file_path, now)
+                    for algorithm, hash_value in hash_values.items()
+                ],
+            )
+            self._connection.commit()
+
+    def hash_file(
+        self,
+        file_path: str,
+        algorithms: Sequence[str],
+        calculate: Callable[[str, Sequence[str]], Dict[str, str]],
+        force: bool = False,
+        statistics: Optional[CacheStatistics] = None,
+    ) -> Dict[str, str]:
+        """Get the checksums of a file, calculating any not in the cache.
+
+        Args:
+            file_path: Path to a file.
+            algorithms: Names of the hash algorithms.
+            calculate: Calculates hash values of a file for the algorithms
+                given to it, returning them by algorithm name.
+            force: Calculate every hash value again, replacing those in the
+                cache.
+            statistics: Also count the hit or miss here, such as to report
+                on a single task.
+
+        Returns: Hash values as strings, by algorithm name.
+        """
+        identity = file_identity(file_path)
+        if not self._has_inode(identity):
+            with self._lock:
+                for counter in (self.statistics, statistics):
+                    if counter is not None:
+                        counter.misses += 1
+            return calculate(file_path, list(algorithms))
+        hash_values: Dict[str, str] = {}
+        if not force:
+            for algorithm in algorithms:
+                hash_value = self.get(identity, algorithm, file_path)
+                if hash_value is not None:
+                    hash_values[algorithm] = hash_value
+        missing = [
+            algorithm
+            for algorithm in algorithms
+            if algorithm not in hash_values
+        ]
+        with self._lock:
+            for counter in (self.statistics, statistics):
+                if counter is None:
+                    continue
+                if missing:
+                    counter.misses += 1
+                else:
+                    counter.hits += 1
+        if missing:
+            calculated = calculate(file_path, missing)
+            if self._cacheable(identity, file_identity(file_path)):
+                self.put(identity, calculated, file_path)
+            hash_values.update(calculated)
+        return {algorithm: hash_values[algorithm] for algorithm in algorithms}
+
+    @staticmethod
+    def _has_inode(identity: FileIdentity) -> bool:
+        # Some network and FUSE filesystems report 0 for every file, which
+        # would give unrelated files the same identity.
+        return identity[1] != 0
+
+    @staticmethod
+    def _cacheable(before: FileIdentity, after: FileIdentity) -> bool:
+        modified_ns = after[3]
+        return before == after and time.time_ns() - modified_ns > (
+            RACY_WINDOW_NS
+        )
+
+    def evict(self) -> int:
+        """Remove checksums that are too old or over the maximum size.
+
+        Checksums not used within max_age seconds are removed first, then
+        the least recently used are removed until at most max_entries are
+        left and the database pages in use take up at most max_bytes. Pages
+        freed this way are reused by later checksums.
+
+        Returns:
+            Number of checksums removed.
+        """
+        with self._lock:
+            removed = self._connection.execute(
+                "DELETE FROM checksums WHERE last_used < ?",
+                (time.time() - self.max_age,),
+            ).rowcount
+            removed += self._remove_least_recently_used(self.max_entries)
+            used_bytes = self._used_bytes()
+            while used_bytes > self.max_bytes:
+                (entries,) = self._connection.execute(
+                    "SELECT COUNT(*) FROM checksums"
+                ).fetchone()
+                if entries == 0:
+                    break
+                # Pages only partly emptied are not freed, so this can take
+                # a few rounds.
+                removed += self._remove_least_recently_used(
+                    min(entries * self.max_bytes // used_bytes, entries - 1)
+                )
+                used_bytes = self._used_bytes()
+            self._connection.commit()
+        return removed
+
+    def _remove_least_recently_used(self, keep: int) -> int:
+        return self._connection.execute(
+            "DELETE FROM checksums WHERE rowid IN (SELECT rowid FROM "
+            "checksums ORDER BY last_used DESC, rowid DESC "
+            "LIMIT -1 OFFSET ?)",
+            (keep,),
+        ).rowcount
+
+    def _used_bytes(self) -> int:
+        (page_count,) = self._connection.execute(
+            "PRAGMA page_count"
+        ).fetchone()
+        (free_pages,) = self._connection.execute(
+            "PRAGMA freelist_count"
+        ).fetchone()
+        (page_size,) = self._connection.execute(
+            "PRAGMA page_size"
+        ).fetchone()
+        return int((page_count - free_pages) * page_size)
+
+    def clear(self) -> None:
+        """Remove every checksum from the cache."""
+        with self._lock:
+            self._connection.execute("DELETE FROM checksums")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
+
+
+def default_checksum_cache_path() -> str:
+    """Get the path to the checksum cache in the app data directory."""
+    return os.path.join(
+        StandardConfigFileLocator(
+            DEFAULT_CONFIG_DIRECTORY_NAME
+        ).get_app_data_dir(),
+        CHECKSUM_CACHE_FILE_NAME,
+    )
+
+
+_open_caches: Dict[str, ChecksumCache] = {}
+_open_caches_lock = threading.Lock()
+
+
+def open_checksum_cache(path: Optional[str] = None) -> ChecksumCache:
+    """Get the checksum cache stored at a path.
+
+    Caches are opened once per process and shared after that. Old checksums
+    are evicted from a cache when it is opened.
+
+    Args:
+        path: File path to the cache database. Defaults to
+            :py:func:`default_checksum_cache_path`.
+    """
+    path = os.path.abspath(path or default_checksum_cache_path())
+    with _open_caches_lock:
+        cache = _open_caches.get(path)
+        if cache is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            cache = ChecksumCache(path)
+            removed = cache.evict()
+            if removed:
+                logger.debug(
+                    "Evicted %d checksum(s) from %s", removed, path
+                )
+            _open_caches[path] = cache
+        return cache
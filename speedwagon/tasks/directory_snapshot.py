@@ -0,0 +1,334 @@
+"""Index of directory trees that is kept between jobs.
+
+Listing a large tree, especially on a network share, can take minutes. A
+directory snapshot records the entries of every directory it lists, along
+with the directory's modification time. When the tree is walked again, a
+directory whose modification time has not changed is not listed again;
+its entries are read from the snapshot instead.
+
+A directory's modification time only changes when entries are added to it,
+removed from it or renamed. The sizes and modification times recorded for
+files are as they were when their directory was last listed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from speedwagon.config.common import DEFAULT_CONFIG_DIRECTORY_NAME
+from speedwagon.config.config import StandardConfigFileLocator
+
+__all__ = [
+    "DirectorySnapshot",
+    "SnapshotEntry",
+    "SnapshotStatistics",
+    "default_snapshot_index_path",
+    "open_directory_snapshot",
+]
+
+SNAPSHOT_INDEX_FILE_NAME = "directory_snapshots.sqlite"
+
+RACY_WINDOW_NS = 2_000_000_000
+"""Directories modified this recently, in nanoseconds, are listed again."""
+
+COMMIT_INTERVAL = 1000
+"""Directories listed between commits to the snapshot database."""
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotEntry(NamedTuple):
+    """An entry of a directory, as it was when the directory was listed."""
+
+    name: str
+    is_dir: bool
+    size: int
+    mtime_ns: int
+
+
+@dataclasses.dataclass
+class SnapshotStatistics:
+    """Number of directories listed and read from the snapshot."""
+
+    listed: int = 0
+    reused: int = 0
+
+    def __str__(self) -> str:
+        """Get the statistics as text for a log message."""
+        return (
+            f"{self.listed} directories listed, "
+            f"{self.reused} read from snapshot"
+        )
+
+
+def _list_directory(path: str) -> List[SnapshotEntry]:
+    entries = []
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                stat_result = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            entries.append(
+                SnapshotEntry(
+                    entry.name,
+                    is_dir,
+                    0 if is_dir else stat_result.st_size,
+                    stat_result.st_mtime_ns,
+                )
+            )
+    return entries
+
+
+class DirectorySnapshot:
+    """Entries of directory trees, stored in a SQLite database.
+
+    Symbolic links to directories are listed as files and are not followed.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open a snapshot index, creating it if it does not exist.
+
+        Args:
+            path: File path to the snapshot database.
+        """
+        self.path = path
+        self.statistics = SnapshotStatistics()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS directories "
+            "(id INTEGER PRIMARY KEY, path TEXT UNIQUE, mtime_ns INTEGER)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (directory_id INTEGER, "
+            "name TEXT, is_dir INTEGER, size INTEGER, mtime_ns INTEGER)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_directory_id "
+            "ON entries (directory_id)"
+        )
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def __enter__(self) -> DirectorySnapshot:
+        """Use the snapshot as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the snapshot database."""
+        self.close()
+
+    def _stored_entries(
+        self, path: str, mtime_ns: int
+    ) -> Optional[List[SnapshotEntry]]:
+        row = self._connection.execute(
+            "SELECT id, mtime_ns FROM directories WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None or row[1] != mtime_ns:
+            return None
+        return self._stored_entries_by_id(row[0])
+
+    def _stored_entries_by_id(self, directory_id: int) -> List[SnapshotEntry]:
+        return [
+            SnapshotEntry(name, bool(is_dir), size, mtime_ns)
+            for name, is_dir, size, mtime_ns in self._connection.execute(
+                "SELECT name, is_dir, size, mtime_ns FROM entries "
+                "WHERE directory_id = ?",
+                (directory_id,),
+            )
+        ]
+
+    def _forget_tree(self, path: str) -> None:
+        # Every path under path starts with path and a separator. Nothing
+        # else sorts between those and the same prefix with the separator's
+        # next character.
+        lower = path.rstrip(os.sep) + os.sep
+        upper = lower[:-1] + chr(ord(os.sep) + 1)
+        self._connection.execute(
+            "DELETE FROM entries WHERE directory_id IN (SELECT id FROM "
+            "directories WHERE path = ? OR (path >= ? AND path < ?))",
+            (path, lower, upper),
+        )
+        self._connection.execute(
+            "DELETE FROM directories "
+            "WHERE path = ? OR (path >= ? AND path < ?)",
+            (path, lower, upper),
+        )
+
+    def _store_entries(
+        self,
+        path: str,
+        mtime_ns: int,
+        entries: List[SnapshotEntry],
+        previous: Optional[List[SnapshotEntry]],
+    ) -> None:
+        if previous is not None:
+            current_directories = {
+                entry.name for entry in entries if entry.is_dir
+            }
+            for entry in previous:
+                if entry.is_dir and entry.name not in current_directories:
+                    self._forget_tree(os.path.join(path, entry.name))
+        if time.time_ns() - mtime_ns < RACY_WINDOW_NS:
+            # Could still change within the same tick of the filesystem's
+            # clock, so make sure it is listed again next time.
+            mtime_ns = -1
+        self._connection.execute(
+            "INSERT INTO directories (path, mtime_ns) VALUES (?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns",
+            (path, mtime_ns),
+        )
+        directory_id = self._connection.execute(
+            "SELECT id FROM directories WHERE path = ?", (path,)
+        ).fetchone()[0]
+        self._connection.execute(
+            "DELETE FROM entries WHERE directory_id = ?", (directory_id,)
+        )
+        self._connection.executemany(
+            "INSERT INTO entries "
+            "(directory_id, name, is_dir, size, mtime_ns) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(directory_id, *entry) for entry in entries],
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= COMMIT_INTERVAL:
+            self._commit()
+
+    def _commit(self) -> None:
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def entries(
+        self, path: str, statistics: Optional[SnapshotStatistics] = None
+    ) -> List[SnapshotEntry]:
+        """Get the entries of a directory.
+
+        The directory is only listed if it has been modified since it was
+        last listed.
+
+        Args:
+            path: Path to a directory.
+            statistics: Also count whether the directory was listed here.
+
+        Raises:
+            OSError: If the directory cannot be read.
+        """
+        key = os.path.abspath(path)
+        mtime_ns = os.stat(key).st_mtime_ns
+        with self._lock:
+            stored = self._stored_entries(key, mtime_ns)
+            if stored is not None:
+                for counter in (self.statistics, statistics):
+                    if counter is not None:
+                        counter.reused += 1
+                return stored
+        entries = _list_directory(key)
+        with self._lock:
+            previous = self._connection.execute(
+                "SELECT id FROM directories WHERE path = ?", (key,)
+            ).fetchone()
+            self._store_entries(
+                key,
+                mtime_ns,
+                entries,
+                (
+                    self._stored_entries_by_id(previous[0])
+                    if previous is not None
+                    else None
+                ),
+            )
+            for counter in (self.statistics, statistics):
+                if counter is not None:
+                    counter.listed += 1
+        return entries
+
+    def walk(
+        self, top: str, statistics: Optional[SnapshotStatistics] = None
+    ) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """Walk a directory tree, like :py:func:`os.walk`.
+
+        The tree is walked top down. Names removed from the list of
+        directory names are not walked into. Directories that cannot be
+        read are skipped.
+
+        Args:
+            top: Path to the top of the tree.
+            statistics: Also count the directories listed and read from the
+                snapshot here.
+
+        Yields:
+            Tuples of each directory path, the names of the directories in
+            it and the names of the other entries in it.
+        """
+        stack = [top]
+        try:
+            while stack:
+                directory = stack.pop()
+                try:
+                    entries = self.entries(directory, statistics)
+                except OSError as error:
+                    logger.debug("Unable to read %s: %s", directory, error)
+                    continue
+                dirnames = sorted(e.name for e in entries if e.is_dir)
+                filenames = sorted(e.name for e in entries if not e.is_dir)
+                yield directory, dirnames, filenames
+                stack.extend(
+                    os.path.join(directory, name)
+                    for name in reversed(dirnames)
+                )
+        finally:
+            with self._lock:
+                self._commit()
+
+    def close(self) -> None:
+        """Close the snapshot database."""
+        with self._lock:
+            self._commit()
+            self._connection.close()
+
+
+def default_snapshot_index_path() -> str:
+    """Get the path to the snapshot index in the app data directory."""
+    return os.path.join(
+        StandardConfigFileLocator(
+            DEFAULT_CONFIG_DIRECTORY_NAME
+        ).get_app_data_dir(),
+        SNAPSHOT_INDEX_FILE_NAME,
+    )
+
+
+_open_snapshots: Dict[str, DirectorySnapshot] = {}
+_open_snapshots_lock = threading.Lock()
+
+
+def open_directory_snapshot(
+    path: Optional[str] = None,
+) -> DirectorySnapshot:
+    """Get the directory snapshot index stored at a path.
+
+    Snapshot indexes are opened once per process and shared after that.
+
+    Args:
+        path: File path to the snapshot database. Defaults to
+            :py:func:`default_snapshot_index_path`.
+    """
+    path = os.path.abspath(path or default_snapshot_index_path())
+    with _open_snapshots_lock:
+        snapshot = _open_snapshots.get(path)
+        if snapshot is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            snapshot = DirectorySnapshot(path)
+            _open_snapshots[path] = snapshot
+        return snapshot
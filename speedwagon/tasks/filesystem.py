@@ -1,14 +1,32 @@
 """Tasks related to doing something with files on a file system."""
 
 import abc
+import collections
+import concurrent.futures
+import heapq
+import itertools
 import logging
 import os
+import typing
 import warnings
-from typing import Optional
+from typing import Callable, Iterable, List, Optional, Set
 
 import speedwagon.tasks.tasks
 logger = logging.getLogger(__name__)
-__all__ = ["delete_file", "delete_directory"]
+__all__ = [
+    "delete_file",
+    "delete_directory",
+    "delete_files",
+    "delete_directories",
+]
+
+REMOVAL_BATCH_SIZE = 256
+"""Paths removed by a worker thread before it reports back."""
+
+MAX_REPORTED_REMOVAL_ERRORS = 100
+"""Errors kept in the result of a bulk removal. The rest are only counted."""
+
+DEFAULT_REMOVAL_WORKERS = 8
 
 
 class DeleteFileSystemItem(speedwagon.tasks.Subtask[str]):
@@ -112,3 +130,232 @@ def delete_file(path: str, verbosity: int = logging.WARN) -> str:
     os.remove(path)
     func_logger.info(f"Deleted {path}")
     return path
+
+
+class BulkRemovalResult(typing.TypedDict):
+    """Summary of removing many items from a file system."""
+
+    removed: int
+    missing: int
+    failed: int
+    directories_pruned: int
+    errors: List[str]
+
+
+class _BatchOutcome(typing.NamedTuple):
+    removed: int
+    missing: int
+    errors: List[str]
+    parents: Set[str]
+
+
+def _remove_batch(
+    remove: Callable[[str], None], paths: List[str]
+) -> _BatchOutcome:
+    removed = 0
+    missing = 0
+    errors = []
+    parents = set()
+    for path in paths:
+        try:
+            remove(path)
+        except FileNotFoundError:
+            missing += 1
+            continue
+        except OSError as error:
+            errors.append(f"Unable to remove {path}: {error}")
+            continue
+        removed += 1
+        parents.add(os.path.dirname(os.path.abspath(path)))
+    return _BatchOutcome(removed, missing, errors, parents)
+
+
+def _depth(path: str) -> int:
+    return os.path.abspath(path).count(os.sep)
+
+
+def _is_below(path: str, top: str) -> bool:
+    try:
+        return os.path.commonpath([path, top]) == top and path != top
+    except ValueError:
+        # On different drives.
+        return False
+
+
+def _prune_empty_directories(
+    candidates: Iterable[str], top: str, func_logger: logging.Logger
+) -> int:
+    top = os.path.abspath(top)
+    # Deepest first, so a directory is only tried once its children have
+    # been.
+    heap = [
+        (-_depth(path), path)
+        for path in set(candidates)
+        if _is_below(path, top)
+    ]
+    heapq.heapify(heap)
+    tried: Set[str] = set()
+    pruned = 0
+    while heap:
+        _, path = heapq.heappop(heap)
+        if path in tried:
+            continue
+        tried.add(path)
+        try:
+            os.rmdir(path)
+        except OSError:
+            # Not empty, already gone or not removable.
+            continue
+        func_logger.debug(f"Deleted {path}")
+        pruned += 1
+        parent = os.path.dirname(path)
+        if _is_below(parent, top):
+            heapq.heappush(heap, (-_depth(parent), parent))
+    return pruned
+
+
+def _new_removal_result() -> BulkRemovalResult:
+    return {
+        "removed": 0,
+        "missing": 0,
+        "failed": 0,
+        "directories_pruned": 0,
+        "errors": [],
+    }
+
+
+def _remove_all(
+    paths: Iterable[str],
+    remove: Callable[[str], None],
+    max_workers: Optional[int],
+    func_logger: logging.Logger,
+    result: BulkRemovalResult,
+    parents: Set[str],
+) -> None:
+    """Remove paths in batches, adding the outcome to result and parents."""
+    max_workers = max_workers or DEFAULT_REMOVAL_WORKERS
+
+    def collect(outcome: _BatchOutcome) -> None:
+        result["removed"] += outcome.removed
+        result["missing"] += outcome.missing
+        result["failed"] += len(outcome.errors)
+        for error in outcome.errors:
+            func_logger.warning(error)
+        result["errors"].extend(
+            outcome.errors[
+                : MAX_REPORTED_REMOVAL_ERRORS - len(result["errors"])
+            ]
+        )
+        parents.update(outcome.parents)
+
+    pending: typing.Deque[
+        "concurrent.futures.Future[_BatchOutcome]"
+    ] = collections.deque()
+    path_iterator = iter(paths)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="remove"
+    ) as executor:
+        while True:
+            batch = list(itertools.islice(path_iterator, REMOVAL_BATCH_SIZE))
+            if not batch:
+                break
+            pending.append(executor.submit(_remove_batch, remove, batch))
+            if len(pending) >= max_workers * 2:
+                collect(pending.popleft().result())
+        while pending:
+            collect(pending.popleft().result())
+
+
+def _log_summary(
+    func_logger: logging.Logger, result: BulkRemovalResult
+) -> None:
+    func_logger.info(
+        f"Deleted {result['removed']} item(s), "
+        f"{result['directories_pruned']} empty directories pruned, "
+        f"{result['missing']} already missing, {result['failed']} failed"
+    )
+
+
+@speedwagon.tasks.workflow_task(description='Removing files')
+def delete_files(
+    paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    prune_empty_directories_in: Optional[str] = None,
+    verbosity: int = logging.WARN,
+) -> BulkRemovalResult:
+    """Create a task to remove many files.
+
+    Files are removed in batches on a pool of threads. Files that are
+    already missing are counted, not treated as errors. Other errors are
+    logged and counted, and do not stop the remaining files from being
+    removed. Use this instead of a :py:func:`delete_file` task per file
+    when there are many files.
+
+    Args:
+        paths: paths to files to remove. Use a list, so the task can be
+            sent to another process.
+        max_workers: Number of threads removing files.
+        prune_empty_directories_in: After removing the files, remove any
+            directories they were in that were left empty, bottom up, but
+            only below this directory.
+        verbosity: Log verbosity level.
+
+    Returns:
+        Summary of what was removed. Only the first
+        MAX_REPORTED_REMOVAL_ERRORS error messages are included.
+    """
+    func_logger = logger.getChild('delete_files')
+    func_logger.setLevel(verbosity)
+    result = _new_removal_result()
+    parents: Set[str] = set()
+    _remove_all(paths, os.remove, max_workers, func_logger, result, parents)
+    if prune_empty_directories_in is not None:
+        result["directories_pruned"] = _prune_empty_directories(
+            parents, prune_empty_directories_in, func_logger
+        )
+    _log_summary(func_logger, result)
+    return result
+
+
+@speedwagon.tasks.workflow_task(description='Removing directories')
+def delete_directories(
+    paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    prune_empty_directories_in: Optional[str] = None,
+    verbosity: int = logging.WARN,
+) -> BulkRemovalResult:
+    """Create a task to remove many empty directories.
+
+    Directories are removed deepest first, so a directory that only
+    contains other directories being removed is empty by the time it is
+    removed. Directories at the same depth are removed in batches on a pool
+    of threads. Errors are handled as by :py:func:`delete_files`.
+
+    Args:
+        paths: paths to directories to remove. Use a list, so the task can
+            be sent to another process.
+        max_workers: Number of threads removing directories.
+        prune_empty_directories_in: After removing the directories, remove
+            any directories they were in that were left empty, bottom up,
+            but only below this directory.
+        verbosity: Log verbosity level.
+
+    Returns:
+        Summary of what was removed.
+    """
+    func_logger = logger.getChild('delete_directories')
+    func_logger.setLevel(verbosity)
+    result = _new_removal_result()
+    parents: Set[str] = set()
+    for _, same_depth in itertools.groupby(
+        sorted(paths, key=_depth, reverse=True), key=_depth
+    ):
+        _remove_all(
+            same_depth, os.rmdir, max_workers, func_logger, result, parents
+        )
+    if prune_empty_directories_in is not None:
+        result["directories_pruned"] = _prune_empty_directories(
+            parents, prune_empty_directories_in, func_logger
+        )
+    _log_summary(func_logger, result)
+    return result
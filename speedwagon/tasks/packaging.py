@@ -5,26 +5,184 @@ Created on 9/8/2021 by Henry Borchers
 """
 
 import abc
-from typing import Optional
+import concurrent.futures
+import fnmatch
+import logging
+import os
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import speedwagon
+from speedwagon.tasks.directory_snapshot import (
+    SnapshotStatistics,
+    open_directory_snapshot,
+)
+
+DEFAULT_WALK_WORKERS = 16
+"""Directories listed at the same time by :py:func:`walk_directory_tree`.
+
+Listing a directory mostly waits on the filesystem, so this can be well
+above the number of CPUs, especially for network shares.
+"""
+
+_ScanResult = Tuple[List[os.DirEntry[str]], List[os.DirEntry[str]]]
+
+logger = logging.getLogger(__name__)
+
+
+def _scan_directory(
+    path: str,
+    file_patterns: Optional[Sequence[str]],
+    directory_filter: Optional[Callable[[os.DirEntry[str]], bool]],
+) -> _ScanResult:
+    files = []
+    directories = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if directory_filter is None or directory_filter(entry):
+                    directories.append(entry)
+            elif file_patterns is None or any(
+                fnmatch.fnmatch(entry.name, pattern)
+                for pattern in file_patterns
+            ):
+                files.append(entry)
+    return files, directories
+
+
+def walk_directory_tree(
+    top: str,
+    max_workers: Optional[int] = None,
+    max_depth: Optional[int] = None,
+    file_patterns: Optional[Sequence[str]] = None,
+    directory_filter: Optional[Callable[[os.DirEntry[str]], bool]] = None,
+    include_directories: bool = False,
+    onerror: Optional[Callable[[OSError], None]] = None,
+) -> Iterator[os.DirEntry[str]]:
+    """Walk a directory tree, listing many directories at the same time.
+
+    Directories are listed with :py:func:`os.scandir` on a pool of
+    threads, which hides the latency of each listing on network shares.
+    Entries are yielded as soon as their directory has been listed, so the
+    order is not predictable. Filtering is done by the threads listing the
+    directories, so entries that are filtered out are never yielded and
+    directories that are filtered out are never listed.
+
+    Symbolic links to directories are yielded as files and are not
+    followed.
+
+    .. code-block:: python
+
+        class FindTiffPackages(AbsFindPackageTask):
+            def find_packages(self, search_path):
+                return sorted(
+                    {
+                        os.path.dirname(entry.path)
+                        for entry in walk_directory_tree(
+                            search_path, file_patterns=["*.tif"]
+                        )
+                    }
+                )
+
+    Args:
+        top: Path to the top of the tree.
+        max_workers: Number of directories listed at the same time.
+            Defaults to DEFAULT_WALK_WORKERS.
+        max_depth: How many levels of directories below top to walk into.
+            With 0, only the entries of top are yielded. By default, there
+            is no limit.
+        file_patterns: Shell-style patterns, such as "*.tif". Only files
+            with names matching one of them are yielded. By default, every
+            file is yielded.
+        directory_filter: Called with each directory found. Directories it
+            returns False for are not yielded or walked into.
+        include_directories: Yield directories as well as files.
+        onerror: Called with the error of each directory that cannot be
+            listed. By default, those directories are skipped.
+
+    Yields:
+        :py:class:`os.DirEntry` of every file found, and every directory if
+        include_directories is True.
+    """
+    max_workers = max_workers or DEFAULT_WALK_WORKERS
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="walk"
+    ) as executor:
+        pending: Dict[concurrent.futures.Future[_ScanResult], int] = {
+            executor.submit(
+                _scan_directory, top, file_patterns, directory_filter
+            ): 0
+        }
+        try:
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    depth = pending.pop(future)
+                    try:
+                        files, directories = future.result()
+                    except OSError as error:
+                        logger.debug("Unable to list directory: %s", error)
+                        if onerror is not None:
+                            onerror(error)
+                        continue
+                    if max_depth is None or depth < max_depth:
+                        for directory in directories:
+                            pending[
+                                executor.submit(
+                                    _scan_directory,
+                                    directory.path,
+                                    file_patterns,
+                                    directory_filter,
+                                )
+                            ] = depth + 1
+                    yield from files
+                    if include_directories:
+                        yield from directories
+        finally:
+            for future in pending:
+                future.cancel()
 
 
 class AbsFindPackageTask(speedwagon.tasks.Subtask, abc.ABC):
     """Base class for creating find package tasks.
 
-    To implement, override the find_packages method.
+    To implement, override the find_packages method. Use :py:meth:`walk`
+    instead of :py:func:`os.walk` to search, so that a snapshot index can
+    be used if the task was given one. When the order packages are found in
+    does not matter, :py:func:`walk_directory_tree` is faster on network
+    shares.
     """
 
     name = "Locating Packages"
 
-    def __init__(self, root: str) -> None:
+    def __init__(
+        self, root: str, snapshot_index: Optional[str] = None
+    ) -> None:
         """Create a new find package tasks that searches at a given location.
 
         Args:
             root: Path to search for packages
+            snapshot_index: Path to a directory snapshot database, such as
+                the one from ``default_snapshot_index_path()``. Directories
+                that have not changed since the last search are not listed
+                again. By default, every directory is listed.
         """
         super().__init__()
         self._root = root
+        self._snapshot_index = snapshot_index
+        self._snapshot_statistics = SnapshotStatistics()
 
     def task_description(self) -> Optional[str]:
         """Describe where the packages are being searched for."""
@@ -34,8 +192,26 @@ class AbsFindPackageTask(speedwagon.tasks.Subtask, abc.ABC):
         """Perform the task."""
         self.log(f"Locating packages in {self._root}")
         self.set_results(self.find_packages(self._root))
+        if self._snapshot_index is not None:
+            self.log(f"Directory snapshot: {self._snapshot_statistics}")
         return True
 
+    def walk(self, top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """Walk a directory tree top down, like :py:func:`os.walk`.
+
+        If the task has a snapshot index, directories that have not changed
+        since they were last walked are read from it.
+
+        Args:
+            top: Path to the top of the tree.
+        """
+        if self._snapshot_index is None:
+            yield from os.walk(top)
+            return
+        yield from open_directory_snapshot(self._snapshot_index).walk(
+            top, statistics=self._snapshot_statistics
+        )
+
     @abc.abstractmethod
     def find_packages(self, search_path: str):
         """Locate package type.
@@ -123,19 +123,86 @@ class Result(Generic[_S, _T]):
     data: _T
 
 
+def _outermost_missing_directory(path: str) -> Optional[str]:
+    missing = None
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        missing = path
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return missing
+
+
 class BaseTask(AbsSubtask, Generic[_T]):
     def __init__(self) -> None:
         """Create a new sub-task."""
         # TODO: refactor into state machine
         self._status = TaskStatus.IDLE
         self._working_dir = ""
+        self._working_dir_created = False
+        self._created_working_dir: Optional[str] = None
         self.task_working_dir = ""
         self._parent_task_log_q: Optional[Deque[str]] = None
+        self._dependencies: List[AbsSubtask] = []
+        self._dependency_results: Optional[List[Result]] = None
 
     def task_description(self) -> Optional[str]:
         """Get user readable information about what the subtask is doing."""
         return None
 
+    def depends_on(self, *subtasks: AbsSubtask) -> None:
+        """Run this subtask only after the given subtasks have finished.
+
+        The subtasks must be added to the same job before or after this one.
+        Other subtasks that do not depend on them keep running in the
+        meantime. The results of the subtasks are available from
+        :py:attr:`dependency_results`.
+
+        Example:
+            .. code-block::
+
+                checksum_tasks = []
+                for file_name in job_args["files"]:
+                    checksum_task = MakeChecksumTask(...)
+                    task_builder.add_subtask(checksum_task)
+                    checksum_tasks.append(checksum_task)
+
+                report_task = MakeCheckSumReportTask(...)
+                report_task.depends_on(*checksum_tasks)
+                task_builder.add_subtask(report_task)
+        """
+        self._dependencies.extend(subtasks)
+
+    @property
+    def dependencies(self) -> Tuple[AbsSubtask, ...]:
+        """Subtasks that need to finish before this subtask can run."""
+        return tuple(self._dependencies)
+
+    @property
+    def dependencies_finished(self) -> bool:
+        """Check if every subtask this subtask depends on has finished."""
+        return all(
+            dependency.status in (TaskStatus.SUCCESS, TaskStatus.FAILED)
+            for dependency in self._dependencies
+        )
+
+    @property
+    def dependency_results(self) -> List[Result]:
+        """Get the results of the subtasks this subtask depends on.
+
+        Results are in the order the dependencies were added. Dependencies
+        without a result are left out.
+        """
+        if self._dependency_results is not None:
+            return list(self._dependency_results)
+        return [
+            dependency.task_result
+            for dependency in self._dependencies
+            if dependency.task_result is not None
+        ]
+
     def log(self, message: str) -> None:
         """Generate text message for the subtask."""
         if self._parent_task_log_q is not None:
@@ -169,15 +236,34 @@ class BaseTask(AbsSubtask, Generic[_T]):
 
         Notes:
             This has the side effect of creating the working directory if it
-            does not already exist.
+            does not already exist. Only subtasks that use their working
+            directory have one created, and it is only created once. The
+            outermost directory created here is kept in
+            ``created_working_dir`` so that only directories made for the
+            subtask are ever removed.
         """
-        if not os.path.exists(self._working_dir):
-            os.makedirs(self._working_dir)
+        if not getattr(self, "_working_dir_created", False):
+            self._created_working_dir = _outermost_missing_directory(
+                self._working_dir
+            )
+            os.makedirs(self._working_dir, exist_ok=True)
+            self._working_dir_created = True
         return self._working_dir
 
     @subtask_working_dir.setter
     def subtask_working_dir(self, value: str) -> None:
         self._working_dir = value
+        self._working_dir_created = False
+        self._created_working_dir = None
+
+    @property
+    def created_working_dir(self) -> Optional[str]:
+        """Outermost directory created for the subtask working directory.
+
+        None if the subtask working directory was never used or already
+        existed.
+        """
+        return getattr(self, "_created_working_dir", None)
 
     @property
     def parent_task_log_q(self) -> Deque[str]:
@@ -704,6 +790,72 @@ class TaskBuilder:
         return obj
 
 
+TRANSIENT_SUBTASK_ATTRIBUTES = ("_parent_task_log_q", "log", "_dependencies")
+"""Subtask attributes tied to the running process that are not serialized."""
+
+
+def serialize_subtask(subtask: AbsSubtask) -> bytes:
+    """Pickle a subtask so that it can be run in another process.
+
+    Attributes that are tied to the current process, such as the parent log
+    queue, are left out. Dependencies are replaced by their results.
+
+    Raises:
+        pickle.PicklingError: If the subtask cannot be pickled.
+        TypeError: If the subtask contains an object that cannot be pickled.
+        AttributeError: If the subtask refers to a local object.
+    """
+    serialized_attributes = {
+        key: value
+        for key, value in vars(subtask).items()
+        if key not in TRANSIENT_SUBTASK_ATTRIBUTES
+    }
+    if isinstance(subtask, BaseTask) and subtask.dependencies:
+        serialized_attributes["_dependency_results"] = (
+            subtask.dependency_results
+        )
+    return pickle.dumps((type(subtask), serialized_attributes))
+
+
+def deserialize_subtask(data: bytes) -> AbsSubtask:
+    """Load a subtask pickled with :py:func:`serialize_subtask`."""
+    task_cls, attributes = pickle.loads(data)
+    attributes.setdefault("_parent_task_log_q", None)
+    attributes.setdefault("_dependencies", [])
+    subtask: AbsSubtask = task_cls.__new__(task_cls)
+    subtask.__dict__.update(attributes)
+    return subtask
+
+
+def run_serialized_subtask(
+    data: bytes,
+) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+    """Execute a serialized subtask and return its updated state.
+
+    This is meant to be used as the target of a process pool.
+
+    Returns:
+        A tuple with the attributes of the subtask after it was executed
+        and any messages it logged, or None if the subtask could not be
+        loaded in this process.
+    """
+    try:
+        subtask = deserialize_subtask(data)
+    except Exception:  # pylint: disable=broad-except
+        return None
+    messages: List[str] = []
+    subtask.parent_task_log_q = messages  # type: ignore[assignment]
+    subtask.exec()
+    return (
+        {
+            key: value
+            for key, value in subtask.__dict__.items()
+            if key not in TRANSIENT_SUBTASK_ATTRIBUTES
+        },
+        messages,
+    )
+
+
 class QueueAdapter:
     """Queue adapter class."""
 
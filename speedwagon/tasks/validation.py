@@ -1,39 +1,283 @@
 """Shared checksum tasks."""
 import abc
+import collections
 from collections import namedtuple
+import concurrent.futures
+import functools
 import hashlib
+import heapq
+import mmap
 import os
+import re
+import tempfile
 import typing
-from typing import Optional
+import uuid
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import speedwagon
+from speedwagon.tasks.checksum_cache import (
+    CacheStatistics,
+    ChecksumCache,
+    open_checksum_cache,
+)
 from speedwagon.workflows.checksum_shared import ResultsValues
 
 CHUNK_SIZE = 2 ** 20
+"""Read size used for files that do not report their size."""
 
+MIN_CHUNK_SIZE = 2 ** 16
+MAX_CHUNK_SIZE = 2 ** 24
+DEFAULT_BLOCK_SIZE = 4096
+
+DEFAULT_CHECKSUM_WORKERS = min(8, os.cpu_count() or 1)
+
+DEFAULT_HASH_ALGORITHMS: Tuple[str, ...] = ("md5",)
+
+DEFAULT_REPORT_ENTRIES_IN_MEMORY = 100_000
+"""Checksum report entries held in memory before sorting them on disk."""
+
+MAX_REPORT_MERGE_FILES = 64
+
+_H = TypeVar("_H")
+
+
+def choose_chunk_size(
+    file_size: int, block_size: int = DEFAULT_BLOCK_SIZE
+) -> int:
+    """Choose how much of a file to read at a time.
+
+    Files up to MIN_CHUNK_SIZE are read in one go. Larger files are read in
+    about 64 chunks, between MIN_CHUNK_SIZE and MAX_CHUNK_SIZE. The chunk
+    size is always a whole number of filesystem blocks.
+
+    Args:
+        file_size: Size of the file in bytes, or 0 if it is not known.
+        block_size: Preferred I/O block size of the filesystem.
+    """
+    block_size = block_size if block_size > 0 else DEFAULT_BLOCK_SIZE
+    if file_size <= 0:
+        target = CHUNK_SIZE
+    elif file_size <= MIN_CHUNK_SIZE:
+        target = file_size
+    else:
+        target = min(max(file_size // 64, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+    return -(-target // block_size) * block_size
+
+
+def read_file_chunks(
+    file: typing.BinaryIO, chunk_size: Optional[int] = None
+) -> Iterator[memoryview]:
+    """Read a file into a single, reused buffer.
+
+    Each chunk is only valid until the next one is read, so it has to be
+    used, for example by passing it to a hash object, right away.
+
+    Args:
+        file: File opened in binary mode.
+        chunk_size: Bytes to read at a time. Defaults to
+            :py:func:`choose_chunk_size` for the file.
+    """
+    if chunk_size is None:
+        stat = os.fstat(file.fileno())
+        chunk_size = choose_chunk_size(
+            stat.st_size, getattr(stat, "st_blksize", DEFAULT_BLOCK_SIZE)
+        )
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        bytes_read = file.readinto(buffer)  # type: ignore[attr-defined]
+        if not bytes_read:
+            break
+        yield view[:bytes_read]
+
+
+def validate_hash_algorithms(algorithms: Sequence[str]) -> None:
+    """Check that hash algorithms can be used with hashlib.
+
+    Algorithms with variable length digests, such as shake_128, are not
+    supported.
+
+    Raises:
+        ValueError: If there are no algorithms or one is not available.
+    """
+    if not algorithms:
+        raise ValueError("At least one hash algorithm is required")
+    for algorithm in algorithms:
+        if (
+            algorithm not in hashlib.algorithms_available
+            or hashlib.new(algorithm, usedforsecurity=False).digest_size == 0
+        ):
+            raise ValueError(f"Unsupported hash algorithm: '{algorithm}'")
 
-def calculate_md5_hash(file_path: str) -> str:
-    """Calculate the md5 hash value of a file.
+
+def calculate_hashes(
+    file_path: str,
+    algorithms: Sequence[str] = DEFAULT_HASH_ALGORITHMS,
+    chunk_size: Optional[int] = None,
+    use_mmap: bool = False,
+    cache: Optional[ChecksumCache] = None,
+    force: bool = False,
+) -> Dict[str, str]:
+    """Calculate several hash values of a file while reading it only once.
+
+    Each chunk of the file is passed to a hash object for every algorithm
+    before the next chunk is read.
 
     Args:
         file_path: Path to a file
+        algorithms: Names of hashlib algorithms, such as "md5", "sha1" and
+            "sha256".
+        chunk_size: Bytes to read at a time. Defaults to a size chosen from
+            the size of the file and the filesystem's block size.
+        use_mmap: Map the file into memory instead of reading it. This
+            avoids copying the file into a buffer at all, but keeps the
+            file locked on Windows while it is being hashed.
+        cache: Look up hash values in this cache first, and add the ones
+            that had to be calculated to it.
+        force: Calculate every hash value again, even if it is in the
+            cache.
 
-    Returns: Hash value as a string
+    Returns: Hash values as strings, by algorithm name.
 
     """
+    validate_hash_algorithms(algorithms)
     if not os.path.isfile(file_path):
         raise ValueError(f"Not a valid file: '{file_path}'")
+    if cache is not None:
+        return cache.hash_file(
+            file_path,
+            algorithms,
+            functools.partial(
+                calculate_hashes, chunk_size=chunk_size, use_mmap=use_mmap
+            ),
+            force=force,
+        )
+
+    hashes = {
+        algorithm: hashlib.new(algorithm, usedforsecurity=False)
+        for algorithm in algorithms
+    }
+    with open(file_path, "rb", buffering=0) as file:
+        file_size = os.fstat(file.fileno()).st_size
+        if use_mmap and file_size > 0:
+            step = chunk_size or choose_chunk_size(file_size)
+            with mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped_file, memoryview(mapped_file) as view:
+                if len(hashes) == 1:
+                    step = file_size
+                for start in range(0, file_size, step):
+                    chunk = view[start:start + step]
+                    for hash_object in hashes.values():
+                        hash_object.update(chunk)
+                    chunk.release()
+        else:
+            for chunk in read_file_chunks(file, chunk_size):
+                for hash_object in hashes.values():
+                    hash_object.update(chunk)
+    return {
+        algorithm: hash_object.hexdigest()
+        for algorithm, hash_object in hashes.items()
+    }
 
-    md5_hash = hashlib.md5(usedforsecurity=False)
-    with open(file_path, "rb") as file:
-        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
-            md5_hash.update(chunk)
-    hash_value = md5_hash.hexdigest()
-    return hash_value
 
+def calculate_md5_hash(
+    file_path: str,
+    chunk_size: Optional[int] = None,
+    use_mmap: bool = False,
+    cache: Optional[ChecksumCache] = None,
+    force: bool = False,
+) -> str:
+    """Calculate the md5 hash value of a file.
 
-MakeChecksumTaskResult = typing.TypedDict(
-    "MakeChecksumTaskResult",
+    Args:
+        file_path: Path to a file
+        chunk_size: Bytes to read at a time. Defaults to a size chosen from
+            the size of the file and the filesystem's block size.
+        use_mmap: Map the file into memory instead of reading it. See
+            :py:func:`calculate_hashes`.
+        cache: Look up the hash value in this cache first, adding it if it
+            has to be calculated.
+        force: Calculate the hash value again, even if it is in the cache.
+
+    Returns: Hash value as a string
+
+    """
+    return calculate_hashes(
+        file_path,
+        ("md5",),
+        chunk_size=chunk_size,
+        use_mmap=use_mmap,
+        cache=cache,
+        force=force,
+    )["md5"]
+
+
+def calculate_hashes_in_parallel(
+    file_paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    hash_function: Callable[[str], _H] = calculate_md5_hash,  # type: ignore
+) -> Iterator[Tuple[str, _H]]:
+    """Calculate the hash values of many files at the same time.
+
+    Files are hashed on a pool of threads. hashlib releases the GIL while
+    hashing large buffers, so reading and hashing of different files
+    overlap. Only a few files more than the number of threads are queued at
+    a time, so file_paths can be a long-running generator.
+
+    Args:
+        file_paths: Paths to files.
+        max_workers: Number of files hashed at the same time. Defaults to
+            DEFAULT_CHECKSUM_WORKERS.
+        hash_function: Calculates the hash value of a single file.
+            Defaults to :py:func:`calculate_md5_hash`. Use
+            :py:func:`calculate_hashes`, with functools.partial, to
+            calculate other or more than one hash value per file.
+
+    Yields:
+        Tuples of each file path and its hash value, in the same order as
+        file_paths.
+    """
+    max_workers = max_workers or DEFAULT_CHECKSUM_WORKERS
+    pending: typing.Deque[
+        Tuple[str, "concurrent.futures.Future[_H]"]
+    ] = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="checksum"
+    ) as executor:
+        try:
+            for file_path in file_paths:
+                pending.append(
+                    (file_path, executor.submit(hash_function, file_path))
+                )
+                if len(pending) >= max_workers * 2:
+                    done_path, future = pending.popleft()
+                    yield done_path, future.result()
+            while pending:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+calculate_md5_hashes = calculate_hashes_in_parallel
+"""Earlier name of :py:func:`calculate_hashes_in_parallel`."""
+
+
+_MakeChecksumTaskRequiredResult = typing.TypedDict(
+    "_MakeChecksumTaskRequiredResult",
     {
         "source_filename": str,
         "checksum_hash": str,
@@ -42,19 +286,94 @@ MakeChecksumTaskResult = typing.TypedDict(
 )
 
 
+class MakeChecksumTaskResult(_MakeChecksumTaskRequiredResult, total=False):
+    """Result of calculating the checksum of a file.
+
+    checksum_hash is always the md5 hash value, which is calculated even
+    when it is not one of the algorithms asked for. checksum_hashes has the
+    hash values of every algorithm calculated, by algorithm name.
+    """
+
+    checksum_hashes: Dict[str, str]
+
+
+def _hash_file(
+    file_path: str,
+    algorithms: Sequence[str],
+    cache: Optional[ChecksumCache] = None,
+    force: bool = False,
+    statistics: Optional[CacheStatistics] = None,
+) -> Dict[str, str]:
+    if cache is not None:
+        if not os.path.isfile(file_path):
+            raise ValueError(f"Not a valid file: '{file_path}'")
+        return cache.hash_file(
+            file_path,
+            algorithms,
+            calculate_hashes,
+            force=force,
+            statistics=statistics,
+        )
+    if tuple(algorithms) == ("md5",):
+        return {"md5": calculate_md5_hash(file_path)}
+    return calculate_hashes(file_path, algorithms)
+
+
+def _with_md5(algorithms: Sequence[str]) -> Tuple[str, ...]:
+    # Consumers of checksum_hash expect md5, whatever else is calculated.
+    if "md5" in algorithms:
+        return tuple(algorithms)
+    return (*algorithms, "md5")
+
+
+def _checksum_result(
+    filename: str, checksum_report: str, hash_values: Mapping[str, str]
+) -> MakeChecksumTaskResult:
+    return {
+        "source_filename": filename,
+        "checksum_hash": hash_values["md5"],
+        "checksum_file": checksum_report,
+        "checksum_hashes": dict(hash_values),
+    }
+
+
 class MakeChecksumTask(speedwagon.tasks.Subtask[MakeChecksumTaskResult]):
     """Create a make checksum task."""
 
     name = "Create Checksum"
 
     def __init__(
-        self, source_path: str, filename: str, checksum_report: str
+        self,
+        source_path: str,
+        filename: str,
+        checksum_report: str,
+        algorithms: Sequence[str] = DEFAULT_HASH_ALGORITHMS,
+        checksum_cache: Optional[str] = None,
+        force_rehash: bool = False,
     ) -> None:
-        """Create a make checksum task."""
+        """Create a make checksum task.
+
+        Args:
+            source_path: Directory containing the file.
+            filename: Name of the file, relative to source_path.
+            checksum_report: Path to the report the checksum is for.
+            algorithms: Names of the hashlib algorithms to calculate. The
+                file is only read once, however many there are. md5 is
+                always calculated as well, for checksum_hash.
+            checksum_cache: Path to a checksum cache database, such as the
+                one from ``checksum_cache.default_checksum_cache_path()``.
+                Unchanged files found in the cache are not read again. By
+                default, no cache is used.
+            force_rehash: Read the file even if it is in the checksum cache.
+        """
         super().__init__()
+        validate_hash_algorithms(algorithms)
         self._source_path = source_path
         self._filename = filename
         self._checksum_report = checksum_report
+        self._algorithms = _with_md5(algorithms)
+        self._checksum_cache = checksum_cache
+        self._force_rehash = force_rehash
 
     def task_description(self) -> Optional[str]:
         """Get user readable information about what the subtask is doing."""
@@ -65,19 +384,126 @@ class MakeChecksumTask(speedwagon.tasks.Subtask[MakeChecksumTaskResult]):
         item_path = self._source_path
         item_file_name = self._filename
         report_path_to_save_to = self._checksum_report
-        self.log(f"Calculated the checksum for {item_file_name}")
-
         file_to_calculate = os.path.join(item_path, item_file_name)
-        result: MakeChecksumTaskResult = {
-            "source_filename": item_file_name,
-            "checksum_hash": calculate_md5_hash(file_to_calculate),
-            "checksum_file": report_path_to_save_to,
-        }
+        if self._checksum_cache is None:
+            self.log(f"Calculated the checksum for {item_file_name}")
+            hash_values = _hash_file(file_to_calculate, self._algorithms)
+        else:
+            statistics = CacheStatistics()
+            hash_values = _hash_file(
+                file_to_calculate,
+                self._algorithms,
+                cache=open_checksum_cache(self._checksum_cache),
+                force=self._force_rehash,
+                statistics=statistics,
+            )
+            self.log(
+                f"Calculated the checksum for {item_file_name}"
+                if statistics.misses
+                else f"Found the checksum for {item_file_name} in the cache"
+            )
+        result = _checksum_result(
+            item_file_name, report_path_to_save_to, hash_values
+        )
         self.set_results(result)
 
         return True
 
 
+class MakeChecksumBatchTask(
+    speedwagon.tasks.Subtask[List[MakeChecksumTaskResult]]
+):
+    """Calculate the checksums of many files in one subtask.
+
+    The files are hashed at the same time with
+    :py:func:`calculate_hashes_in_parallel`. Use this instead of a
+    :py:class:`MakeChecksumTask` per file when a package has many files.
+    """
+
+    name = "Create Checksums"
+
+    def __init__(
+        self,
+        source_path: str,
+        filenames: Iterable[str],
+        checksum_report: str,
+        max_workers: Optional[int] = None,
+        algorithms: Sequence[str] = DEFAULT_HASH_ALGORITHMS,
+        checksum_cache: Optional[str] = None,
+        force_rehash: bool = False,
+    ) -> None:
+        """Create a batch checksum task.
+
+        Args:
+            source_path: Directory containing the files.
+            filenames: Names of the files, relative to source_path.
+            checksum_report: Path to the report the checksums are for.
+            max_workers: Number of files hashed at the same time.
+            algorithms: Names of the hashlib algorithms to calculate. Each
+                file is only read once, however many there are. md5 is
+                always calculated as well, for checksum_hash.
+            checksum_cache: Path to a checksum cache database. See
+                :py:class:`MakeChecksumTask`.
+            force_rehash: Read every file even if it is in the checksum
+                cache.
+        """
+        super().__init__()
+        validate_hash_algorithms(algorithms)
+        self._source_path = source_path
+        self._filenames = list(filenames)
+        self._checksum_report = checksum_report
+        self._max_workers = max_workers
+        self._algorithms = _with_md5(algorithms)
+        self._checksum_cache = checksum_cache
+        self._force_rehash = force_rehash
+
+    def task_description(self) -> Optional[str]:
+        """Get user readable information about what the subtask is doing."""
+        return (
+            f"Calculating checksums for {len(self._filenames)} files in "
+            f"{self._source_path}"
+        )
+
+    def work(self) -> bool:
+        """Calculate the file checksums.
+
+        Results are in the same order as the file names were given.
+        """
+        results: List[MakeChecksumTaskResult] = []
+        statistics = CacheStatistics()
+        hash_values = calculate_hashes_in_parallel(
+            (
+                os.path.join(self._source_path, filename)
+                for filename in self._filenames
+            ),
+            max_workers=self._max_workers,
+            hash_function=functools.partial(
+                _hash_file,
+                algorithms=self._algorithms,
+                cache=(
+                    open_checksum_cache(self._checksum_cache)
+                    if self._checksum_cache is not None
+                    else None
+                ),
+                force=self._force_rehash,
+                statistics=statistics,
+            ),
+        )
+        for filename, (_, file_hash_values) in zip(
+            self._filenames, hash_values, strict=True
+        ):
+            results.append(
+                _checksum_result(
+                    filename, self._checksum_report, file_hash_values
+                )
+            )
+        self.log(f"Calculated the checksums for {len(results)} files")
+        if self._checksum_cache is not None:
+            self.log(f"Checksum cache: {statistics}")
+        self.set_results(results)
+        return True
+
+
 HashValue = namedtuple("HashValue", ("filename", "hash"))
 
 
@@ -106,6 +532,29 @@ class AbsChecksumBuilder(metaclass=abc.ABCMeta):
 class ChecksumReport(AbsChecksumBuilder):
     """Generate a new Checksum report for Hathi."""
 
+    def __init__(self, algorithm: str = "md5") -> None:
+        """Create a new checksum report.
+
+        Args:
+            algorithm: Name of the hash algorithm the report lists.
+        """
+        super().__init__()
+        validate_hash_algorithms([algorithm])
+        self.algorithm = algorithm
+
+    def add_hashes(
+        self, filename: str, hash_values: Mapping[str, str]
+    ) -> None:
+        """Add a file from the hash values of several algorithms.
+
+        Only the value for the report's algorithm is used.
+
+        Args:
+            filename: file name to added to report
+            hash_values: hash values of file, by algorithm name
+        """
+        self.add_entry(filename, hash_values[self.algorithm])
+
     @staticmethod
     def _format_entry(filename: str, hash_value: str) -> str:
         return f"{hash_value} *{filename}"
@@ -122,6 +571,157 @@ class ChecksumReport(AbsChecksumBuilder):
         return "{}\n".format("\n".join(lines))
 
 
+class ChecksumReportWriter:
+    """Write a checksum report to a file, one entry at a time.
+
+    The report is the same as the one built by :py:class:`ChecksumReport`,
+    but it is never held in memory in full. Entries are kept in memory in
+    batches of up to max_entries_in_memory. Full batches are sorted and
+    written to temporary files, which are merged when the report is
+    written.
+
+    The report is written to a temporary file next to output_filename and
+    renamed over it once complete, so a report is never left half written.
+
+    .. code-block:: python
+
+        with ChecksumReportWriter("checksum.md5") as writer:
+            for filename, hash_value in calculations:
+                writer.add_entry(filename, hash_value)
+            writer.write()
+    """
+
+    def __init__(
+        self,
+        output_filename: str,
+        algorithm: str = "md5",
+        max_entries_in_memory: int = DEFAULT_REPORT_ENTRIES_IN_MEMORY,
+        temp_directory: Optional[str] = None,
+    ) -> None:
+        """Create a new checksum report writer.
+
+        Args:
+            output_filename: Path to the report file to write.
+            algorithm: Name of the hash algorithm the report lists.
+            max_entries_in_memory: Number of entries kept in memory before
+                they are sorted and moved to a temporary file.
+            temp_directory: Where to keep sorted batches of entries.
+                Defaults to the system's temporary directory.
+        """
+        validate_hash_algorithms([algorithm])
+        self.output_filename = output_filename
+        self.algorithm = algorithm
+        self.max_entries_in_memory = max(1, max_entries_in_memory)
+        self.temp_directory = temp_directory
+        self._entries: List[str] = []
+        self._runs: List[typing.TextIO] = []
+
+    def __enter__(self) -> "ChecksumReportWriter":
+        """Use the writer as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Discard any entries not written and remove temporary files."""
+        self.close()
+
+    def add_entry(self, filename: str, hash_value: str) -> None:
+        """Add a file to the report.
+
+        Args:
+            filename: file name to added to report
+            hash_value: hash value of file
+        """
+        # Entries sort by file name first, because "\0" sorts before any
+        # character a file name can have.
+        self._entries.append(f"{filename}\0{hash_value}\n")
+        if len(self._entries) >= self.max_entries_in_memory:
+            self._flush_entries()
+
+    def add_hashes(
+        self, filename: str, hash_values: Mapping[str, str]
+    ) -> None:
+        """Add a file from the hash values of several algorithms.
+
+        Only the value for the report's algorithm is used.
+
+        Args:
+            filename: file name to added to report
+            hash_values: hash values of file, by algorithm name
+        """
+        self.add_entry(filename, hash_values[self.algorithm])
+
+    def _new_run(self) -> typing.TextIO:
+        return typing.cast(
+            typing.TextIO,
+            tempfile.TemporaryFile(
+                "w+",
+                encoding="utf-8",
+                newline="",
+                prefix="speedwagon_checksums_",
+                dir=self.temp_directory,
+            ),
+        )
+
+    def _flush_entries(self) -> None:
+        if not self._entries:
+            return
+        self._entries.sort()
+        run = self._new_run()
+        run.writelines(self._entries)
+        self._entries = []
+        self._runs.append(run)
+        if len(self._runs) >= MAX_REPORT_MERGE_FILES:
+            merged = self._new_run()
+            merged.writelines(self._merge_runs())
+            self.close()
+            self._runs.append(merged)
+
+    def _merge_runs(self) -> Iterator[str]:
+        for run in self._runs:
+            run.seek(0)
+        return heapq.merge(*self._runs)
+
+    def _sorted_entries(self) -> Iterator[str]:
+        if not self._runs:
+            self._entries.sort()
+            return iter(self._entries)
+        self._flush_entries()
+        return self._merge_runs()
+
+    def write(self) -> None:
+        """Write the report file, replacing it if it already exists."""
+        directory, basename = os.path.split(
+            os.path.abspath(self.output_filename)
+        )
+        temp_filename = os.path.join(
+            directory, f".{basename}.{uuid.uuid4().hex}.tmp"
+        )
+        try:
+            with open(temp_filename, "x", encoding="utf-8") as write_file:
+                wrote_entries = False
+                for entry in self._sorted_entries():
+                    filename, hash_value = entry[:-1].split("\0", 1)
+                    if wrote_entries:
+                        write_file.write("\n")
+                    write_file.write(f"{hash_value} *{filename}")
+                    wrote_entries = True
+                write_file.write("\n")
+            os.replace(temp_filename, self.output_filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
+            raise
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Discard any entries not written and remove temporary files."""
+        self._entries = []
+        for run in self._runs:
+            run.close()
+        self._runs = []
+
+
 class MakeCheckSumReportTask(speedwagon.tasks.Subtask[str]):
     """Generate a checksum report.
 
@@ -134,13 +734,22 @@ class MakeCheckSumReportTask(speedwagon.tasks.Subtask[str]):
         self,
         output_filename: str,
         checksum_calculations: typing.Iterable[
-            typing.Mapping[ResultsValues, str]
+            typing.Mapping[ResultsValues, typing.Any]
         ],
+        algorithm: str = "md5",
     ) -> None:
-        """Create a checksum report task."""
+        """Create a checksum report task.
+
+        Args:
+            output_filename: Path to the report file to write.
+            checksum_calculations: Filename and hash value of each file.
+            algorithm: Hash algorithm the report lists. Calculations with
+                several hash values have the value for this algorithm used.
+        """
         super().__init__()
         self._output_filename = output_filename
         self._checksum_calculations = checksum_calculations
+        self._algorithm = algorithm
 
     def task_description(self) -> Optional[str]:
         """Get user readable information about what the subtask is doing."""
@@ -148,15 +757,268 @@ class MakeCheckSumReportTask(speedwagon.tasks.Subtask[str]):
 
     def work(self) -> bool:
         """Generate the report file."""
-        report_builder = ChecksumReport()
-        for item in self._checksum_calculations:
-            filename = item[ResultsValues.SOURCE_FILE]
-            hash_value = item[ResultsValues.SOURCE_HASH]
-            report_builder.add_entry(filename, hash_value)
-        report: str = report_builder.build()
-
-        with open(self._output_filename, "w", encoding="utf-8") as write_file:
-            write_file.write(report)
+        with ChecksumReportWriter(
+            self._output_filename, self._algorithm
+        ) as report_writer:
+            for item in self._checksum_calculations:
+                filename = item[ResultsValues.SOURCE_FILE]
+                if ResultsValues.SOURCE_HASHES in item:
+                    report_writer.add_hashes(
+                        filename, item[ResultsValues.SOURCE_HASHES]
+                    )
+                else:
+                    report_writer.add_entry(
+                        filename, item[ResultsValues.SOURCE_HASH]
+                    )
+            report_writer.write()
         self.log(f"Wrote {self._output_filename}")
 
         return True
+
+
+_CHECKSUM_MANIFEST_LINE = re.compile(r"^([0-9A-Fa-f]+) [ *](.+)$")
+
+
+def read_checksum_manifest(
+    manifest_path: str,
+) -> Iterator[Tuple[str, str]]:
+    """Read the entries of a checksum report one line at a time.
+
+    Lines are in the ``hash *filename`` format written by
+    :py:class:`ChecksumReport`. The ``hash  filename`` format, used by
+    md5sum for files read in text mode, is also accepted. Blank lines are
+    skipped.
+
+    Args:
+        manifest_path: Path to a checksum report, such as a .md5 file.
+
+    Yields:
+        Tuples of each file name and its hash value, in the order listed.
+
+    Raises:
+        ValueError: If a line is not a checksum entry.
+    """
+    with open(manifest_path, "r", encoding="utf-8-sig") as manifest:
+        for line_number, line in enumerate(manifest, start=1):
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            match = _CHECKSUM_MANIFEST_LINE.match(line)
+            if match is None:
+                raise ValueError(
+                    f"Invalid checksum entry on line {line_number} of "
+                    f"{manifest_path}: '{line}'"
+                )
+            hash_value, filename = match.groups()
+            yield filename, hash_value
+
+
+class ChecksumMismatch(typing.TypedDict):
+    """File with a hash value different to the one in a checksum report."""
+
+    filename: str
+    expected_hash: str
+    actual_hash: str
+
+
+class VerifyChecksumManifestTaskResult(typing.TypedDict):
+    """Result of checking files against a checksum report.
+
+    File names are relative to the directory the files were checked in.
+    """
+
+    checksum_report: str
+    files_checked: int
+    mismatched: List[ChecksumMismatch]
+    missing: List[str]
+    extra: List[str]
+
+
+def _list_extra_files(
+    source_path: str, listed: typing.Set[str], ignored: typing.Set[str]
+) -> List[str]:
+    extra = []
+    for root, _, filenames in os.walk(source_path):
+        for filename in filenames:
+            relative_path = os.path.normcase(
+                os.path.relpath(os.path.join(root, filename), source_path)
+            )
+            if relative_path not in listed and relative_path not in ignored:
+                extra.append(relative_path)
+    return sorted(extra)
+
+
+def verify_checksum_manifest(
+    manifest_path: str,
+    source_path: Optional[str] = None,
+    algorithm: str = "md5",
+    max_workers: Optional[int] = None,
+    cache: Optional[ChecksumCache] = None,
+    force: bool = False,
+    check_extra_files: bool = True,
+    statistics: Optional[CacheStatistics] = None,
+) -> VerifyChecksumManifestTaskResult:
+    """Check files against the hash values listed in a checksum report.
+
+    The report is read as the files are hashed, so only the names of the
+    files listed are held in memory, and only to find extra files. Files are
+    hashed at the same time with :py:func:`calculate_hashes_in_parallel`.
+
+    Args:
+        manifest_path: Path to a checksum report, such as a .md5 file.
+        source_path: Directory the file names in the report are relative
+            to. Defaults to the directory containing the report.
+        algorithm: Hash algorithm the report lists.
+        max_workers: Number of files hashed at the same time.
+        cache: Checksum cache to look up the hash values in. Verifying
+            against cached values only checks that the files have not been
+            modified since they were cached.
+        force: Read every file even if it is in the checksum cache.
+        check_extra_files: Also list files in source_path that are not in
+            the report.
+        statistics: Count checksum cache hits and misses here.
+    """
+    validate_hash_algorithms([algorithm])
+    if source_path is None:
+        source_path = os.path.dirname(os.path.abspath(manifest_path))
+    listed: typing.Set[str] = set()
+    entries: typing.Deque[Tuple[str, str]] = collections.deque()
+
+    def file_paths() -> Iterator[str]:
+        for filename, hash_value in read_checksum_manifest(manifest_path):
+            if check_extra_files:
+                listed.add(os.path.normcase(os.path.normpath(filename)))
+            entries.append((filename, hash_value))
+            yield os.path.join(source_path, filename)
+
+    def hash_if_exists(file_path: str) -> Optional[str]:
+        if not os.path.isfile(file_path):
+            return None
+        hash_values = _hash_file(
+            file_path,
+            (algorithm,),
+            cache=cache,
+            force=force,
+            statistics=statistics,
+        )
+        return hash_values[algorithm]
+
+    result: VerifyChecksumManifestTaskResult = {
+        "checksum_report": manifest_path,
+        "files_checked": 0,
+        "mismatched": [],
+        "missing": [],
+        "extra": [],
+    }
+    for _, actual_hash in calculate_hashes_in_parallel(
+        file_paths(), max_workers=max_workers, hash_function=hash_if_exists
+    ):
+        filename, expected_hash = entries.popleft()
+        if actual_hash is None:
+            result["missing"].append(filename)
+            continue
+        result["files_checked"] += 1
+        if actual_hash.lower() != expected_hash.lower():
+            result["mismatched"].append(
+                {
+                    "filename": filename,
+                    "expected_hash": expected_hash,
+                    "actual_hash": actual_hash,
+                }
+            )
+    if check_extra_files:
+        manifest_relative_path = os.path.normcase(
+            os.path.relpath(os.path.abspath(manifest_path), source_path)
+        )
+        result["extra"] = _list_extra_files(
+            source_path, listed, {manifest_relative_path}
+        )
+    return result
+
+
+class VerifyChecksumManifestTask(
+    speedwagon.tasks.Subtask[VerifyChecksumManifestTaskResult]
+):
+    """Check the files listed in a checksum report against their hashes.
+
+    Mismatched, missing and extra files are listed in the task's results
+    and the job log.
+    """
+
+    name = "Verify Checksums"
+
+    def __init__(
+        self,
+        checksum_report: str,
+        source_path: Optional[str] = None,
+        algorithm: str = "md5",
+        max_workers: Optional[int] = None,
+        checksum_cache: Optional[str] = None,
+        force_rehash: bool = False,
+        check_extra_files: bool = True,
+    ) -> None:
+        """Create a checksum verification task.
+
+        Args:
+            checksum_report: Path to a checksum report, such as a .md5 file.
+            source_path: Directory the file names in the report are
+                relative to. Defaults to the directory containing the
+                report.
+            algorithm: Hash algorithm the report lists.
+            max_workers: Number of files hashed at the same time.
+            checksum_cache: Path to a checksum cache database. See
+                :py:class:`MakeChecksumTask`.
+            force_rehash: Read every file even if it is in the checksum
+                cache. Use this for fixity audits that need to read every
+                byte.
+            check_extra_files: Also list files that are not in the report.
+        """
+        super().__init__()
+        validate_hash_algorithms([algorithm])
+        self._checksum_report = checksum_report
+        self._source_path = source_path
+        self._algorithm = algorithm
+        self._max_workers = max_workers
+        self._checksum_cache = checksum_cache
+        self._force_rehash = force_rehash
+        self._check_extra_files = check_extra_files
+
+    def task_description(self) -> Optional[str]:
+        """Get user readable information about what the subtask is doing."""
+        return f"Verifying checksums in {self._checksum_report}"
+
+    def work(self) -> bool:
+        """Check the files against the checksum report."""
+        statistics = CacheStatistics()
+        cache = (
+            open_checksum_cache(self._checksum_cache)
+            if self._checksum_cache is not None
+            else None
+        )
+        result = verify_checksum_manifest(
+            self._checksum_report,
+            source_path=self._source_path,
+            algorithm=self._algorithm,
+            max_workers=self._max_workers,
+            cache=cache,
+            force=self._force_rehash,
+            check_extra_files=self._check_extra_files,
+            statistics=statistics,
+        )
+        for mismatch in result["mismatched"]:
+            self.log(
+                f"Checksum mismatch for {mismatch['filename']}. Expected "
+                f"{mismatch['expected_hash']}, got {mismatch['actual_hash']}"
+            )
+        for filename in result["missing"]:
+            self.log(f"Missing file listed in checksum report: {filename}")
+        for filename in result["extra"]:
+            self.log(f"File not listed in checksum report: {filename}")
+        self.log(
+            f"Verified {result['files_checked']} files against "
+            f"{self._checksum_report}"
+        )
+        if cache is not None:
+            self.log(f"Checksum cache: {statistics}")
+        self.set_results(result)
+        return True
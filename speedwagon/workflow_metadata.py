@@ -0,0 +1,389 @@
+"""Cache of workflow metadata from plugins that is kept between sessions.
+
+Listing the workflows of a plugin means importing the plugin, and with it
+every library its workflows use. The names, descriptions and options of
+the workflows found are stored in a JSON file, by the entry point of the
+plugin and the version of the distribution that provides it. Until that
+version changes, the workflows can be listed without importing anything,
+and a workflow's class is only imported when it is needed.
+
+Plugins installed in development mode keep the same version while their
+code changes. Call :py:meth:`WorkflowMetadataCache.clear` to list their
+workflows again.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.metadata
+import json
+import logging
+import os
+import threading
+import typing
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Type
+
+try:  # pragma: no cover
+    from typing import TypedDict
+except ImportError:  # pragma: no cover
+    from typing_extensions import TypedDict
+
+import speedwagon.plugins
+from speedwagon.config.common import DEFAULT_CONFIG_DIRECTORY_NAME
+from speedwagon.config.config import StandardConfigFileLocator
+from speedwagon.exceptions import SpeedwagonException
+
+if typing.TYPE_CHECKING:
+    from speedwagon.job import Workflow
+
+__all__ = [
+    "WorkflowDescriptor",
+    "WorkflowMetadata",
+    "WorkflowMetadataCache",
+    "WorkflowType",
+    "default_workflow_metadata_cache_path",
+    "load_workflow_class",
+    "open_workflow_metadata_cache",
+    "workflow_metadata",
+]
+
+WORKFLOW_METADATA_CACHE_FILE_NAME = "workflow_metadata.json"
+
+CACHE_FORMAT_VERSION = 1
+"""Changed when the layout of the cache file changes."""
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowMetadata(TypedDict):
+    """Information about a workflow that is known without importing it."""
+
+    name: str
+    description: Optional[str]
+    options: Optional[List[Dict[str, Any]]]
+    module: str
+    qualname: str
+    plugin: str
+    distribution: Optional[str]
+    version: Optional[str]
+
+
+def _workflow_options(
+    workflow_klass: Type[Workflow],
+) -> Optional[List[Dict[str, Any]]]:
+    try:
+        workflow = workflow_klass(global_settings={})
+        return [option.serialize() for option in workflow.job_options()]
+    except Exception as error:  # pylint: disable=broad-except
+        # Options that depend on the settings are only known at run time.
+        logger.debug(
+            "Unable to get the options of %s: %s", workflow_klass, error
+        )
+        return None
+
+
+def workflow_metadata(
+    workflow_name: str,
+    workflow_klass: Type[Workflow],
+    entry_point: Optional[importlib.metadata.EntryPoint] = None,
+) -> WorkflowMetadata:
+    """Get the metadata of a workflow class.
+
+    Args:
+        workflow_name: Name the workflow is registered under.
+        workflow_klass: Workflow class.
+        entry_point: Entry point of the plugin that registered the workflow.
+    """
+    distribution = entry_point.dist if entry_point is not None else None
+    return {
+        "name": workflow_name,
+        "description": workflow_klass.description,
+        "options": _workflow_options(workflow_klass),
+        "module": workflow_klass.__module__,
+        "qualname": workflow_klass.__qualname__,
+        "plugin": _plugin_key(entry_point) if entry_point else "",
+        "distribution": (
+            distribution.metadata["Name"] if distribution else None
+        ),
+        "version": distribution.version if distribution else None,
+    }
+
+
+def load_workflow_class(metadata: WorkflowMetadata) -> Type[Workflow]:
+    """Import the class of a workflow from its metadata.
+
+    Raises:
+        SpeedwagonException: If the workflow can no longer be found.
+    """
+    try:
+        found: Any = importlib.import_module(metadata["module"])
+        for attribute in metadata["qualname"].split("."):
+            found = getattr(found, attribute)
+    except (ImportError, AttributeError) as error:
+        raise SpeedwagonException(
+            f"Unable to load workflow {metadata['name']}"
+        ) from error
+    return typing.cast(Type["Workflow"], found)
+
+
+class WorkflowDescriptor:
+    """Stands in for a workflow class until the class is really used.
+
+    The name, description and options of the workflow come from its
+    metadata. Creating a workflow from a descriptor, or getting any other
+    attribute of the class from it, imports the class first.
+
+    A descriptor is equal to the class it describes, so it can be used
+    wherever workflow classes are compared or looked up.
+    """
+
+    def __init__(self, metadata: WorkflowMetadata) -> None:
+        """Create a new descriptor for a workflow.
+
+        Args:
+            metadata: Metadata of the workflow, such as from a
+                :py:class:`WorkflowMetadataCache`.
+        """
+        self.metadata = metadata
+        self.__name__ = metadata["qualname"].rsplit(".", maxsplit=1)[-1]
+        self._workflow_class: Optional[Type[Workflow]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """Get the name of the workflow."""
+        return self.metadata["name"]
+
+    @property
+    def description(self) -> Optional[str]:
+        """Get the description of the workflow."""
+        return self.metadata["description"]
+
+    @property
+    def options(self) -> Optional[List[Dict[str, Any]]]:
+        """Get the serialized job options, if they were known when cached."""
+        return self.metadata["options"]
+
+    @property
+    def loaded(self) -> bool:
+        """Check if the workflow class has been imported."""
+        return self._workflow_class is not None
+
+    def load(self) -> Type[Workflow]:
+        """Get the workflow class, importing it the first time.
+
+        Raises:
+            SpeedwagonException: If the workflow can no longer be found.
+        """
+        with self._lock:
+            if self._workflow_class is None:
+                self._workflow_class = load_workflow_class(self.metadata)
+            return self._workflow_class
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Workflow:
+        """Create a new workflow object."""
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attribute: str) -> Any:
+        """Get any other attribute from the workflow class."""
+        if attribute.startswith("__") or attribute in {
+            "metadata",
+            "_workflow_class",
+            "_lock",
+        }:
+            raise AttributeError(attribute)
+        return getattr(self.load(), attribute)
+
+    def _key(self) -> typing.Tuple[str, str]:
+        return self.metadata["module"], self.metadata["qualname"]
+
+    def __eq__(self, other: object) -> bool:
+        """Check if other is the same workflow, without importing it."""
+        if isinstance(other, WorkflowDescriptor):
+            return self._key() == other._key()
+        if isinstance(other, type):
+            return self._key() == (other.__module__, other.__qualname__)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Get a hash of the workflow's location."""
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        """Get a representation of the descriptor for debugging."""
+        module, qualname = self._key()
+        return f"<{self.__class__.__name__} {module}.{qualname}>"
+
+
+WorkflowType = typing.Union[Type["Workflow"], WorkflowDescriptor]
+"""A workflow class, or a descriptor that stands in for one."""
+
+
+def _plugin_key(entry_point: importlib.metadata.EntryPoint) -> str:
+    return f"{entry_point.module}:{entry_point.name}"
+
+
+def _plugin_version(
+    entry_point: importlib.metadata.EntryPoint,
+) -> Optional[str]:
+    distribution = entry_point.dist
+    if distribution is None:
+        return None
+    return f"{distribution.metadata['Name']}=={distribution.version}"
+
+
+class WorkflowMetadataCache:
+    """Metadata of the workflows of each plugin, stored in a JSON file.
+
+    The cache can be shared by threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open a workflow metadata cache.
+
+        Args:
+            path: File path to the cache. It is created when the cache is
+                first saved.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._plugins: Dict[str, Dict[str, Any]] = self._read()
+        self._changed = False
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as error:
+            logger.warning(
+                "Ignoring unreadable workflow metadata cache %s: %s",
+                self.path,
+                error,
+            )
+            return {}
+        if not isinstance(data, dict) or \
+                data.get("format") != CACHE_FORMAT_VERSION:
+            return {}
+        return typing.cast(Dict[str, Dict[str, Any]], data["plugins"])
+
+    def plugin_workflows(
+        self,
+        entry_point: importlib.metadata.EntryPoint,
+        inclusion_filter: Optional[Callable[[Type[Workflow]], bool]] = None,
+    ) -> List[WorkflowMetadata]:
+        """Get the metadata of the workflows a plugin registers.
+
+        The plugin is only imported if the version of the distribution
+        that provides it has changed since its workflows were cached.
+
+        Args:
+            entry_point: Entry point of the plugin.
+            inclusion_filter: Only include workflows it returns True for.
+                Only used when the plugin is imported.
+
+        Raises:
+            SpeedwagonException: If the plugin has to be imported and
+                cannot be.
+        """
+        key = _plugin_key(entry_point)
+        version = _plugin_version(entry_point)
+        with self._lock:
+            cached = self._plugins.get(key)
+            if version is not None and cached is not None and (
+                cached["version"] == version
+                and cached["value"] == entry_point.value
+            ):
+                return typing.cast(
+                    List[WorkflowMetadata], cached["workflows"]
+                )
+        workflows = [
+            workflow_metadata(workflow_name, workflow_klass, entry_point)
+            for workflow_name, workflow_klass in (
+                speedwagon.plugins.get_workflows_from_plugin(
+                    entry_point, inclusion_filter
+                ).items()
+            )
+        ]
+        if version is not None:
+            with self._lock:
+                self._plugins[key] = {
+                    "version": version,
+                    "value": entry_point.value,
+                    "workflows": workflows,
+                }
+                self._changed = True
+        return workflows
+
+    def clear(self) -> None:
+        """Forget every plugin, so their workflows are listed again."""
+        with self._lock:
+            self._plugins.clear()
+            self._changed = True
+
+    def save(self) -> None:
+        """Write the cache to its file, if anything has changed.
+
+        The file is replaced in one step, so other processes reading it
+        never see it half written.
+        """
+        with self._lock:
+            if not self._changed:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            temp_file = os.path.join(
+                directory,
+                f".{os.path.basename(self.path)}.{uuid.uuid4().hex}.tmp",
+            )
+            try:
+                with open(temp_file, "x", encoding="utf-8") as cache_file:
+                    json.dump(
+                        {
+                            "format": CACHE_FORMAT_VERSION,
+                            "plugins": self._plugins,
+                        },
+                        cache_file,
+                    )
+                os.replace(temp_file, self.path)
+            except BaseException:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
+            self._changed = False
+
+
+def default_workflow_metadata_cache_path() -> str:
+    """Get the path to the workflow metadata cache in the app data dir."""
+    return os.path.join(
+        StandardConfigFileLocator(
+            DEFAULT_CONFIG_DIRECTORY_NAME
+        ).get_app_data_dir(),
+        WORKFLOW_METADATA_CACHE_FILE_NAME,
+    )
+
+
+_open_caches: Dict[str, WorkflowMetadataCache] = {}
+_open_caches_lock = threading.Lock()
+
+
+def open_workflow_metadata_cache(
+    path: Optional[str] = None,
+) -> WorkflowMetadataCache:
+    """Get the workflow metadata cache stored at a path.
+
+    Caches are opened once per process and shared after that.
+
+    Args:
+        path: File path to the cache. Defaults to
+            :py:func:`default_workflow_metadata_cache_path`.
+    """
+    path = os.path.abspath(path or default_workflow_metadata_cache_path())
+    with _open_caches_lock:
+        cache = _open_caches.get(path)
+        if cache is None:
+            cache = WorkflowMetadataCache(path)
+            _open_caches[path] = cache
+        return cache
@@ -0,0 +1,183 @@
+"""Checking that workflows can be used with the current settings.
+
+A workflow is checked by creating it with the global settings, which is
+how a workflow reports missing configuration. Some workflows touch the
+filesystem or network shares when they are created, so the checks run
+concurrently, each with a timeout. The result of each check is cached
+until the global settings or the workflow itself change.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import logging
+import queue
+import threading
+import time
+import typing
+from typing import Callable, Deque, Dict, Mapping, Optional, Tuple, Type
+
+from speedwagon.exceptions import SpeedwagonException
+from speedwagon.workflow_metadata import WorkflowDescriptor
+
+if typing.TYPE_CHECKING:
+    from speedwagon.workflow_metadata import WorkflowType
+
+__all__ = ["WorkflowValidator"]
+
+DEFAULT_VALIDATION_TIMEOUT = 10.0
+"""Seconds a workflow is given to be created before it is reported."""
+
+DEFAULT_VALIDATION_WORKERS = 8
+"""Number of workflows checked at the same time."""
+
+VALIDATION_ERRORS: Tuple[Type[BaseException], ...] = (
+    SpeedwagonException,
+    AttributeError,
+)
+"""Errors that mean a workflow cannot be used, rather than a bug."""
+
+logger = logging.getLogger(__name__)
+
+
+def _settings_key(global_settings: Mapping[str, object]) -> str:
+    return json.dumps(global_settings, sort_keys=True, default=str)
+
+
+def _workflow_key(workflow: WorkflowType) -> Tuple[Optional[str], ...]:
+    if isinstance(workflow, WorkflowDescriptor):
+        metadata = workflow.metadata
+        return metadata["module"], metadata["qualname"], metadata["version"]
+    return workflow.__module__, workflow.__qualname__, None
+
+
+class WorkflowValidator:
+    """Checks workflows concurrently and remembers the results.
+
+    A check that times out is reported as an error but not cached, so the
+    workflow is checked again next time. Its thread is left to finish in
+    the background and does not keep the application from exiting.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_VALIDATION_TIMEOUT,
+        max_workers: int = DEFAULT_VALIDATION_WORKERS,
+    ) -> None:
+        """Create a new workflow validator.
+
+        Args:
+            timeout: Seconds each workflow is given to be created.
+            max_workers: Number of workflows checked at the same time.
+        """
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._results: Dict[
+            Tuple[str, str, Tuple[Optional[str], ...]], Optional[str]
+        ] = {}
+
+    def invalidate(self) -> None:
+        """Forget every result, so each workflow is checked again."""
+        with self._lock:
+            self._results.clear()
+
+    @staticmethod
+    def _check(
+        name: str,
+        workflow: WorkflowType,
+        global_settings: Mapping[str, object],
+        results: queue.Queue,
+    ) -> None:
+        try:
+            workflow(global_settings=global_settings)
+        except VALIDATION_ERRORS as error:
+            results.put((name, str(error), None))
+        except BaseException as error:  # pylint: disable=broad-except
+            results.put((name, None, error))
+        else:
+            results.put((name, None, None))
+
+    def validate(
+        self,
+        workflows: Mapping[str, WorkflowType],
+        global_settings: Mapping[str, object],
+        on_result: Optional[Callable[[str, Optional[str]], None]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """Check that workflows can be created with the global settings.
+
+        Args:
+            workflows: Workflows to check, by name.
+            global_settings: Global settings to create them with.
+            on_result: Called in this thread with the name of each workflow
+                as soon as it has been checked, and its error message or
+                None if it is valid.
+
+        Returns:
+            The error message of each workflow by name, or None for each
+            workflow that is valid.
+
+        Raises:
+            Exception: Anything other than the expected validation errors
+                that was raised by a workflow.
+        """
+        settings_key = _settings_key(global_settings)
+        results: Dict[str, Optional[str]] = {}
+
+        def report(name: str, error: Optional[str]) -> None:
+            results[name] = error
+            if on_result is not None:
+                on_result(name, error)
+
+        pending: Deque[Tuple[str, WorkflowType]] = collections.deque()
+        for name, workflow in workflows.items():
+            key = (settings_key, name, _workflow_key(workflow))
+            with self._lock:
+                cached = key in self._results
+                error = self._results.get(key)
+            if cached:
+                report(name, error)
+            else:
+                pending.append((name, workflow))
+
+        finished: queue.Queue = queue.Queue()
+        running: Dict[str, Tuple[float, WorkflowType]] = {}
+        while pending or running:
+            while pending and len(running) < self.max_workers:
+                name, workflow = pending.popleft()
+                running[name] = (time.monotonic(), workflow)
+                threading.Thread(
+                    target=self._check,
+                    args=(name, workflow, global_settings, finished),
+                    name=f"Validate {name}",
+                    daemon=True,
+                ).start()
+            oldest = min(started for started, _ in running.values())
+            try:
+                name, error, unexpected = finished.get(
+                    timeout=max(0.0, oldest + self.timeout - time.monotonic())
+                )
+            except queue.Empty:
+                now = time.monotonic()
+                for name, (started, _) in list(running.items()):
+                    if now - started >= self.timeout:
+                        del running[name]
+                        logger.debug("Validating %s timed out", name)
+                        report(
+                            name,
+                            f"Timed out after {self.timeout:g} seconds",
+                        )
+                continue
+            if name not in running:
+                # Finished after it was reported as timed out.
+                continue
+            _, workflow = running.pop(name)
+            if unexpected is not None:
+                raise unexpected
+            with self._lock:
+                self._results[
+                    (settings_key, name, _workflow_key(workflow))
+                ] = error
+            report(name, error)
+        return results
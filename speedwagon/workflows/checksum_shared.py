@@ -8,4 +8,5 @@ class ResultsValues(enum.Enum):
 
     SOURCE_FILE = "source_filename"
     SOURCE_HASH = "checksum_hash"
+    SOURCE_HASHES = "checksum_hashes"
     CHECKSUM_FILE = "checksum_file"
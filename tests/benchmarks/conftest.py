@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+BENCHMARK_ENV_VARIABLE = "SPEEDWAGON_BENCHMARKS"
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.getenv(BENCHMARK_ENV_VARIABLE):
+        return
+    skip_benchmark = pytest.mark.skip(
+        reason=f"Set {BENCHMARK_ENV_VARIABLE}=1 to run benchmarks"
+    )
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+class BenchmarkReport:
+    def __init__(self, title):
+        self.title = title
+        self.rows = []
+
+    def add(self, name, value, units):
+        self.rows.append((name, value, units))
+
+    def render(self):
+        lines = [self.title, "-" * len(self.title)]
+        for name, value, units in self.rows:
+            lines.append(f"{name:<40} {value:>14.6f} {units}")
+        return "\n".join(lines)
+
+
+@pytest.fixture
+def benchmark_report(request, capsys):
+    report = BenchmarkReport(request.node.name)
+    yield report
+    with capsys.disabled():
+        print()
+        print(report.render())
+
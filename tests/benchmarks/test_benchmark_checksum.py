@@ -0,0 +1,118 @@
+"""Checksum throughput over a tree of mixed small and large files.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``. The size of
+the large files, in MiB, can be changed with SPEEDWAGON_BENCHMARK_LARGE_MIB.
+"""
+import hashlib
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from speedwagon.tasks import validation
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+SMALL_FILES = 2000
+SMALL_FILE_SIZE = 16 * 2 ** 10
+LARGE_FILES = 8
+LARGE_FILE_SIZE = (
+    int(os.getenv("SPEEDWAGON_BENCHMARK_LARGE_MIB", "64")) * 2 ** 20
+)
+
+
+@pytest.fixture(scope="module")
+def synthetic_tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("checksum_tree")
+    file_paths = []
+    for index in range(SMALL_FILES):
+        directory = root / f"package{index % 20}"
+        directory.mkdir(exist_ok=True)
+        path = directory / f"small{index}.txt"
+        path.write_bytes(os.urandom(SMALL_FILE_SIZE))
+        file_paths.append(str(path))
+    for index in range(LARGE_FILES):
+        path = root / f"large{index}.tif"
+        with open(path, "wb") as large_file:
+            for _ in range(LARGE_FILE_SIZE // 2 ** 20):
+                large_file.write(os.urandom(2 ** 20))
+        file_paths.append(str(path))
+    total_size = SMALL_FILES * SMALL_FILE_SIZE + LARGE_FILES * LARGE_FILE_SIZE
+    return file_paths, total_size
+
+
+def test_checksum_serial(benchmark_report, synthetic_tree):
+    file_paths, total_size = synthetic_tree
+    started = time.perf_counter()
+    for file_path in file_paths:
+        validation.calculate_md5_hash(file_path)
+    elapsed = time.perf_counter() - started
+    benchmark_report.add("files", len(file_paths), "")
+    benchmark_report.add("throughput", total_size / 2 ** 20 / elapsed, "MiB/s")
+
+
+@pytest.mark.parametrize("workers", [1, 4, 8])
+def test_checksum_parallel(benchmark_report, synthetic_tree, workers):
+    file_paths, total_size = synthetic_tree
+    started = time.perf_counter()
+    count = sum(
+        1 for _ in validation.calculate_hashes_in_parallel(file_paths, workers)
+    )
+    elapsed = time.perf_counter() - started
+    benchmark_report.add("files", count, "")
+    benchmark_report.add("workers", workers, "")
+    benchmark_report.add("throughput", total_size / 2 ** 20 / elapsed, "MiB/s")
+    assert count == len(file_paths)
+
+
+def _hash_with_read_calls(file_path):
+    md5_hash = hashlib.md5(usedforsecurity=False)
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(validation.CHUNK_SIZE), b""):
+            md5_hash.update(chunk)
+    return md5_hash.hexdigest()
+
+
+@pytest.mark.parametrize(
+    "hash_file",
+    [
+        _hash_with_read_calls,
+        validation.calculate_md5_hash,
+        lambda file_path: validation.calculate_md5_hash(
+            file_path, use_mmap=True
+        ),
+    ],
+    ids=["read", "readinto", "mmap"],
+)
+def test_large_file_read_method(benchmark_report, synthetic_tree, hash_file):
+    file_paths, _ = synthetic_tree
+    large_files = file_paths[-LARGE_FILES:]
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        for file_path in large_files:
+            hash_file(file_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    elapsed = time.perf_counter() - started
+    total_size = LARGE_FILES * LARGE_FILE_SIZE
+    benchmark_report.add("throughput", total_size / 2 ** 20 / elapsed, "MiB/s")
+    benchmark_report.add("peak traced memory", peak / 2 ** 20, "MiB")
+
+
+@pytest.mark.parametrize("single_pass", [False, True], ids=["n_pass", "1_pass"])
+def test_multiple_algorithms(benchmark_report, synthetic_tree, single_pass):
+    file_paths, total_size = synthetic_tree
+    algorithms = ("md5", "sha1", "sha256")
+    started = time.perf_counter()
+    for file_path in file_paths:
+        if single_pass:
+            validation.calculate_hashes(file_path, algorithms)
+        else:
+            for algorithm in algorithms:
+                validation.calculate_hashes(file_path, [algorithm])
+    elapsed = time.perf_counter() - started
+    benchmark_report.add("algorithms", len(algorithms), "")
+    benchmark_report.add("throughput", total_size / 2 ** 20 / elapsed, "MiB/s")
@@ -0,0 +1,58 @@
+"""Peak memory of writing a checksum report with many entries.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``. The number of
+entries can be changed with SPEEDWAGON_BENCHMARK_REPORT_ENTRIES.
+"""
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from speedwagon.tasks import validation
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ENTRIES = int(os.getenv("SPEEDWAGON_BENCHMARK_REPORT_ENTRIES", "500000"))
+
+
+def entries():
+    for index in range(ENTRIES):
+        # Reverse order, so the report has sorting to do.
+        number = ENTRIES - index
+        yield f"package{number % 1000}/{number:09d}.tif", f"{number:032x}"
+
+
+def _build_in_memory(output_filename):
+    report = validation.ChecksumReport()
+    for filename, hash_value in entries():
+        report.add_entry(filename, hash_value)
+    with open(output_filename, "w", encoding="utf-8") as write_file:
+        write_file.write(report.build())
+
+
+def _write_streaming(output_filename):
+    with validation.ChecksumReportWriter(output_filename) as writer:
+        for filename, hash_value in entries():
+            writer.add_entry(filename, hash_value)
+        writer.write()
+
+
+@pytest.mark.parametrize(
+    "write_report",
+    [_build_in_memory, _write_streaming],
+    ids=["in_memory", "streaming"],
+)
+def test_checksum_report(benchmark_report, tmp_path, write_report):
+    output_filename = str(tmp_path / "checksum.md5")
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        write_report(output_filename)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    elapsed = time.perf_counter() - started
+    benchmark_report.add("entries", ENTRIES, "")
+    benchmark_report.add("elapsed", elapsed, "s")
+    benchmark_report.add("peak traced memory", peak / 2 ** 20, "MiB")
@@ -0,0 +1,96 @@
+"""Time taken to walk a synthetic deep directory tree.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``. The number of
+directories can be changed with SPEEDWAGON_BENCHMARK_DIRECTORIES.
+
+Network shares are simulated by adding a delay to every os.scandir call.
+"""
+import os
+import time
+
+import pytest
+
+from speedwagon.tasks import directory_snapshot, packaging
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+DIRECTORIES = int(os.getenv("SPEEDWAGON_BENCHMARK_DIRECTORIES", "2000"))
+FILES_PER_DIRECTORY = 20
+BRANCHING = 4
+SCANDIR_LATENCY = 0.002
+
+
+@pytest.fixture(scope="module")
+def synthetic_tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("walk_tree")
+    directories = [root]
+    for index in range(1, DIRECTORIES):
+        parent = directories[(index - 1) // BRANCHING]
+        directory = parent / f"d{index}"
+        directory.mkdir()
+        directories.append(directory)
+    for directory in directories:
+        for index in range(FILES_PER_DIRECTORY):
+            (directory / f"{index}.tif").touch()
+    an_hour_ago = time.time() - 60 * 60
+    for directory in directories:
+        os.utime(directory, (an_hour_ago, an_hour_ago))
+    return str(root)
+
+
+def _count_files(walk):
+    return sum(len(filenames) for _, _, filenames in walk)
+
+
+def test_directory_snapshot(benchmark_report, synthetic_tree, tmp_path):
+    with directory_snapshot.DirectorySnapshot(
+        str(tmp_path / "snapshot.sqlite")
+    ) as snapshot:
+        for run in ("first", "second"):
+            started = time.perf_counter()
+            files = _count_files(snapshot.walk(synthetic_tree))
+            benchmark_report.add(
+                f"elapsed, {run} run", time.perf_counter() - started, "s"
+            )
+            assert files == DIRECTORIES * FILES_PER_DIRECTORY
+
+
+@pytest.fixture(params=[0, SCANDIR_LATENCY], ids=["local", "latency"])
+def scandir_latency(request, monkeypatch):
+    latency = request.param
+    if latency:
+        scandir = os.scandir
+
+        def slow_scandir(path="."):
+            time.sleep(latency)
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", slow_scandir)
+    return latency
+
+
+def test_os_walk_with_latency(
+    benchmark_report, synthetic_tree, scandir_latency
+):
+    started = time.perf_counter()
+    files = _count_files(os.walk(synthetic_tree))
+    benchmark_report.add("scandir latency", scandir_latency, "s")
+    benchmark_report.add("elapsed", time.perf_counter() - started, "s")
+    assert files == DIRECTORIES * FILES_PER_DIRECTORY
+
+
+@pytest.mark.parametrize("workers", [1, 4, 16])
+def test_walk_directory_tree(
+    benchmark_report, synthetic_tree, scandir_latency, workers
+):
+    started = time.perf_counter()
+    files = sum(
+        1
+        for _ in packaging.walk_directory_tree(
+            synthetic_tree, max_workers=workers
+        )
+    )
+    benchmark_report.add("scandir latency", scandir_latency, "s")
+    benchmark_report.add("workers", workers, "")
+    benchmark_report.add("elapsed", time.perf_counter() - started, "s")
+    assert files == DIRECTORIES * FILES_PER_DIRECTORY
@@ -0,0 +1,141 @@
+"""Compare the blocking task dispatcher against the old spinning loop.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``.
+"""
+import queue
+import time
+
+import pytest
+
+import speedwagon
+from speedwagon import runner_strategies
+from speedwagon.frontend.reporter import RunnerDisplay
+from speedwagon.tasks import Subtask
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+IDLE_SECONDS = 1.0
+TASK_COUNT = 2000
+
+
+class SpinningDispatcherRunning(runner_strategies.TaskDispatcherRunning):
+    """The dispatcher loop prior to blocking on the queue."""
+
+    def processing_process(self, stop_event, job_finished_event):
+        while not stop_event.is_set():
+            if self.parent.job_queue.empty():
+                continue
+            item = self.parent.job_queue.get()
+            if item is runner_strategies.STOP_DISPATCHING:
+                self.parent.job_queue.task_done()
+                continue
+            item.exec()
+            self.parent.job_queue.task_done()
+        job_finished_event.set()
+
+
+def cpu_seconds_while(func):
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    func()
+    return (
+        time.process_time() - cpu_start,
+        time.perf_counter() - wall_start
+    )
+
+
+class NoopTask(Subtask):
+    def work(self) -> bool:
+        return True
+
+
+def start_dispatcher(job_queue, spinning):
+    dispatcher = runner_strategies.TaskDispatcher(job_queue)
+    if spinning:
+        state = SpinningDispatcherRunning(dispatcher)
+        dispatcher.current_state = state
+        state.run_thread()
+    else:
+        dispatcher.start()
+    return dispatcher
+
+
+@pytest.mark.parametrize("spinning", [False, True], ids=["blocking", "spinning"])
+def test_idle_cpu_usage(benchmark_report, spinning):
+    dispatcher = start_dispatcher(queue.Queue(), spinning)
+    try:
+        cpu, wall = cpu_seconds_while(lambda: time.sleep(IDLE_SECONDS))
+    finally:
+        dispatcher.stop()
+    benchmark_report.add("CPU seconds per idle second", cpu / wall, "s/s")
+    if not spinning:
+        assert cpu / wall < 0.1
+
+
+@pytest.mark.parametrize("spinning", [False, True], ids=["blocking", "spinning"])
+def test_dispatch_latency(benchmark_report, spinning):
+    job_queue = queue.Queue(maxsize=1)
+    dispatcher = start_dispatcher(job_queue, spinning)
+    latencies = []
+    try:
+        for _ in range(TASK_COUNT):
+            task = NoopTask()
+            started = time.perf_counter()
+            job_queue.put(task)
+            job_queue.join()
+            latencies.append(time.perf_counter() - started)
+    finally:
+        dispatcher.stop()
+    latencies.sort()
+    benchmark_report.add(
+        "mean dispatch latency", sum(latencies) / len(latencies) * 1e6, "us"
+    )
+    benchmark_report.add(
+        "p99 dispatch latency",
+        latencies[int(len(latencies) * 0.99)] * 1e6,
+        "us"
+    )
+
+
+class SleepTask(Subtask):
+    def work(self) -> bool:
+        time.sleep(IDLE_SECONDS)
+        return True
+
+
+class SleepWorkflow(speedwagon.Workflow):
+    name = "sleep"
+
+    def discover_task_metadata(self, *args, **kwargs):
+        return [{}]
+
+    def create_new_task(self, task_builder, job_args):
+        task_builder.add_subtask(SleepTask())
+
+
+class NullReporter(RunnerDisplay):
+    def __init__(self):
+        super().__init__()
+        self.refresh_count = 0
+
+    def refresh(self):
+        self.refresh_count += 1
+
+    @property
+    def user_canceled(self):
+        return False
+
+
+def test_scheduler_wait_cpu_usage(benchmark_report):
+    scheduler = runner_strategies.TaskScheduler(".")
+    scheduler.request_more_info = lambda *_: {}
+    reporter = NullReporter()
+    scheduler.reporter = reporter
+    cpu, wall = cpu_seconds_while(
+        lambda: scheduler.run(SleepWorkflow(), {})
+    )
+    benchmark_report.add("CPU seconds per second of waiting", cpu / wall, "s/s")
+    benchmark_report.add(
+        "reporter refreshes per second", reporter.refresh_count / wall, "Hz"
+    )
+    assert cpu / wall < 0.1
@@ -0,0 +1,52 @@
+"""Time taken to remove many files with one task per file or in bulk.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``. The number of
+files can be changed with SPEEDWAGON_BENCHMARK_REMOVAL_FILES.
+"""
+import os
+import time
+
+import pytest
+
+from speedwagon.tasks import filesystem
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+FILES = int(os.getenv("SPEEDWAGON_BENCHMARK_REMOVAL_FILES", "20000"))
+FILES_PER_DIRECTORY = 100
+
+
+@pytest.fixture
+def derivative_files(tmp_path):
+    paths = []
+    for index in range(FILES):
+        directory = tmp_path / f"package{index // FILES_PER_DIRECTORY}"
+        if index % FILES_PER_DIRECTORY == 0:
+            directory.mkdir()
+        path = directory / f"{index}.jp2"
+        path.touch()
+        paths.append(str(path))
+    return tmp_path, paths
+
+
+def test_task_per_file(benchmark_report, derivative_files):
+    _, paths = derivative_files
+    started = time.perf_counter()
+    for path in paths:
+        filesystem.delete_file(path).exec()
+    benchmark_report.add("files", len(paths), "")
+    benchmark_report.add("elapsed", time.perf_counter() - started, "s")
+
+
+@pytest.mark.parametrize("workers", [1, 8])
+def test_bulk(benchmark_report, derivative_files, workers):
+    root, paths = derivative_files
+    started = time.perf_counter()
+    task = filesystem.delete_files(
+        paths, max_workers=workers, prune_empty_directories_in=str(root)
+    )
+    task.exec()
+    benchmark_report.add("files", len(paths), "")
+    benchmark_report.add("workers", workers, "")
+    benchmark_report.add("elapsed", time.perf_counter() - started, "s")
+    assert task.task_result.data["removed"] == len(paths)
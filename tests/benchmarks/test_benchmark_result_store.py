@@ -0,0 +1,80 @@
+"""Peak memory of collecting job results in memory or spilled to disk.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``. The number of
+synthetic items can be changed with SPEEDWAGON_BENCHMARK_ITEMS.
+"""
+import os
+import time
+import tracemalloc
+
+import pytest
+
+import speedwagon
+from speedwagon import result_store, runner_strategies
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITEMS = int(os.getenv("SPEEDWAGON_BENCHMARK_ITEMS", "500000"))
+
+
+class ReportingTask(speedwagon.tasks.Subtask):
+    def __init__(self, item):
+        super().__init__()
+        self.item = item
+
+    def work(self) -> bool:
+        self.set_results({"item": self.item, "path": f"/data/{self.item}"})
+        return True
+
+
+class ReportingWorkflow(speedwagon.Workflow):
+    name = "reporting"
+
+    def discover_task_metadata(self, initial_results, additional_data,
+                               user_args):
+        for item in range(ITEMS):
+            yield {"item": item}
+
+    def create_new_task(self, task_builder, job_args):
+        task_builder.add_subtask(ReportingTask(job_args["item"]))
+
+    @classmethod
+    def generate_report(cls, results, user_args):
+        return f"{sum(1 for _ in results)} items"
+
+
+@pytest.mark.parametrize(
+    "result_store_factory",
+    [
+        result_store.InMemoryResultStore,
+        result_store.SpillingResultStore,
+        lambda: result_store.SpillingResultStore(
+            spill_store_factory=result_store.SQLiteResultStore
+        ),
+    ],
+    ids=["memory", "spill-file", "spill-sqlite"]
+)
+def test_result_store_memory(benchmark_report, result_store_factory):
+    scheduler = runner_strategies.TaskScheduler(".")
+    scheduler.request_more_info = lambda *_: {}
+    scheduler.task_generator_strategy = \
+        runner_strategies.TaskGeneratorStrategy(
+            result_store_factory=result_store_factory
+        )
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        for task in scheduler.iter_tasks(ReportingWorkflow(), {}):
+            task.exec()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    total = time.perf_counter() - started
+
+    results = scheduler.task_generator_strategy.results()
+    benchmark_report.add("items", ITEMS, "")
+    benchmark_report.add("peak traced memory", peak / 2 ** 20, "MiB")
+    benchmark_report.add("total time", total, "s")
+    assert len(results) == ITEMS
+    results.close()
@@ -0,0 +1,83 @@
+"""Peak memory and time to first task for streaming task generation.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``. The number of
+synthetic items can be changed with SPEEDWAGON_BENCHMARK_ITEMS.
+"""
+import os
+import time
+import tracemalloc
+
+import pytest
+
+import speedwagon
+from speedwagon import runner_strategies
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+ITEMS = int(os.getenv("SPEEDWAGON_BENCHMARK_ITEMS", "500000"))
+
+
+class NoResultTask(speedwagon.tasks.Subtask):
+    def __init__(self, item):
+        super().__init__()
+        self.item = item
+
+    def work(self) -> bool:
+        return True
+
+
+class SyntheticWorkflow(speedwagon.Workflow):
+    name = "synthetic"
+
+    def discover_task_metadata(self, initial_results, additional_data,
+                               user_args):
+        return [{"item": item} for item in range(ITEMS)]
+
+    def create_new_task(self, task_builder, job_args):
+        task_builder.add_subtask(NoResultTask(job_args["item"]))
+
+
+class SyntheticGeneratorWorkflow(SyntheticWorkflow):
+    name = "synthetic generator"
+
+    def discover_task_metadata(self, initial_results, additional_data,
+                               user_args):
+        for item in range(ITEMS):
+            yield {"item": item}
+
+
+@pytest.mark.parametrize(
+    "streaming, workflow_class",
+    [
+        (True, SyntheticGeneratorWorkflow),
+        (True, SyntheticWorkflow),
+        (False, SyntheticWorkflow),
+    ],
+    ids=["generator", "streaming", "eager"]
+)
+def test_task_generation_memory(benchmark_report, streaming, workflow_class):
+    scheduler = runner_strategies.TaskScheduler(".")
+    scheduler.request_more_info = lambda *_: {}
+    scheduler.task_generator_strategy = \
+        runner_strategies.TaskGeneratorStrategy(streaming=streaming)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    first_task = None
+    count = 0
+    try:
+        for task in scheduler.iter_tasks(workflow_class(), {}):
+            if first_task is None:
+                first_task = time.perf_counter() - started
+            task.exec()
+            count += 1
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    total = time.perf_counter() - started
+
+    benchmark_report.add("items", ITEMS, "")
+    benchmark_report.add("peak traced memory", peak / 2 ** 20, "MiB")
+    benchmark_report.add("time to first task", first_task, "s")
+    benchmark_report.add("total time", total, "s")
+    assert count == ITEMS
@@ -0,0 +1,36 @@
+"""Time taken to look up a workflow when a job is submitted.
+
+Run with ``SPEEDWAGON_BENCHMARKS=1 pytest tests/benchmarks``.
+"""
+import time
+
+import pytest
+
+import speedwagon.job
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+SUBMISSIONS = 20
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[GLOBAL]\n")
+    return str(config_file)
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_submit_job_lookup(benchmark_report, config_file, cached):
+    registry = speedwagon.job.WorkflowRegistry()
+    started = time.perf_counter()
+    for _ in range(SUBMISSIONS):
+        if not cached:
+            registry.invalidate()
+        strategy = speedwagon.job.FindAllWorkflowsPluggyStrategy(
+            config_file=config_file, registry=registry
+        )
+        speedwagon.job.available_workflows(strategy)
+    elapsed = time.perf_counter() - started
+    benchmark_report.add("submissions", SUBMISSIONS, "")
+    benchmark_report.add("per submission", elapsed / SUBMISSIONS * 1000, "ms")
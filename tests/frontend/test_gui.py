@@ -196,3 +196,51 @@ class TestItemTabsWidget:
     def test_empty_current_tab_is_none(self, qtbot):
         tabs_widget = ItemTabsWidget()
         assert tabs_widget.current_tab is None
+
+    def test_validation_keeps_selection(self, qtbot):
+        class SpamWorkflow(Workflow):
+            name = "spam"
+
+            def discover_task_metadata(self, *args, **kwargs):
+                return []
+
+        tabs_widget = ItemTabsWidget()
+        qtbot.add_widget(tabs_widget)
+        tabs_widget.session_config = Mock(
+            speedwagon.config.config.AbsConfigSettings,
+            application_settings=Mock(return_value={}),
+        )
+        tabs_widget.add_workflows_tab("All", [SpamWorkflow])
+        tab = tabs_widget.current_tab
+        selection_view = tab.workflow_selector.workflowSelectionView
+        selection_view.setCurrentIndex(tab.model().index(0, 0))
+        assert tab.start_button.isEnabled()
+
+        tabs_widget.set_workflow_validation("spam", validating=True)
+        assert not tab.start_button.isEnabled()
+
+        tabs_widget.set_workflow_validation("spam")
+        assert tabs_widget.current_tab is tab
+        assert selection_view.currentIndex().row() == 0
+        assert tab.start_button.isEnabled()
+
+    def test_workflow_selected_forwarded(self, qtbot):
+        class SpamWorkflow(Workflow):
+            name = "spam"
+
+            def discover_task_metadata(self, *args, **kwargs):
+                return []
+
+        tabs_widget = ItemTabsWidget()
+        qtbot.add_widget(tabs_widget)
+        tabs_widget.session_config = Mock(
+            speedwagon.config.config.AbsConfigSettings,
+            application_settings=Mock(return_value={}),
+        )
+        tabs_widget.add_workflows_tab("All", [SpamWorkflow])
+        tab = tabs_widget.current_tab
+        with qtbot.wait_signal(tabs_widget.workflow_selected) as blocker:
+            tab.workflow_selector.workflowSelectionView.setCurrentIndex(
+                tab.model().index(0, 0)
+            )
+        assert blocker.args == [SpamWorkflow]
@@ -28,6 +28,7 @@ import speedwagon.workflows.builtin
 from speedwagon.tasks import system as system_tasks
 from speedwagon.job import AbsWorkflowFinder
 import speedwagon.startup
+import speedwagon.workflow_metadata
 
 def test_standalone_tab_editor_loads(qtbot, monkeypatch):
     TabsEditorApp = MagicMock()
@@ -415,6 +416,77 @@ class TestStartQtThreaded:
         starter.load_workflows()
         assert load_custom_tabs.called is False
 
+    def test_invalid_workflow_item_updated(self, starter):
+        starter.windows = Mock()
+        starter._workflow_validated("spam", "bad")
+        starter.windows.set_workflow_validation.assert_called_once_with(
+            "spam", error="bad"
+        )
+        starter.windows.clear_tabs.assert_not_called()
+        starter.windows.console.add_message.assert_called_once()
+
+    def test_valid_workflow_item_updated(self, starter):
+        starter.windows = Mock()
+        starter._workflow_validated("spam", None)
+        starter.windows.set_workflow_validation.assert_called_once_with(
+            "spam", error=None
+        )
+        starter.windows.console.add_message.assert_not_called()
+
+    def test_only_imported_workflows_validated_at_load(
+        self, starter, monkeypatch
+    ):
+        starter.windows = Mock()
+        imported = Mock(loaded=True)
+        not_imported = speedwagon.workflow_metadata.WorkflowDescriptor(
+            {
+                "module": "speedwagon_not_imported_plugin",
+                "qualname": "Spam",
+                "version": None,
+                "name": "spam",
+                "description": None,
+                "options": [],
+            }
+        )
+        monkeypatch.setattr(
+            gui_startup,
+            "get_active_workflow_descriptors",
+            lambda *_: {"spam": not_imported, "eggs": imported},
+        )
+        monkeypatch.setattr(starter, "_show_workflows", Mock())
+        start = Mock()
+        monkeypatch.setattr(starter.workflow_validation, "start", start)
+        starter.load_workflows()
+        assert list(start.call_args.args[0]) == ["eggs"]
+        starter.windows.set_workflow_validation.assert_called_once_with(
+            "eggs", validating=True
+        )
+
+        starter._validate_selected_workflow(not_imported)
+        assert start.call_args.args[0] == {"spam": not_imported}
+        starter._validate_selected_workflow(not_imported)
+        assert start.call_count == 2
+
+    def test_unreported_workflows_validated_on_selection(
+        self, starter, monkeypatch
+    ):
+        starter.windows = Mock()
+        monkeypatch.setattr(
+            gui_startup, "report_exception_dialog", Mock()
+        )
+        spam = Mock()
+        spam.name = "spam"
+        starter._workflow_validation_failed(
+            RuntimeError("bad"), {"spam": spam}
+        )
+        starter.windows.set_workflow_validation.assert_called_once_with(
+            "spam"
+        )
+        start = Mock()
+        monkeypatch.setattr(starter.workflow_validation, "start", start)
+        starter._validate_selected_workflow(spam)
+        assert start.call_args.args[0] == {"spam": spam}
+
     def test_save_log_opens_dialog(self, qtbot, monkeypatch, starter):
         from PySide6 import QtWidgets
         getSaveFileName = Mock(
@@ -1180,6 +1252,11 @@ def test_build_request_settings_dialog2(qtbot, monkeypatch):
     def get_active_workflows(config_file, workflow_finder=None):
         return {}
     monkeypatch.setattr(gui_startup, "get_active_workflows", get_active_workflows)
+    monkeypatch.setattr(
+        gui_startup,
+        "get_active_workflow_descriptors",
+        lambda config_file: {}
+    )
     initialize_workflows = Mock(name="initialize_workflows", return_value=[])
     monkeypatch.setattr(speedwagon.workflow, "initialize_workflows", initialize_workflows)
     monkeypatch.setattr(
@@ -1364,4 +1441,62 @@ def test_request_system_info(qtbot, monkeypatch):
     parent = QtWidgets.QWidget()
     qtbot.add_widget(parent)
     gui_startup.request_system_info(parent)
-    dialog.exec.assert_called_once()
\ No newline at end of file
+    dialog.exec.assert_called_once()
+
+class TestWorkflowValidationRunner:
+    @staticmethod
+    def validator(results):
+        def validate(workflows, global_settings, on_result):
+            for name in workflows:
+                on_result(name, results.get(name))
+            return {name: results.get(name) for name in workflows}
+        return Mock(validate=Mock(side_effect=validate))
+
+    def test_each_workflow_reported(self, qtbot):
+        runner = gui_startup.WorkflowValidationRunner(
+            self.validator({"spam": "bad"})
+        )
+        validated = Mock()
+        runner.validated.connect(validated)
+        with qtbot.wait_signal(runner.finished):
+            runner.start({"spam": Mock(), "eggs": Mock()}, {})
+        validated.assert_has_calls(
+            [call("spam", "bad"), call("eggs", None)], any_order=True
+        )
+        assert runner.running is False
+
+    def test_validations_run_alongside(self, qtbot):
+        runner = gui_startup.WorkflowValidationRunner(self.validator({}))
+        validated = Mock()
+        runner.validated.connect(validated)
+        runner.start({"spam": Mock()}, {})
+        runner.start({"eggs": Mock()}, {})
+        qtbot.wait_until(lambda: not runner.running)
+        assert validated.call_count == 2
+
+    def test_reset_drops_earlier_validations(self, qtbot):
+        runner = gui_startup.WorkflowValidationRunner(self.validator({}))
+        validated = Mock()
+        runner.validated.connect(validated)
+        runner.start({"spam": Mock()}, {})
+        runner.reset()
+        with qtbot.wait_signal(runner.finished):
+            runner.start({"eggs": Mock()}, {})
+        qtbot.wait(50)
+        validated.assert_called_once_with("eggs", None)
+
+    def test_validation_error_emitted_not_raised(self, qtbot):
+        error = RuntimeError("spam")
+
+        def validate(workflows, global_settings, on_result):
+            on_result("eggs", None)
+            raise error
+
+        runner = gui_startup.WorkflowValidationRunner(
+            Mock(validate=Mock(side_effect=validate))
+        )
+        spam = Mock()
+        with qtbot.wait_signal(runner.failed) as blocker:
+            runner.start({"spam": spam, "eggs": Mock()}, {})
+        assert blocker.args == [error, {"spam": spam}]
+        assert runner.running is False
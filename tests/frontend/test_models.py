@@ -415,6 +415,43 @@ class TestTabsTreeModel:
         )
         assert model.rowCount(model.index(0, 0)) == 1
 
+    def test_workflow_disabled_while_validating(self, qtbot, model):
+        model.append_workflow_tab("Dummy tab", [TestTabsTreeModel.SpamWorkflow])
+        model.append_workflow_tab("All", [TestTabsTreeModel.SpamWorkflow])
+        model.set_workflow_validation("spam", validating=True)
+        for tab_row in range(2):
+            index = model.index(0, 0, parent=model.index(tab_row, 0))
+            assert not model.flags(index) & QtCore.Qt.ItemFlag.ItemIsEnabled
+            assert (
+                model.data(index, QtCore.Qt.ItemDataRole.ToolTipRole)
+                == "Validating..."
+            )
+
+    def test_invalid_workflow_stays_disabled(self, qtbot, model):
+        model.append_workflow_tab(
+            "Dummy tab",
+            [TestTabsTreeModel.SpamWorkflow, TestTabsTreeModel.BaconWorkflow],
+        )
+        model.set_workflow_validation("spam", validating=True)
+        with qtbot.wait_signal(model.dataChanged):
+            model.set_workflow_validation("spam", error="bad")
+        spam_index = model.index(0, 0, parent=model.index(0, 0))
+        bacon_index = model.index(1, 0, parent=model.index(0, 0))
+        assert not model.flags(spam_index) & QtCore.Qt.ItemFlag.ItemIsEnabled
+        assert (
+            model.data(spam_index, QtCore.Qt.ItemDataRole.ToolTipRole)
+            == "bad"
+        )
+        assert model.flags(bacon_index) & QtCore.Qt.ItemFlag.ItemIsEnabled
+
+    def test_valid_workflow_enabled(self, qtbot, model):
+        model.append_workflow_tab("Dummy tab", [TestTabsTreeModel.SpamWorkflow])
+        model.set_workflow_validation("spam", validating=True)
+        model.set_workflow_validation("spam")
+        index = model.index(0, 0, parent=model.index(0, 0))
+        assert model.flags(index) & QtCore.Qt.ItemFlag.ItemIsEnabled
+        assert model.data(index, QtCore.Qt.ItemDataRole.ToolTipRole) is None
+
     def test_tab_names(self, qtbot):
         model = models.TabsTreeModel()
         model.append_workflow_tab("Dummy tab")
@@ -663,6 +700,20 @@ class TestTabStandardItem:
         with qtbot.wait_signal(model.dataChanged):
             item.append_workflow(TestTabStandardItem.SpamWorkflow)
 
+    def test_descriptor_not_loaded_to_display(self):
+        from speedwagon import workflow_metadata
+        metadata = workflow_metadata.workflow_metadata(
+            "spam", TestTabStandardItem.SpamWorkflow
+        )
+        metadata["description"] = "cached description"
+        descriptor = workflow_metadata.WorkflowDescriptor(metadata)
+        model = models.TabsTreeModel()
+        model.append_workflow_tab("All", [descriptor])
+        workflow_index = model.index(0, 1, parent=model.index(0, 0))
+        assert model.data(workflow_index) == "cached description"
+        assert descriptor.loaded is False
+        assert TestTabStandardItem.SpamWorkflow in model.get_tab("All")
+
 
 class TestWorkflowListProxyModel:
 
@@ -1055,6 +1106,38 @@ class TestTabProxyModel:
         tab_model.sort(0)
 
 
+    def test_source_data_changed_forwarded(self, qtbot, base_model):
+        base_model.append_workflow_tab(
+            "Dummy tab", [TestTabProxyModel.DummyWorkflow]
+        )
+        base_model.append_workflow_tab(
+            "Spam tab", [TestTabProxyModel.SpamWorkflow]
+        )
+        tab_model = models.TabProxyModel()
+        tab_model.setSourceModel(base_model)
+        tab_model.set_source_tab("Spam tab")
+        with qtbot.wait_signal(tab_model.dataChanged) as blocker:
+            base_model.set_workflow_validation("Spam", validating=True)
+        assert blocker.args[0].row() == 0
+        assert not (
+            tab_model.flags(tab_model.index(0, 0))
+            & QtCore.Qt.ItemFlag.ItemIsEnabled
+        )
+
+    def test_other_tab_data_changed_not_forwarded(self, qtbot, base_model):
+        base_model.append_workflow_tab(
+            "Dummy tab", [TestTabProxyModel.DummyWorkflow]
+        )
+        base_model.append_workflow_tab(
+            "Spam tab", [TestTabProxyModel.SpamWorkflow]
+        )
+        tab_model = models.TabProxyModel()
+        tab_model.setSourceModel(base_model)
+        tab_model.set_source_tab("Spam tab")
+        with qtbot.assert_not_emitted(tab_model.dataChanged):
+            base_model.set_workflow_validation("Dummy 1", validating=True)
+
+
 class TestWorkflowList:
     class SpamWorkflow(speedwagon.Workflow):
         name = "Spam"
@@ -0,0 +1,211 @@
+import hashlib
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from speedwagon.tasks import checksum_cache, validation
+
+
+@pytest.fixture
+def old_file(tmp_path):
+    path = tmp_path / "dummy.txt"
+    path.write_bytes(b"0000000000")
+    an_hour_ago = time.time() - 60 * 60
+    os.utime(path, (an_hour_ago, an_hour_ago))
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with checksum_cache.ChecksumCache(
+        str(tmp_path / "cache.sqlite")
+    ) as new_cache:
+        yield new_cache
+
+
+class TestChecksumCache:
+    def test_hit_after_miss(self, cache, old_file):
+        calculate = Mock(return_value={"md5": "abc"})
+        statistics = checksum_cache.CacheStatistics()
+        for _ in range(3):
+            assert cache.hash_file(
+                old_file, ["md5"], calculate, statistics=statistics
+            ) == {"md5": "abc"}
+        calculate.assert_called_once_with(old_file, ["md5"])
+        assert statistics == checksum_cache.CacheStatistics(hits=2, misses=1)
+        assert cache.statistics == statistics
+
+    def test_only_missing_algorithms_calculated(self, cache, old_file):
+        cache.hash_file(
+            old_file, ["md5"], Mock(return_value={"md5": "abc"})
+        )
+        calculate = Mock(return_value={"sha1": "def"})
+        assert cache.hash_file(old_file, ["sha1", "md5"], calculate) == {
+            "sha1": "def",
+            "md5": "abc",
+        }
+        calculate.assert_called_once_with(old_file, ["sha1"])
+
+    def test_changed_file_is_a_miss(self, cache, old_file):
+        cache.hash_file(old_file, ["md5"], Mock(return_value={"md5": "abc"}))
+        os.utime(old_file, (time.time() - 30, time.time() - 30))
+        calculate = Mock(return_value={"md5": "def"})
+        assert cache.hash_file(old_file, ["md5"], calculate) == {"md5": "def"}
+
+    def test_force(self, cache, old_file):
+        cache.hash_file(old_file, ["md5"], Mock(return_value={"md5": "abc"}))
+        calculate = Mock(return_value={"md5": "def"})
+        assert cache.hash_file(
+            old_file, ["md5"], calculate, force=True
+        ) == {"md5": "def"}
+        assert cache.hash_file(old_file, ["md5"], Mock()) == {"md5": "def"}
+
+    def test_recently_modified_file_not_cached(self, cache, tmp_path):
+        path = tmp_path / "new.txt"
+        path.write_bytes(b"new")
+        cache.hash_file(str(path), ["md5"], Mock(return_value={"md5": "abc"}))
+        assert len(cache) == 0
+
+    def test_zero_inode_not_cached(self, cache, old_file, monkeypatch):
+        monkeypatch.setattr(
+            checksum_cache,
+            "file_identity",
+            lambda file_path: (1, 0, 10, 0),
+        )
+        calculate = Mock(return_value={"md5": "abc"})
+        for _ in range(2):
+            cache.hash_file(old_file, ["md5"], calculate)
+        assert calculate.call_count == 2
+        assert len(cache) == 0
+
+    def test_same_identity_other_path_is_a_miss(
+        self, cache, old_file, tmp_path, monkeypatch
+    ):
+        other_file = tmp_path / "other.txt"
+        other_file.write_bytes(b"1111111111")
+        identity = checksum_cache.file_identity(old_file)
+        monkeypatch.setattr(
+            checksum_cache, "file_identity", lambda file_path: identity
+        )
+        cache.hash_file(old_file, ["md5"], Mock(return_value={"md5": "abc"}))
+        calculate = Mock(return_value={"md5": "def"})
+        assert cache.hash_file(str(other_file), ["md5"], calculate) == {
+            "md5": "def"
+        }
+        calculate.assert_called_once_with(str(other_file), ["md5"])
+
+    def test_evict_by_age(self, cache, old_file):
+        cache.hash_file(old_file, ["md5"], Mock(return_value={"md5": "abc"}))
+        cache.max_age = -1
+        assert cache.evict() == 1
+        assert len(cache) == 0
+
+    def test_evict_least_recently_used(self, cache, tmp_path):
+        identities = [(1, inode, 10, 0) for inode in range(5)]
+        for identity in identities:
+            cache.put(identity, {"md5": str(identity[1])})
+        cache.max_entries = 2
+        assert cache.evict() == 3
+        assert [
+            cache.get(identity, "md5") for identity in identities
+        ] == [None, None, None, "3", "4"]
+
+    def test_evict_over_max_bytes(self, cache):
+        identities = [(1, inode, 10, 0) for inode in range(2000)]
+        for identity in identities:
+            cache.put(identity, {"md5": "0" * 32}, f"file{identity[1]}")
+        cache.max_bytes = 64 * 1024
+        assert cache.evict() > 0
+        assert 0 < len(cache) < len(identities)
+        assert cache._used_bytes() <= cache.max_bytes
+        assert cache.get(identities[-1], "md5") is not None
+
+    def test_hard_links_cached_separately(self, cache, old_file, tmp_path):
+        link = str(tmp_path / "link.txt")
+        os.link(old_file, link)
+        for path in (old_file, link):
+            cache.hash_file(path, ["md5"], Mock(return_value={"md5": "abc"}))
+        assert len(cache) == 2
+        calculate = Mock()
+        for path in (old_file, link):
+            cache.hash_file(path, ["md5"], calculate)
+        calculate.assert_not_called()
+
+
+def test_cache_from_older_schema_emptied(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with checksum_cache.ChecksumCache(path) as cache:
+        cache.put((1, 1, 10, 0), {"md5": "abc"}, "spam")
+        cache._connection.execute("PRAGMA user_version = 0")
+        cache._connection.commit()
+    with checksum_cache.ChecksumCache(path) as cache:
+        assert len(cache) == 0
+
+
+def test_open_checksum_cache_is_shared(tmp_path):
+    path = str(tmp_path / "cache" / "checksums.sqlite")
+    assert checksum_cache.open_checksum_cache(path) is \
+        checksum_cache.open_checksum_cache(path)
+    assert os.path.exists(path)
+
+
+def test_calculate_md5_hash_with_cache(cache, old_file):
+    expected_hash = "f1b708bba17f1ce948dc979f4d7092bc"
+    for _ in range(2):
+        assert validation.calculate_md5_hash(
+            old_file, cache=cache
+        ) == expected_hash
+    assert cache.statistics == checksum_cache.CacheStatistics(1, 1)
+
+
+@pytest.mark.parametrize("force_rehash", [False, True])
+def test_make_checksum_task_with_cache(tmp_path, old_file, force_rehash):
+    cache_path = str(tmp_path / "cache.sqlite")
+    messages = []
+    for _ in range(2):
+        task = validation.MakeChecksumTask(
+            source_path=os.path.dirname(old_file),
+            filename=os.path.basename(old_file),
+            checksum_report="checksum.md5",
+            checksum_cache=cache_path,
+            force_rehash=force_rehash,
+        )
+        task.log = messages.append
+        assert task.work() is True
+        assert task.results["checksum_hash"] == \
+            hashlib.md5(b"0000000000").hexdigest()
+    assert ("in the cache" in messages[-1]) is not force_rehash
+
+
+def test_make_checksum_batch_task_logs_statistics(tmp_path, old_file):
+    cache_path = str(tmp_path / "cache.sqlite")
+    messages = []
+    for _ in range(2):
+        task = validation.MakeChecksumBatchTask(
+            source_path=os.path.dirname(old_file),
+            filenames=[os.path.basename(old_file)],
+            checksum_report="checksum.md5",
+            checksum_cache=cache_path,
+        )
+        task.log = messages.append
+        assert task.work() is True
+    assert messages[-1] == "Checksum cache: 1 hit(s), 0 miss(es)"
+
+
+def test_verify_checksum_manifest_with_cache(tmp_path, old_file):
+    manifest = tmp_path / "checksum.md5"
+    manifest.write_text(
+        f"{hashlib.md5(b'0000000000').hexdigest()} *dummy.txt\n"
+    )
+    cache_path = str(tmp_path / "cache.sqlite")
+    messages = []
+    for _ in range(2):
+        task = validation.VerifyChecksumManifestTask(
+            str(manifest), checksum_cache=cache_path, check_extra_files=False
+        )
+        task.log = messages.append
+        assert task.work() is True
+        assert task.results["mismatched"] == []
+    assert messages[-1] == "Checksum cache: 1 hit(s), 0 miss(es)"
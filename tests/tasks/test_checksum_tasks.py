@@ -1,8 +1,12 @@
+import hashlib
 import os
 import shutil
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import MagicMock
+
+import pytest
 
 from speedwagon.tasks import validation
+from speedwagon.workflows.checksum_shared import ResultsValues
 
 
 class TestMakeChecksumTask:
@@ -42,16 +46,358 @@ def test_create_checksum(tmpdir_factory):
     shutil.rmtree(temp_dir)
 
 
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"chunk_size": 7},
+        {"use_mmap": True},
+    ],
+    ids=["adaptive", "small_chunks", "mmap"],
+)
+@pytest.mark.parametrize("size", [0, 10, 3 * 2 ** 20 + 5])
+def test_calculate_md5_hash_read_methods(tmp_path, kwargs, size):
+    data = (bytes(range(251)) * (size // 251 + 1))[:size]
+    test_file = tmp_path / "data.bin"
+    test_file.write_bytes(data)
+    assert validation.calculate_md5_hash(
+        str(test_file), **kwargs
+    ) == hashlib.md5(data).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "file_size, block_size, expected",
+    [
+        (0, 4096, validation.CHUNK_SIZE),
+        (10, 4096, 4096),
+        (2 ** 16, 4096, 2 ** 16),
+        (2 ** 30, 4096, 2 ** 24),
+        (2 ** 30, 0, 2 ** 24),
+        (64 * 100_000, 4096, 102_400),
+        (2 ** 40, 4096, validation.MAX_CHUNK_SIZE),
+    ],
+)
+def test_choose_chunk_size(file_size, block_size, expected):
+    assert validation.choose_chunk_size(file_size, block_size) == expected
+
+
+def test_read_file_chunks_reuses_buffer(tmp_path):
+    test_file = tmp_path / "data.bin"
+    test_file.write_bytes(b"spam" * 10)
+    with open(test_file, "rb", buffering=0) as file:
+        chunks = [
+            (chunk.obj, bytes(chunk))
+            for chunk in validation.read_file_chunks(file, chunk_size=16)
+        ]
+    assert len({id(buffer) for buffer, _ in chunks}) == 1
+    assert b"".join(data for _, data in chunks) == b"spam" * 10
+
 class TestMakeCheckSumReportTask:
-    def test_work(self):
-        output_filename = "output_filename"
+    def test_work(self, tmp_path):
+        output_filename = tmp_path / "output_filename"
         checksum_calculations = [MagicMock()]
         task = validation.MakeCheckSumReportTask(
-            output_filename=output_filename,
+            output_filename=str(output_filename),
             checksum_calculations=checksum_calculations
         )
+        assert task.work() is True
+        assert output_filename.exists()
+        assert os.listdir(tmp_path) == ["output_filename"]
+
+    def test_uses_chosen_algorithm(self, tmp_path):
+        output_filename = tmp_path / "checksum.sha256"
+        task = validation.MakeCheckSumReportTask(
+            output_filename=str(output_filename),
+            checksum_calculations=[
+                {
+                    ResultsValues.SOURCE_FILE: "b.tif",
+                    ResultsValues.SOURCE_HASHES: {
+                        "md5": "md5-b", "sha256": "sha256-b"
+                    },
+                },
+                {
+                    ResultsValues.SOURCE_FILE: "a.tif",
+                    ResultsValues.SOURCE_HASH: "sha256-a",
+                },
+            ],
+            algorithm="sha256",
+        )
+        assert task.work() is True
+        assert output_filename.read_text() == (
+            "sha256-a *a.tif\nsha256-b *b.tif\n"
+        )
+
+
+def test_checksum_report_add_hashes():
+    report = validation.ChecksumReport("sha1")
+    report.add_hashes("a.tif", {"md5": "md5-a", "sha1": "sha1-a"})
+    assert report.build() == "sha1-a *a.tif\n"
+
+
+def test_checksum_report_unknown_algorithm():
+    with pytest.raises(ValueError):
+        validation.ChecksumReport("not-a-hash")
+
+
+class TestCalculateHashesInParallel:
+    def test_results_in_order(self, tmp_path):
+        paths = []
+        for index in range(20):
+            path = tmp_path / f"file{index}.txt"
+            path.write_bytes(b"x" * index * 1000)
+            paths.append(str(path))
+        assert list(
+            validation.calculate_hashes_in_parallel(paths, max_workers=4)
+        ) == [(path, validation.calculate_md5_hash(path)) for path in paths]
+
+    def test_error_raised(self, tmp_path):
+        with pytest.raises(ValueError):
+            list(
+                validation.calculate_hashes_in_parallel(
+                    [str(tmp_path / "missing.txt")]
+                )
+            )
+
+    def test_reads_file_paths_lazily(self):
+        read = []
+
+        def file_paths():
+            for index in range(100):
+                read.append(index)
+                yield str(index)
+
+        hash_values = validation.calculate_hashes_in_parallel(
+            file_paths(), max_workers=2, hash_function=lambda path: path
+        )
+        assert next(hash_values) == ("0", "0")
+        assert len(read) < 10
+
+    def test_earlier_name_kept(self):
+        assert validation.calculate_md5_hashes is \
+            validation.calculate_hashes_in_parallel
+
+
+class TestMakeChecksumBatchTask:
+    def test_work(self, monkeypatch):
+        monkeypatch.setattr(
+            validation, "calculate_md5_hash", lambda path: f"hash of {path}"
+        )
+        task = validation.MakeChecksumBatchTask(
+            source_path="source",
+            filenames=["b.tif", "a.tif"],
+            checksum_report="checksum.md5",
+        )
+        assert task.work() is True
+        assert task.results == [
+            {
+                "source_filename": "b.tif",
+                "checksum_hash": f"hash of {os.path.join('source', 'b.tif')}",
+                "checksum_file": "checksum.md5",
+                "checksum_hashes": {
+                    "md5": f"hash of {os.path.join('source', 'b.tif')}"
+                },
+            },
+            {
+                "source_filename": "a.tif",
+                "checksum_hash": f"hash of {os.path.join('source', 'a.tif')}",
+                "checksum_file": "checksum.md5",
+                "checksum_hashes": {
+                    "md5": f"hash of {os.path.join('source', 'a.tif')}"
+                },
+            },
+        ]
+
+
+class TestCalculateHashes:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"chunk_size": 7}, {"use_mmap": True}],
+        ids=["adaptive", "small_chunks", "mmap"],
+    )
+    def test_matches_hashlib(self, tmp_path, kwargs):
+        data = bytes(range(256)) * 1000
+        path = tmp_path / "data.bin"
+        path.write_bytes(data)
+        algorithms = ("md5", "sha1", "sha256")
+        assert validation.calculate_hashes(
+            str(path), algorithms, **kwargs
+        ) == {
+            algorithm: hashlib.new(algorithm, data).hexdigest()
+            for algorithm in algorithms
+        }
+
+    @pytest.mark.parametrize("algorithms", [(), ("md5", "not-a-hash")])
+    def test_invalid_algorithms(self, tmp_path, algorithms):
+        with pytest.raises(ValueError):
+            validation.calculate_hashes(str(tmp_path), algorithms)
+
+
+def test_make_checksum_task_several_algorithms(tmp_path):
+    data = b"0000000000"
+    (tmp_path / "dummy.txt").write_bytes(data)
+    task = validation.MakeChecksumTask(
+        source_path=str(tmp_path),
+        filename="dummy.txt",
+        checksum_report="checksum.sha1",
+        algorithms=("sha1", "md5"),
+    )
+    assert task.work() is True
+    assert task.results["checksum_hash"] == hashlib.md5(data).hexdigest()
+    assert task.results["checksum_hashes"] == {
+        "sha1": hashlib.sha1(data).hexdigest(),
+        "md5": hashlib.md5(data).hexdigest(),
+    }
+
+
+def test_make_checksum_task_without_md5_still_reports_md5(tmp_path):
+    data = b"0000000000"
+    (tmp_path / "dummy.txt").write_bytes(data)
+    task = validation.MakeChecksumTask(
+        source_path=str(tmp_path),
+        filename="dummy.txt",
+        checksum_report="checksum.sha256",
+        algorithms=("sha256",),
+    )
+    assert task.work() is True
+    assert task.results["checksum_hash"] == hashlib.md5(data).hexdigest()
+    assert task.results["checksum_hashes"]["sha256"] == \
+        hashlib.sha256(data).hexdigest()
+
+
+class TestChecksumReportWriter:
+    @pytest.mark.parametrize("max_entries_in_memory", [1, 3, 1000])
+    def test_same_as_checksum_report(self, tmp_path, max_entries_in_memory):
+        entries = [
+            (f"file{index % 7}_{index}.tif", f"{index:032x}")
+            for index in range(50)
+        ]
+        report = validation.ChecksumReport()
+        output_filename = tmp_path / "checksum.md5"
+        with validation.ChecksumReportWriter(
+            str(output_filename),
+            max_entries_in_memory=max_entries_in_memory,
+        ) as writer:
+            for filename, hash_value in entries:
+                report.add_entry(filename, hash_value)
+                writer.add_entry(filename, hash_value)
+            writer.write()
+        assert output_filename.read_text(encoding="utf-8") == report.build()
+
+    def test_empty_report(self, tmp_path):
+        output_filename = tmp_path / "checksum.md5"
+        with validation.ChecksumReportWriter(str(output_filename)) as writer:
+            writer.write()
+        assert output_filename.read_text() == \
+            validation.ChecksumReport().build()
+
+    def test_many_batches_merged(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(validation, "MAX_REPORT_MERGE_FILES", 3)
+        output_filename = tmp_path / "checksum.md5"
+        with validation.ChecksumReportWriter(
+            str(output_filename), max_entries_in_memory=2
+        ) as writer:
+            for index in reversed(range(20)):
+                writer.add_entry(f"{index:02d}.tif", str(index))
+            assert len(writer._runs) < 3
+            writer.write()
+        assert output_filename.read_text().splitlines() == [
+            f"{index} *{index:02d}.tif" for index in range(20)
+        ]
 
-        m = mock_open()
-        with patch('speedwagon.tasks.validation.open', m):
-            assert task.work() is True
-        assert m.called is True
+    def test_existing_report_kept_on_error(self, tmp_path):
+        output_filename = tmp_path / "checksum.md5"
+        output_filename.write_text("original\n")
+
+        def entries():
+            yield "a.tif\x001\n"
+            raise OSError("unable to read")
+
+        with validation.ChecksumReportWriter(str(output_filename)) as writer:
+            writer._sorted_entries = entries
+            with pytest.raises(OSError):
+                writer.write()
+        assert output_filename.read_text() == "original\n"
+        assert os.listdir(tmp_path) == ["checksum.md5"]
+
+
+def test_read_checksum_manifest(tmp_path):
+    manifest = tmp_path / "checksum.md5"
+    manifest.write_text(
+        "abc123 *a.tif\n\nDEF456  sub dir/b.tif\n", encoding="utf-8"
+    )
+    assert list(validation.read_checksum_manifest(str(manifest))) == [
+        ("a.tif", "abc123"),
+        ("sub dir/b.tif", "DEF456"),
+    ]
+
+
+def test_read_checksum_manifest_invalid_line(tmp_path):
+    manifest = tmp_path / "checksum.md5"
+    manifest.write_text("abc123 *a.tif\nnot a checksum\n")
+    with pytest.raises(ValueError, match="line 2"):
+        list(validation.read_checksum_manifest(str(manifest)))
+
+
+class TestVerifyChecksumManifestTask:
+    @pytest.fixture
+    def package(self, tmp_path):
+        files = {
+            "good.tif": b"good",
+            "changed.tif": b"changed",
+            "missing.tif": b"missing",
+        }
+        with validation.ChecksumReportWriter(
+            str(tmp_path / "checksum.md5")
+        ) as writer:
+            for filename, data in files.items():
+                writer.add_entry(filename, hashlib.md5(data).hexdigest())
+            writer.write()
+        (tmp_path / "good.tif").write_bytes(b"good")
+        (tmp_path / "changed.tif").write_bytes(b"not what it was")
+        (tmp_path / "extra.tif").write_bytes(b"extra")
+        return tmp_path
+
+    def test_work(self, package):
+        task = validation.VerifyChecksumManifestTask(
+            str(package / "checksum.md5"), max_workers=2
+        )
+        messages = []
+        task.log = messages.append
+        assert task.work() is True
+        assert task.results == {
+            "checksum_report": str(package / "checksum.md5"),
+            "files_checked": 2,
+            "mismatched": [
+                {
+                    "filename": "changed.tif",
+                    "expected_hash": hashlib.md5(b"changed").hexdigest(),
+                    "actual_hash": hashlib.md5(
+                        b"not what it was"
+                    ).hexdigest(),
+                }
+            ],
+            "missing": ["missing.tif"],
+            "extra": ["extra.tif"],
+        }
+        assert len(messages) == 4
+
+    def test_without_extra_files(self, package):
+        result = validation.verify_checksum_manifest(
+            str(package / "checksum.md5"), check_extra_files=False
+        )
+        assert result["extra"] == []
+
+    def test_valid_package(self, package):
+        os.remove(package / "extra.tif")
+        (package / "changed.tif").write_bytes(b"changed")
+        (package / "missing.tif").write_bytes(b"missing")
+        result = validation.verify_checksum_manifest(
+            str(package / "checksum.md5")
+        )
+        assert (
+            result["files_checked"],
+            result["mismatched"],
+            result["missing"],
+            result["extra"],
+        ) == (3, [], [], [])
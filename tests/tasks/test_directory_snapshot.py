@@ -0,0 +1,135 @@
+import os
+import time
+
+import pytest
+
+from speedwagon.tasks import directory_snapshot, packaging
+
+
+def set_old_mtimes(top):
+    an_hour_ago = time.time() - 60 * 60
+    for root, dirnames, filenames in os.walk(top, topdown=False):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(root, name), (an_hour_ago, an_hour_ago))
+    os.utime(top, (an_hour_ago, an_hour_ago))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    top = tmp_path / "tree"
+    for package in ["package1", "package2", os.path.join("nested", "3")]:
+        (top / package).mkdir(parents=True)
+        for index in range(3):
+            (top / package / f"{index}.tif").write_bytes(b"x" * index)
+    set_old_mtimes(str(top))
+    return str(top)
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    with directory_snapshot.DirectorySnapshot(
+        str(tmp_path / "snapshot.sqlite")
+    ) as new_snapshot:
+        yield new_snapshot
+
+
+def normalized_walk(walk):
+    return sorted(
+        (root, sorted(dirnames), sorted(filenames))
+        for root, dirnames, filenames in walk
+    )
+
+
+class TestDirectorySnapshot:
+    def test_same_as_os_walk(self, snapshot, tree):
+        assert normalized_walk(snapshot.walk(tree)) == \
+            normalized_walk(os.walk(tree))
+
+    def test_unchanged_directories_reused(self, snapshot, tree):
+        list(snapshot.walk(tree))
+        statistics = directory_snapshot.SnapshotStatistics()
+        assert normalized_walk(snapshot.walk(tree, statistics)) == \
+            normalized_walk(os.walk(tree))
+        assert statistics == directory_snapshot.SnapshotStatistics(
+            listed=0, reused=5
+        )
+
+    def test_changed_directory_listed_again(self, snapshot, tree):
+        list(snapshot.walk(tree))
+        package = os.path.join(tree, "package1")
+        with open(os.path.join(package, "new.tif"), "wb"):
+            pass
+        an_hour_ago = time.time() - 60 * 60
+        os.utime(package, (an_hour_ago + 1, an_hour_ago + 1))
+        statistics = directory_snapshot.SnapshotStatistics()
+        walked = normalized_walk(snapshot.walk(tree, statistics))
+        assert walked == normalized_walk(os.walk(tree))
+        assert statistics.listed == 1
+
+    def test_recently_modified_directory_not_trusted(
+        self, snapshot, tmp_path
+    ):
+        top = tmp_path / "new"
+        top.mkdir()
+        list(snapshot.walk(str(top)))
+        (top / "file.txt").write_bytes(b"")
+        statistics = directory_snapshot.SnapshotStatistics()
+        list(snapshot.walk(str(top), statistics))
+        assert statistics.listed == 1
+
+    def test_removed_directory_forgotten(self, snapshot, tree):
+        list(snapshot.walk(tree))
+        nested = os.path.join(tree, "nested")
+        os.remove(os.path.join(nested, "3", "0.tif"))
+        os.remove(os.path.join(nested, "3", "1.tif"))
+        os.remove(os.path.join(nested, "3", "2.tif"))
+        os.rmdir(os.path.join(nested, "3"))
+        os.utime(nested, (time.time() - 60, time.time() - 60))
+        list(snapshot.walk(tree))
+        assert snapshot._connection.execute(
+            "SELECT COUNT(*) FROM directories WHERE path LIKE ?",
+            (f"%{os.sep}3",),
+        ).fetchone()[0] == 0
+
+    def test_entries_have_sizes(self, snapshot, tree):
+        entries = snapshot.entries(os.path.join(tree, "package2"))
+        assert sorted((e.name, e.size) for e in entries) == [
+            ("0.tif", 0), ("1.tif", 1), ("2.tif", 2)
+        ]
+
+    def test_pruned_directories_not_walked(self, snapshot, tree):
+        walked = []
+        for root, dirnames, _ in snapshot.walk(tree):
+            walked.append(root)
+            dirnames[:] = [name for name in dirnames if name != "nested"]
+        assert os.path.join(tree, "nested") not in walked
+
+
+class FindTifPackages(packaging.AbsFindPackageTask):
+    def find_packages(self, search_path):
+        return sorted(
+            os.path.relpath(root, search_path)
+            for root, _, filenames in self.walk(search_path)
+            if any(filename.endswith(".tif") for filename in filenames)
+        )
+
+
+@pytest.mark.parametrize("use_snapshot", [False, True])
+def test_find_package_task_walk(tmp_path, tree, use_snapshot):
+    snapshot_index = (
+        str(tmp_path / "snapshot.sqlite") if use_snapshot else None
+    )
+    for _ in range(2):
+        messages = []
+        task = FindTifPackages(tree, snapshot_index=snapshot_index)
+        task.log = messages.append
+        assert task.work() is True
+        assert task.results == [
+            "nested" + os.sep + "3", "package1", "package2"
+        ]
+    if use_snapshot:
+        assert messages[-1] == \
+            "Directory snapshot: 0 directories listed, 5 read from snapshot"
+    else:
+        assert len(messages) == 1
+
@@ -1,3 +1,4 @@
+import os
 import logging
 from unittest.mock import Mock
 
@@ -110,3 +111,70 @@ def test_delete_file_with_exec(monkeypatch):
     remove.assert_not_called()
     task.exec()
     remove.assert_called_once_with("some_file.txt")
+
+
+@pytest.fixture
+def derivatives(tmp_path):
+    files = []
+    for package in ["a", "b"]:
+        directory = tmp_path / "access" / package / "images"
+        directory.mkdir(parents=True)
+        for index in range(300):
+            path = directory / f"{index}.jp2"
+            path.touch()
+            files.append(str(path))
+    (tmp_path / "access" / "b" / "keep.txt").touch()
+    return files
+
+
+def test_delete_files(tmp_path, derivatives):
+    task = filesystem.delete_files(
+        derivatives + [str(tmp_path / "missing.jp2")],
+        max_workers=3,
+        prune_empty_directories_in=str(tmp_path / "access"),
+    )
+    task.exec()
+    assert task.task_result.data == {
+        "removed": 600,
+        "missing": 1,
+        "failed": 0,
+        "directories_pruned": 3,
+        "errors": [],
+    }
+    assert os.listdir(tmp_path / "access") == ["b"]
+    assert os.listdir(tmp_path / "access" / "b") == ["keep.txt"]
+
+
+def test_delete_files_without_pruning(tmp_path, derivatives):
+    task = filesystem.delete_files(derivatives)
+    task.exec()
+    assert task.task_result.data["directories_pruned"] == 0
+    assert os.listdir(tmp_path / "access" / "a" / "images") == []
+
+
+def test_delete_files_errors_counted(monkeypatch):
+    monkeypatch.setattr(filesystem, "MAX_REPORTED_REMOVAL_ERRORS", 2)
+    monkeypatch.setattr(
+        filesystem.os,
+        "remove",
+        Mock(side_effect=PermissionError("access denied")),
+    )
+    task = filesystem.delete_files([f"{index}.jp2" for index in range(5)])
+    task.exec()
+    assert task.status == TaskStatus.SUCCESS
+    result = task.task_result.data
+    assert (result["removed"], result["failed"], len(result["errors"])) == \
+        (0, 5, 2)
+
+
+def test_delete_directories(tmp_path):
+    paths = []
+    for directory in ["a", "a/b", "a/b/c", "d"]:
+        (tmp_path / directory).mkdir()
+        paths.append(str(tmp_path / directory))
+    (tmp_path / "d" / "file.txt").touch()
+    task = filesystem.delete_directories(paths, max_workers=2)
+    task.exec()
+    result = task.task_result.data
+    assert (result["removed"], result["failed"]) == (3, 1)
+    assert os.listdir(tmp_path) == ["d"]
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from speedwagon.tasks import packaging
+
+
+@pytest.fixture
+def tree(tmp_path):
+    top = tmp_path / "tree"
+    for package in ["package1", "package2", os.path.join("nested", "3")]:
+        (top / package).mkdir(parents=True)
+        for index in range(3):
+            (top / package / f"{index}.tif").write_bytes(b"x" * index)
+    return str(top)
+
+
+class TestWalkDirectoryTree:
+    def test_same_files_as_os_walk(self, tree):
+        assert sorted(
+            entry.path
+            for entry in packaging.walk_directory_tree(tree, max_workers=3)
+        ) == sorted(
+            os.path.join(root, filename)
+            for root, _, filenames in os.walk(tree)
+            for filename in filenames
+        )
+
+    def test_include_directories(self, tree):
+        assert sorted(
+            os.path.relpath(entry.path, tree)
+            for entry in packaging.walk_directory_tree(
+                tree, include_directories=True
+            )
+            if entry.is_dir()
+        ) == ["nested", os.path.join("nested", "3"), "package1", "package2"]
+
+    @pytest.mark.parametrize(
+        "max_depth, expected_files", [(0, 0), (1, 6), (None, 9)]
+    )
+    def test_max_depth(self, tree, max_depth, expected_files):
+        assert len(
+            list(packaging.walk_directory_tree(tree, max_depth=max_depth))
+        ) == expected_files
+
+    def test_file_patterns(self, tree):
+        assert sorted(
+            entry.name
+            for entry in packaging.walk_directory_tree(
+                tree, file_patterns=["1.*", "2.tif"]
+            )
+        ) == ["1.tif", "1.tif", "1.tif", "2.tif", "2.tif", "2.tif"]
+
+    def test_directory_filter(self, tree):
+        assert {
+            os.path.dirname(os.path.relpath(entry.path, tree))
+            for entry in packaging.walk_directory_tree(
+                tree, directory_filter=lambda entry: entry.name != "nested"
+            )
+        } == {"package1", "package2"}
+
+    def test_onerror(self, tmp_path):
+        errors = []
+        assert list(
+            packaging.walk_directory_tree(
+                str(tmp_path / "missing"), onerror=errors.append
+            )
+        ) == []
+        assert len(errors) == 1 and isinstance(errors[0], OSError)
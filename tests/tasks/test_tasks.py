@@ -151,6 +151,59 @@ def test_task_as_concurrent_future(simple_task_builder):
             assert "got it" == future.result()
 
 
+def test_subtask_serialization_skips_log_queue():
+    subtask = SimpleSubtask(message="got it")
+    subtask.parent_task_log_q = Mock()
+    subtask.log = lambda message: None
+    loaded = speedwagon.tasks.tasks.deserialize_subtask(
+        speedwagon.tasks.tasks.serialize_subtask(subtask)
+    )
+    assert loaded.message == "got it"
+    assert "log" not in loaded.__dict__
+    assert loaded._parent_task_log_q is None
+
+
+def test_run_serialized_subtask():
+    data = speedwagon.tasks.tasks.serialize_subtask(
+        SimpleSubtask(message="got it")
+    )
+    attributes, messages = speedwagon.tasks.tasks.run_serialized_subtask(data)
+    assert attributes["_result"].data == "got it"
+    assert messages == ["processing"]
+
+
+def test_run_serialized_subtask_unable_to_load():
+    assert speedwagon.tasks.tasks.run_serialized_subtask(b"garbage") is None
+
+
+
+def test_dependency_results_in_order():
+    first = SimpleSubtask(message="spam")
+    second = SimpleSubtask(message="eggs")
+    dependent = SimpleSubtask(message="bacon")
+    dependent.depends_on(second, first)
+    assert dependent.dependencies_finished is False
+    for subtask in (first, second):
+        subtask.parent_task_log_q = []
+        subtask.exec()
+    assert dependent.dependencies_finished is True
+    assert [
+        result.data for result in dependent.dependency_results
+    ] == ["eggs", "spam"]
+
+
+def test_subtask_serialization_keeps_dependency_results():
+    dependency = SimpleSubtask(message="spam")
+    dependency.parent_task_log_q = []
+    dependency.exec()
+    dependent = SimpleSubtask(message="eggs")
+    dependent.depends_on(dependency)
+    loaded = speedwagon.tasks.tasks.deserialize_subtask(
+        speedwagon.tasks.tasks.serialize_subtask(dependent)
+    )
+    assert loaded.dependencies == ()
+    assert [result.data for result in loaded.dependency_results] == ["spam"]
+
 @pytest.fixture
 def simple_task_builder_with_2_subtasks(tmpdir_factory):
     temp_path = tmpdir_factory.mktemp("task_builder")
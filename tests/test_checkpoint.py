@@ -0,0 +1,215 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+import speedwagon
+from speedwagon import checkpoint, runner_strategies
+
+
+class EchoTask(speedwagon.tasks.Subtask):
+    executed = []
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def work(self) -> bool:
+        EchoTask.executed.append(self.value)
+        if self.value == self.fail_on:
+            raise RuntimeError(f"failed on {self.value}")
+        self.set_results(self.value)
+        return True
+
+    fail_on = None
+
+
+class EchoWorkflow(speedwagon.Workflow):
+    name = "echo"
+
+    def discover_task_metadata(self, *args, **kwargs):
+        return [{"value": value} for value in range(5)]
+
+    def create_new_task(self, task_builder, job_args):
+        task_builder.add_subtask(EchoTask(job_args["value"]))
+
+
+@pytest.fixture()
+def echo_task(monkeypatch):
+    monkeypatch.setattr(EchoTask, "executed", [])
+    return EchoTask
+
+
+def build_subtask(working_dir, value):
+    task_builder = speedwagon.tasks.TaskBuilder(
+        speedwagon.tasks.MultiStageTaskBuilder(working_dir), working_dir
+    )
+    task_builder.add_subtask(EchoTask(value))
+    return task_builder.build_task().main_subtasks[0]
+
+
+class TestSubtaskKey:
+    def test_same_between_task_builders(self):
+        assert checkpoint.subtask_key(
+            build_subtask("dummy", "spam")
+        ) == checkpoint.subtask_key(build_subtask("dummy", "spam"))
+
+    def test_differs_by_arguments(self):
+        assert checkpoint.subtask_key(
+            build_subtask("dummy", "spam")
+        ) != checkpoint.subtask_key(build_subtask("dummy", "eggs"))
+
+    def test_not_changed_by_running(self):
+        subtask = EchoTask("spam")
+        key = checkpoint.subtask_key(subtask)
+        subtask.exec()
+        assert checkpoint.subtask_key(subtask) == key
+
+    def test_none_for_memory_address_in_arguments(self):
+        assert checkpoint.subtask_key(EchoTask(object())) is None
+
+    def test_stable_repr_arguments_allowed(self):
+        assert checkpoint.subtask_key(
+            EchoTask(speedwagon.tasks.tasks.TaskStatus.SUCCESS)
+        ) is not None
+
+
+class TestSubtaskJournal:
+    def test_restore_recorded(self, tmp_path):
+        finished = EchoTask("spam")
+        finished.exec()
+        with checkpoint.SubtaskJournal(str(tmp_path / "journal")) as journal:
+            assert journal.record(finished) is True
+        with checkpoint.SubtaskJournal(str(tmp_path / "journal")) as journal:
+            subtask = EchoTask("spam")
+            assert journal.restore(subtask) is True
+        assert subtask.status == speedwagon.tasks.tasks.TaskStatus.SUCCESS
+        assert subtask.task_result.data == "spam"
+
+    def test_restore_not_recorded(self, tmp_path):
+        with checkpoint.SubtaskJournal(str(tmp_path / "journal")) as journal:
+            subtask = EchoTask("spam")
+            assert journal.restore(subtask) is False
+        assert subtask.status == speedwagon.tasks.tasks.TaskStatus.IDLE
+
+    def test_unstable_key_not_recorded(self, tmp_path):
+        finished = EchoTask(object())
+        finished.exec()
+        with checkpoint.SubtaskJournal(str(tmp_path / "journal")) as journal:
+            assert journal.record(finished) is False
+            assert journal.restore(EchoTask(object())) is False
+            assert len(journal) == 0
+
+    def test_unloadable_result_runs_again(self, tmp_path):
+        finished = EchoTask("spam")
+        finished.exec()
+        with checkpoint.SubtaskJournal(str(tmp_path / "journal")) as journal:
+            journal.record(finished)
+            journal._connection.execute(
+                "UPDATE subtasks SET result = ?", (b"not a pickle",)
+            )
+            subtask = EchoTask("spam")
+            assert journal.restore(subtask) is False
+        assert subtask.status == speedwagon.tasks.tasks.TaskStatus.IDLE
+
+    def test_discard(self, tmp_path):
+        journal = checkpoint.SubtaskJournal(str(tmp_path / "journal"))
+        journal.discard()
+        assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("resume, expected_length", [(True, 1), (False, 0)])
+def test_open_job_journal(tmp_path, resume, expected_length):
+    finished = EchoTask("spam")
+    finished.exec()
+    options = {"input": "somewhere"}
+    with checkpoint.open_job_journal(str(tmp_path), "echo", options) as first:
+        first.record(finished)
+    with checkpoint.open_job_journal(
+        str(tmp_path), "echo", options, resume=resume
+    ) as journal:
+        assert len(journal) == expected_length
+
+
+def test_job_journal_path_differs_by_options(tmp_path):
+    assert checkpoint.job_journal_path(
+        "journals", "echo", {"input": "spam"}
+    ) != checkpoint.job_journal_path("journals", "echo", {"input": "eggs"})
+
+
+class TestResume:
+    def run_workflow(self, journal, workers=1):
+        scheduler = runner_strategies.TaskScheduler(".", workers=workers)
+        scheduler.request_more_info = lambda *_: {}
+        scheduler.journal = journal
+        reports = []
+        workflow = EchoWorkflow()
+        workflow.generate_report = lambda results, **_: reports.append(
+            [result.data for result in results]
+        )
+        scheduler.run(workflow, {})
+        return reports[0]
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_finished_subtasks_skipped(
+        self, tmp_path, echo_task, monkeypatch, workers
+    ):
+        journal_path = str(tmp_path / "journal")
+        monkeypatch.setattr(echo_task, "fail_on", 3)
+        with checkpoint.SubtaskJournal(journal_path) as journal:
+            with pytest.raises(RuntimeError):
+                self.run_workflow(journal, workers)
+        assert {0, 1, 2}.issubset(echo_task.executed)
+
+        monkeypatch.setattr(echo_task, "fail_on", None)
+        monkeypatch.setattr(echo_task, "executed", [])
+        with checkpoint.SubtaskJournal(journal_path) as journal:
+            assert self.run_workflow(journal, workers) == [0, 1, 2, 3, 4]
+        assert 0 not in echo_task.executed
+        assert {3, 4}.issubset(echo_task.executed)
+
+
+def test_job_manager_discards_journal_on_success(tmp_path, echo_task):
+    journal_path = str(tmp_path / "journal")
+    manager = runner_strategies.BackgroundJobManager()
+    manager.valid_workflows = {"echo": EchoWorkflow}
+    manager.journal_factory = lambda *_: checkpoint.SubtaskJournal(
+        journal_path
+    )
+    manager.config_file_location_strategy = type(
+        "Locator",
+        (),
+        {
+            "get_config_file": lambda _: str(tmp_path / "config.ini"),
+            "get_app_data_dir": lambda _: str(tmp_path),
+        },
+    )()
+    liaison = runner_strategies.JobManagerLiaison(
+        callbacks=Mock(),
+        events=runner_strategies.ThreadedEvents(),
+    )
+    liaison.events.started.set()
+    with manager:
+        manager.submit_job("echo", app=None, liaison=liaison, options={})
+    assert echo_task.executed == [0, 1, 2, 3, 4]
+    assert not os.path.exists(journal_path)
+
+
+@pytest.mark.parametrize(
+    "resume, checkpointing, journal_opened",
+    [(False, False, False), (False, True, True), (True, False, True)],
+)
+def test_json_startup_only_journals_when_asked(
+    monkeypatch, resume, checkpointing, journal_opened
+):
+    open_job_journal = Mock()
+    monkeypatch.setattr(checkpoint, "open_job_journal", open_job_journal)
+    monkeypatch.setattr(speedwagon, "simple_api_run_workflow", Mock())
+    startup = speedwagon.startup.SingleWorkflowJSON()
+    startup.config_files_locator = Mock(get_app_data_dir=lambda: "dummy")
+    startup.workflow = EchoWorkflow()
+    startup.options = {}
+    startup.resume = resume
+    startup.checkpoint = checkpointing
+    assert startup.run() == 0
+    assert open_job_journal.called is journal_opened
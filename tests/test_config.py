@@ -337,6 +337,9 @@ class TestCliArgsSetter:
         (["info"], {"command": "info"}),
         (["info", "--format=json"], {"report_format": ReportFormats.JSON}),
         (["info", "--format=plain-text"], {"report_format": ReportFormats.PLAIN_TEXT}),
+        (["run", "--resume"], {"resume": True}),
+        (["run"], {"resume": False, "checkpoint": False}),
+        (["run", "--checkpoint"], {"checkpoint": True}),
     ])
     def test_get_arg_parser(self, args, expected, monkeypatch):
         arg_parser = speedwagon.config.config.CliArgsSetter().get_arg_parser()
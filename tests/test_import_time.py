@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import speedwagon
+
+IMPORT_TIME_BUDGET_US = int(
+    os.getenv("SPEEDWAGON_IMPORT_TIME_BUDGET_US", "250000")
+)
+
+DEFERRED_MODULES = {
+    "pluggy",
+    "yaml",
+    "speedwagon.config",
+    "speedwagon.frontend",
+    "speedwagon.job",
+    "speedwagon.runner_strategies",
+    "speedwagon.startup",
+}
+
+
+def import_times(statement):
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        try:
+            times[module.strip()] = int(cumulative)
+        except ValueError:
+            continue
+    return times
+
+
+def test_heavy_modules_not_imported_with_package():
+    imported = set(import_times("import speedwagon"))
+    assert imported & DEFERRED_MODULES == set()
+
+
+def test_import_time_budget():
+    times = import_times("import speedwagon")
+    assert times["speedwagon"] < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize("name", speedwagon.__all__)
+def test_public_api_available(name):
+    assert getattr(speedwagon, name) is not None
+    assert name in dir(speedwagon)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        getattr(speedwagon, "not_part_of_the_api")
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import speedwagon.runner_strategies as r; r.Run('.')",
+        "import speedwagon; speedwagon.job.available_workflows",
+    ],
+)
+def test_job_module_available_in_fresh_interpreter(statement):
+    subprocess.run([sys.executable, "-c", statement], check=True)
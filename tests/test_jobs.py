@@ -168,4 +168,74 @@ class TestOnlyActivatedPluginsWorkflows:
         mock_entry_points = Mock(name="entry_points()", return_value=iter([]))
         monkeypatch.setattr(importlib.metadata, "entry_points", mock_entry_points)
         list(speedwagon.job.OnlyActivatedPluginsWorkflows.iter_plugins())
-        assert mock_entry_points.called
\ No newline at end of file
+        assert mock_entry_points.called
+
+class TestWorkflowRegistry:
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[PLUGINS.spam]\nbacon = True\n")
+        return str(config_file)
+
+    @pytest.fixture
+    def get_plugin_manager(self, monkeypatch):
+        workflow = Mock()
+        get_plugin_manager = Mock(
+            side_effect=lambda *_: Mock(
+                hook=Mock(
+                    registered_workflows=Mock(
+                        return_value=[{"eggs": workflow}]
+                    )
+                )
+            )
+        )
+        monkeypatch.setattr(
+            speedwagon.plugins, "get_plugin_manager", get_plugin_manager
+        )
+        return get_plugin_manager
+
+    def test_plugins_loaded_once(self, config_file, get_plugin_manager):
+        registry = speedwagon.job.WorkflowRegistry()
+        for _ in range(3):
+            strategy = speedwagon.job.FindAllWorkflowsPluggyStrategy(
+                config_file=config_file, registry=registry
+            )
+            assert list(speedwagon.job.available_workflows(strategy)) == [
+                "eggs"
+            ]
+        get_plugin_manager.assert_called_once()
+
+    def test_whitelist(self, config_file):
+        registry = speedwagon.job.WorkflowRegistry()
+        assert registry.whitelist(config_file) == {("spam", "bacon")}
+
+    def test_changed_config_file_read_again(self, config_file):
+        registry = speedwagon.job.WorkflowRegistry()
+        registry.whitelist(config_file)
+        with open(config_file, "a", encoding="utf-8") as file_handle:
+            file_handle.write("[PLUGINS.eggs]\nham = True\n")
+        assert registry.whitelist(config_file) == {
+            ("spam", "bacon"), ("eggs", "ham")
+        }
+
+    def test_invalidate(self, config_file, get_plugin_manager):
+        registry = speedwagon.job.WorkflowRegistry()
+        registry.workflows(config_file)
+        registry.invalidate()
+        registry.workflows(config_file)
+        assert get_plugin_manager.call_count == 2
+
+    def test_explicit_plugin_manager_not_cached(self, config_file):
+        plugin_manager = Mock(
+            hook=Mock(
+                registered_workflows=Mock(return_value=[{"eggs": Mock()}])
+            )
+        )
+        registry = Mock(speedwagon.job.WorkflowRegistry)
+        strategy = speedwagon.job.FindAllWorkflowsPluggyStrategy(
+            config_file=config_file,
+            plugin_manager=plugin_manager,
+            registry=registry,
+        )
+        assert list(strategy.locate()) == ["eggs"]
+        registry.workflows.assert_not_called()
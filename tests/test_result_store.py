@@ -0,0 +1,140 @@
+import pickle
+
+import pytest
+
+import speedwagon
+from speedwagon import result_store
+
+
+@pytest.fixture(
+    params=[
+        result_store.InMemoryResultStore,
+        result_store.SQLiteResultStore,
+        result_store.AppendOnlyFileResultStore,
+        lambda: result_store.SpillingResultStore(threshold=2),
+    ],
+    ids=["memory", "sqlite", "file", "spilling"],
+)
+def store(request):
+    store = request.param()
+    yield store
+    store.close()
+
+
+def test_results_keep_order(store):
+    for value in range(600):
+        store.append(speedwagon.tasks.Result(dict, {"value": value}))
+    assert [r.data["value"] for r in store] == list(range(600))
+
+
+def test_results_can_be_read_more_than_once(store):
+    store.append("spam")
+    store.append("eggs")
+    assert list(store) == list(store) == ["spam", "eggs"]
+
+
+def test_indexing(store):
+    for value in range(5):
+        store.append(value)
+    assert store[0] == 0
+    assert store[-1] == 4
+    assert store[1:3] == [1, 2]
+    assert len(store) == 5
+
+
+def test_index_out_of_range(store):
+    store.append("spam")
+    with pytest.raises(IndexError):
+        store[1]
+
+
+def test_clear(store):
+    store.append("spam")
+    store.clear()
+    store.append("eggs")
+    assert list(store) == ["eggs"]
+
+
+def test_append_while_iterating(store):
+    store.append(0)
+    for value in store:
+        if value < 3:
+            store.append(value + 1)
+    assert list(store) == [0, 1, 2, 3]
+
+
+class TestSpillingResultStore:
+    def test_not_spilled_under_threshold(self):
+        store = result_store.SpillingResultStore(threshold=3)
+        for value in range(3):
+            store.append(value)
+        assert store.spilled is False
+
+    def test_spilled_past_threshold(self):
+        store = result_store.SpillingResultStore(threshold=3)
+        for value in range(4):
+            store.append(value)
+        assert store.spilled is True
+        assert list(store) == [0, 1, 2, 3]
+        store.close()
+
+    def test_uses_spill_store_factory(self):
+        spill_store = result_store.InMemoryResultStore()
+        store = result_store.SpillingResultStore(
+            threshold=1, spill_store_factory=lambda: spill_store
+        )
+        store.append("spam")
+        store.append("eggs")
+        assert list(spill_store) == ["spam", "eggs"]
+
+    def test_clear_returns_to_memory(self):
+        store = result_store.SpillingResultStore(threshold=1)
+        store.append("spam")
+        store.append("eggs")
+        store.clear()
+        assert store.spilled is False
+        assert len(store) == 0
+
+    def test_unpicklable_at_threshold_kept_in_memory(self):
+        store = result_store.SpillingResultStore(threshold=1)
+        unpicklable = lambda: None  # noqa: E731
+        store.append(unpicklable)
+        with pytest.warns(RuntimeWarning):
+            store.append("spam")
+        store.append("eggs")
+        assert store.spilled is False
+        assert list(store) == [unpicklable, "spam", "eggs"]
+
+    def test_unpicklable_after_spilling_kept_in_memory(self):
+        store = result_store.SpillingResultStore(threshold=1)
+        unpicklable = lambda: None  # noqa: E731
+        store.append("spam")
+        store.append("eggs")
+        assert store.spilled is True
+        with pytest.warns(RuntimeWarning):
+            store.append(unpicklable)
+        store.append("bacon")
+        assert store.spilled is False
+        assert list(store) == ["spam", "eggs", unpicklable, "bacon"]
+
+
+@pytest.mark.parametrize(
+    "store_type",
+    [result_store.SQLiteResultStore, result_store.AppendOnlyFileResultStore],
+)
+def test_failed_append_leaves_store_intact(store_type):
+    store = store_type()
+    store.append(1)
+    with pytest.raises((pickle.PicklingError, TypeError, AttributeError)):
+        store.append([b"x" * 200_000, lambda: None])
+    store.append(2)
+    assert len(store) == 2
+    assert list(store) == [1, 2]
+    store.close()
+
+
+def test_sqlite_file_removed_on_close(tmp_path):
+    store = result_store.SQLiteResultStore(directory=str(tmp_path))
+    store.append("spam")
+    store.close()
+    assert list(tmp_path.iterdir()) == []
@@ -1,6 +1,11 @@
 from __future__ import annotations
+import collections
 import logging
+import operator
 import os
+import queue
+import threading
+import time
 
 import pytest
 from unittest.mock import Mock, MagicMock, create_autospec
@@ -296,6 +301,200 @@ class TestTaskGenerator:
         assert workflow.completion_task.called is True
 
 
+class TestTaskGeneratorStreaming:
+    @pytest.fixture()
+    def workflow(self):
+        workflow = MagicMock()
+        workflow.__class__ = speedwagon.job.AbsWorkflow
+        workflow.discover_task_metadata = Mock(
+            return_value=[{"Input": value} for value in range(3)]
+        )
+        workflow.create_new_task = Mock(
+            side_effect=lambda task_builder, _: task_builder.add_subtask(
+                speedwagon.tasks.Subtask()
+            )
+        )
+        return workflow
+
+    def test_first_task_yielded_before_all_are_created(self, workflow):
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=workflow,
+            options={},
+            working_directory="dummy",
+            streaming=True
+        )
+        tasks = iter(task_generator.get_main_tasks("dummy", [], {}))
+        next(tasks)
+        assert workflow.create_new_task.call_count == 1
+        assert len(list(tasks)) == 2
+
+    def test_total_from_list_length(self, workflow):
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=workflow,
+            options={},
+            working_directory="dummy",
+            streaming=True
+        )
+        totals = []
+        for _ in task_generator.get_main_tasks("dummy", [], {}):
+            totals.append(task_generator.total_task)
+        assert totals == [3, 3, 3]
+        assert task_generator.current_task == 3
+
+    def test_total_unknown_for_iterator(self, workflow):
+        workflow.discover_task_metadata = Mock(
+            return_value=({"Input": value} for value in range(3))
+        )
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=workflow,
+            options={},
+            working_directory="dummy",
+            streaming=True
+        )
+        list(task_generator.get_main_tasks("dummy", [], {}))
+        assert task_generator.total_task == 3
+
+
+class TestTaskGeneratorStrategyResultStore:
+    @pytest.fixture()
+    def workflow(self):
+        workflow = MagicMock()
+        workflow.__class__ = speedwagon.job.AbsWorkflow
+        workflow.discover_task_metadata = Mock(
+            return_value=[{"Input": value} for value in range(5)]
+        )
+        workflow.create_new_task = Mock(
+            side_effect=lambda builder, job_args: builder.add_subtask(
+                SlowEchoTask(job_args["Input"], 0)
+            )
+        )
+        workflow.generate_report = Mock(return_value=None)
+        return workflow
+
+    def test_results_spill_to_store(self, workflow):
+        from speedwagon import result_store
+        scheduler = runner_strategies.TaskScheduler(".")
+        scheduler.task_generator_strategy = \
+            runner_strategies.TaskGeneratorStrategy(
+                result_store_factory=lambda: result_store.SpillingResultStore(
+                    threshold=2
+                )
+            )
+        for task in scheduler.iter_tasks(workflow, {}):
+            task.exec()
+        results = workflow.generate_report.call_args[0][0]
+        assert results.spilled is True
+        assert [result.data for result in results] == list(range(5))
+
+    def test_completion_task_gets_results(self, workflow):
+        scheduler = runner_strategies.TaskScheduler(".")
+        for task in scheduler.iter_tasks(workflow, {}):
+            task.exec()
+        results = workflow.completion_task.call_args[0][1]
+        assert [result.data for result in results] == list(range(5))
+
+
+class TestGeneratorTaskMetadata:
+    @staticmethod
+    def workflow_with_generator(produced, items=1000):
+        def discover_task_metadata(*args, **kwargs):
+            for value in range(items):
+                produced.append(value)
+                yield {"Input": value}
+
+        workflow = MagicMock()
+        workflow.__class__ = speedwagon.job.AbsWorkflow
+        workflow.discover_task_metadata = discover_task_metadata
+        workflow.create_new_task = Mock(
+            side_effect=lambda task_builder, _: task_builder.add_subtask(
+                speedwagon.tasks.Subtask()
+            )
+        )
+        return workflow
+
+    @pytest.mark.parametrize("prefetch", [0, 5])
+    def test_consumed_incrementally(self, prefetch):
+        produced = []
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=self.workflow_with_generator(produced),
+            options={},
+            working_directory="dummy",
+            metadata_prefetch=prefetch
+        )
+        tasks = iter(task_generator.get_main_tasks("dummy", [], {}))
+        next(tasks)
+        time.sleep(0.05)
+        assert len(produced) <= prefetch + 2
+        assert len(list(tasks)) == 999
+        assert task_generator.total_task == 1000
+
+    def test_error_in_generator_raised(self):
+        def discover_task_metadata(*args, **kwargs):
+            yield {"Input": 1}
+            raise FileNotFoundError("whoops")
+
+        workflow = self.workflow_with_generator([])
+        workflow.discover_task_metadata = discover_task_metadata
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=workflow,
+            options={},
+            working_directory="dummy",
+        )
+        with pytest.raises(FileNotFoundError):
+            list(task_generator.get_main_tasks("dummy", [], {}))
+
+
+class TestPrefetchIterator:
+    def test_items_in_order(self):
+        assert list(
+            runner_strategies.PrefetchIterator(iter(range(100)), window=3)
+        ) == list(range(100))
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            runner_strategies.PrefetchIterator(iter([]), window=0)
+
+    def test_length_hint_from_source(self):
+        iterator = runner_strategies.PrefetchIterator([1, 2, 3], window=3)
+        assert operator.length_hint(iterator) == 3
+
+    def test_close_stops_producer(self):
+        produced = []
+
+        def source():
+            for value in range(1000):
+                produced.append(value)
+                yield value
+
+        iterator = runner_strategies.PrefetchIterator(
+            source(), window=2, poll=0.01
+        )
+        assert next(iterator) == 0
+        iterator.close()
+        iterator._thread.join(1)
+        assert iterator._thread.is_alive() is False
+        assert len(produced) < 10
+        with pytest.raises(StopIteration):
+            next(iterator)
+
+
+@pytest.mark.parametrize(
+    "subtasks_created, entries_used, expected_entries, expected", [
+        (0, 0, 10, 0),
+        (2, 1, 10, 20),
+        (5, 5, 10, 10),
+        (7, 5, 0, 7),
+        (12, 10, 10, 12),
+    ]
+)
+def test_estimate_total_tasks(
+        subtasks_created, entries_used, expected_entries, expected
+):
+    assert runner_strategies.estimate_total_tasks(
+        subtasks_created, entries_used, expected_entries
+    ) == expected
+
+
 class TestRunnerDisplay:
 
     @pytest.fixture()
@@ -365,7 +564,7 @@ class TestTaskDispatcher:
 
     def test_start_set_state_to_running(self):
         dispatcher = runner_strategies.TaskDispatcher(
-            job_queue=Mock()
+            job_queue=queue.Queue()
         )
 
         dispatcher.current_state = \
@@ -379,7 +578,7 @@ class TestTaskDispatcher:
 
     def test_stop_set_state(self, monkeypatch):
         dispatcher = runner_strategies.TaskDispatcher(
-            job_queue=Mock()
+            job_queue=queue.Queue()
         )
 
         # ======================================================================
@@ -412,6 +611,30 @@ class TestTaskDispatcher:
         assert dispatcher.current_state.state_name == "Idle"
         assert halt_dispatching_method.called is True
 
+    def test_runs_queued_tasks(self):
+        job_queue = queue.Queue()
+        task = Mock(spec=speedwagon.tasks.Subtask, name="task")
+        with runner_strategies.TaskDispatcher(job_queue=job_queue):
+            job_queue.put(task)
+            job_queue.join()
+        task.exec.assert_called_once()
+
+    def test_stop_drains_queue(self):
+        job_queue = queue.Queue()
+        dispatcher = runner_strategies.TaskDispatcher(job_queue=job_queue)
+        dispatcher.start()
+        dispatcher.stop()
+        assert dispatcher.active is False
+        assert job_queue.unfinished_tasks == 0
+
+    def test_idle_dispatcher_blocks_on_queue(self):
+        job_queue = Mock(wraps=queue.Queue())
+        dispatcher = runner_strategies.TaskDispatcher(job_queue=job_queue)
+        with dispatcher:
+            time.sleep(0.05)
+        assert job_queue.empty.called is False
+        assert job_queue.get.call_count == 1
+
 
 class TestTaskDispatcherRunning:
     def test_running_on_active_is_noop_warning(self, caplog):
@@ -513,6 +736,469 @@ class TestTaskScheduler:
             scheduler.run_workflow_jobs(workflow, options, scheduler.reporter)
 
 
+class CountingReporter(speedwagon.frontend.reporter.RunnerDisplay):
+    def __init__(self):
+        super().__init__()
+        self.refresh_count = 0
+        self.cancel_requested = False
+
+    def refresh(self):
+        self.refresh_count += 1
+
+    @property
+    def user_canceled(self):
+        return self.cancel_requested
+
+
+class TestTaskSchedulerWaiting:
+    def test_reporter_refresh_rate_limited(self):
+        class SleepingWorkflow(speedwagon.Workflow):
+            name = "sleeping"
+
+            def discover_task_metadata(self, *args, **kwargs):
+                return [{"value": 0, "delay": 0.5}]
+
+            def create_new_task(self, task_builder, job_args):
+                task_builder.add_subtask(
+                    SlowEchoTask(job_args["value"], job_args["delay"])
+                )
+
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir"
+        )
+        scheduler.reporter_refresh_rate = 10
+        scheduler.request_more_info = lambda *_: {}
+        reporter = CountingReporter()
+        scheduler.reporter = reporter
+        scheduler.run(SleepingWorkflow(), {})
+        assert 1 <= reporter.refresh_count <= 10
+
+    def test_cancel_detected_within_interval(self):
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir"
+        )
+        scheduler.cancel_check_interval = 0.05
+        scheduler.iter_tasks = Mock(return_value=[Mock()])
+        reporter = CountingReporter()
+        timer = threading.Timer(
+            0.1, lambda: setattr(reporter, "cancel_requested", True)
+        )
+        timer.start()
+        started = time.monotonic()
+        with pytest.raises(speedwagon.exceptions.JobCancelled):
+            scheduler.run_workflow_jobs(Mock(), {}, reporter)
+        timer.join()
+        assert time.monotonic() - started < 1
+
+
+def test_task_queue_notifies_on_task_done():
+    task_queue = runner_strategies.TaskQueue()
+    task_queue.put("task")
+    task_queue.get()
+    notified = threading.Event()
+
+    def wait_for_task():
+        with task_queue.task_finished:
+            task_queue.task_finished.wait(5)
+        notified.set()
+
+    waiter = threading.Thread(target=wait_for_task)
+    with task_queue.task_finished:
+        waiter.start()
+    time.sleep(0.01)
+    task_queue.task_done()
+    waiter.join()
+    assert notified.is_set()
+
+
+class SlowEchoTask(speedwagon.tasks.Subtask):
+    def __init__(self, value, delay):
+        super().__init__()
+        self.value = value
+        self.delay = delay
+
+    def work(self) -> bool:
+        time.sleep(self.delay)
+        self.set_results(self.value)
+        return True
+
+
+class SlowEchoWorkflow(speedwagon.Workflow):
+    name = "slow echo"
+
+    def discover_task_metadata(self, initial_results, additional_data,
+                               user_args):
+        # Earlier tasks are slower, so they finish after later ones
+        return [
+            {"value": value, "delay": (10 - value) * 0.005}
+            for value in range(10)
+        ]
+
+    def create_new_task(self, task_builder, job_args):
+        task_builder.add_subtask(
+            SlowEchoTask(job_args["value"], job_args["delay"])
+        )
+
+
+class TestTaskSchedulerWorkers:
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            runner_strategies.TaskScheduler(
+                working_directory="some_dir", workers=0
+            )
+
+    def test_results_in_task_order(self, monkeypatch):
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir", workers=4
+        )
+        scheduler.request_more_info = lambda *_: {}
+        workflow = SlowEchoWorkflow()
+        generate_report = Mock(return_value=None)
+        monkeypatch.setattr(workflow, "generate_report", generate_report)
+        scheduler.run(workflow, {})
+        results = generate_report.call_args[0][0]
+        assert [result.data for result in results] == list(range(10))
+
+    def test_tasks_run_concurrently(self):
+        workers = 3
+        barrier = threading.Barrier(workers, timeout=5)
+
+        class WaitForOthersTask(speedwagon.tasks.Subtask):
+            def work(self) -> bool:
+                barrier.wait()
+                return True
+
+        class WaitingWorkflow(speedwagon.Workflow):
+            name = "waiting"
+
+            def discover_task_metadata(self, *args, **kwargs):
+                return [{} for _ in range(workers)]
+
+            def create_new_task(self, task_builder, job_args):
+                task_builder.add_subtask(WaitForOthersTask())
+
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir", workers=workers
+        )
+        scheduler.request_more_info = lambda *_: {}
+        scheduler.run(WaitingWorkflow(), {})
+        assert barrier.broken is False
+
+    def test_task_exception_raised(self):
+        class BadTask(speedwagon.tasks.Subtask):
+            def work(self) -> bool:
+                raise FileNotFoundError("whoops")
+
+        class BadWorkflow(speedwagon.Workflow):
+            name = "bad"
+
+            def discover_task_metadata(self, *args, **kwargs):
+                return [{}, {}]
+
+            def create_new_task(self, task_builder, job_args):
+                task_builder.add_subtask(BadTask())
+
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir", workers=2
+        )
+        scheduler.request_more_info = lambda *_: {}
+        with pytest.raises(FileNotFoundError):
+            scheduler.run(BadWorkflow(), {})
+
+
+def test_dispatcher_tracks_current_task_per_worker():
+    job_queue = queue.Queue()
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingTask(speedwagon.tasks.Subtask):
+        def work(self) -> bool:
+            started.set()
+            release.wait(5)
+            return True
+
+    task = BlockingTask()
+    with runner_strategies.TaskDispatcher(job_queue, workers=2) as dispatcher:
+        job_queue.put(task)
+        started.wait(5)
+        assert task in dispatcher.current_tasks.values()
+        release.set()
+        job_queue.join()
+    assert len(dispatcher.current_tasks) == 1
+    assert all(value is None for value in dispatcher.current_tasks.values())
+
+
+def test_collect_finished_results_keeps_order():
+    finished = Mock(
+        status=speedwagon.tasks.tasks.TaskStatus.SUCCESS,
+        task_result="first"
+    )
+    running = Mock(
+        status=speedwagon.tasks.tasks.TaskStatus.WORKING,
+        task_result="second"
+    )
+    also_finished = Mock(
+        status=speedwagon.tasks.tasks.TaskStatus.SUCCESS,
+        task_result="third"
+    )
+    pending = collections.deque([finished, running, also_finished])
+    results = []
+    runner_strategies.collect_finished_results(pending, results)
+    assert results == ["first"]
+    runner_strategies.collect_finished_results(pending, results, wait=True)
+    assert results == ["first", "second", "third"]
+
+
+class ProcessIdTask(speedwagon.tasks.Subtask):
+    def work(self) -> bool:
+        self.log("reporting process id")
+        self.set_results(os.getpid())
+        return True
+
+
+class ProcessFailingTask(speedwagon.tasks.Subtask):
+    def work(self) -> bool:
+        raise FileNotFoundError("whoops")
+
+
+class DependentEchoWorkflow(speedwagon.Workflow):
+    """Each package has two echo tasks and a summary that depends on them."""
+
+    name = "dependent echo"
+    packages = 3
+
+    def discover_task_metadata(self, *args, **kwargs):
+        return [{"package": package} for package in range(self.packages)]
+
+    def create_new_task(self, task_builder, job_args):
+        package = job_args["package"]
+        summary = SummaryTask()
+        echo_tasks = [
+            SlowEchoTask(f"{package}-{value}", 0.01) for value in range(2)
+        ]
+        summary.depends_on(*echo_tasks)
+        # Added before its dependencies to make sure it is held back.
+        task_builder.add_subtask(summary)
+        for task in echo_tasks:
+            task_builder.add_subtask(task)
+
+
+class SummaryTask(speedwagon.tasks.Subtask):
+    def work(self) -> bool:
+        self.set_results(
+            sorted(result.data for result in self.dependency_results)
+        )
+        return True
+
+
+class TestDependencyScheduling:
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_dependent_tasks_run_after_dependencies(
+        self, monkeypatch, workers
+    ):
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir", workers=workers
+        )
+        scheduler.request_more_info = lambda *_: {}
+        workflow = DependentEchoWorkflow()
+        generate_report = Mock(return_value=None)
+        monkeypatch.setattr(workflow, "generate_report", generate_report)
+        scheduler.run(workflow, {})
+        # Summaries are released in the order their dependencies finish.
+        summaries = sorted(
+            result.data
+            for result in generate_report.call_args[0][0]
+            if result.source is SummaryTask
+        )
+        assert summaries == [
+            [f"{package}-0", f"{package}-1"] for package in range(3)
+        ]
+
+    def test_iter_tasks_yields_dependencies_first(self):
+        scheduler = runner_strategies.TaskScheduler(".")
+        scheduler.request_more_info = lambda *_: {}
+        order = []
+        for task in scheduler.iter_tasks(DependentEchoWorkflow(), {}):
+            order.append(task.__class__)
+            task.exec()
+        assert order == [SlowEchoTask, SlowEchoTask, SummaryTask] * 3
+
+    def test_independent_tasks_not_held_back(self):
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=Mock(), options={}, working_directory="dummy"
+        )
+        dependency = SlowEchoTask("spam", 0)
+        dependent = SlowEchoTask("eggs", 0)
+        dependent.depends_on(dependency)
+        independent = SlowEchoTask("bacon", 0)
+        tasks = task_generator.order_by_dependencies(
+            [dependent, independent, dependency]
+        )
+        assert next(tasks) is independent
+        assert next(tasks) is dependency
+        dependency.exec()
+        assert next(tasks) is dependent
+
+    def test_unmet_dependencies_raise(self):
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=Mock(), options={}, working_directory="dummy"
+        )
+        dependent = SlowEchoTask("eggs", 0)
+        dependent.depends_on(SlowEchoTask("never added", 0))
+        with pytest.raises(RuntimeError):
+            list(task_generator.order_by_dependencies([dependent]))
+
+
+class WorkingDirectoryTask(speedwagon.tasks.Subtask):
+    def work(self) -> bool:
+        with open(
+            os.path.join(self.subtask_working_dir, "scratch.txt"), "w"
+        ) as scratch_file:
+            scratch_file.write(self.task_working_dir)
+        self.set_results(self.task_working_dir)
+        return True
+
+
+class WorkingDirectoryWorkflow(speedwagon.Workflow):
+    name = "working directory"
+
+    def discover_task_metadata(self, *args, **kwargs):
+        return [{"package": package} for package in range(3)]
+
+    def create_new_task(self, task_builder, job_args):
+        for _ in range(2):
+            task_builder.add_subtask(WorkingDirectoryTask())
+
+
+class TestWorkingDirectories:
+    def test_subtask_working_dir_created_once(self, tmp_path, monkeypatch):
+        task = SlowEchoTask("spam", 0)
+        task.subtask_working_dir = str(tmp_path / "subtask")
+        makedirs = Mock(wraps=os.makedirs)
+        monkeypatch.setattr(speedwagon.tasks.tasks.os, "makedirs", makedirs)
+        for _ in range(3):
+            assert os.path.isdir(task.subtask_working_dir)
+        makedirs.assert_called_once()
+
+    def test_subtask_working_dir_not_created_unless_used(self, tmp_path):
+        task = SlowEchoTask("spam", 0)
+        task.subtask_working_dir = str(tmp_path / "subtask")
+        task.exec()
+        assert not os.path.exists(tmp_path / "subtask")
+
+    def test_removed_after_last_subtask_finished(self, tmp_path):
+        tracker = runner_strategies.WorkingDirectoryTracker()
+        subtasks = [SlowEchoTask(value, 0) for value in range(2)]
+        for value, subtask in enumerate(subtasks):
+            subtask.task_working_dir = str(tmp_path / "task")
+            subtask.subtask_working_dir = str(tmp_path / "task" / str(value))
+            tracker.add(subtask)
+            assert os.path.isdir(subtask.subtask_working_dir)
+        tracker.finished(subtasks[0])
+        assert os.path.isdir(tmp_path / "task")
+        tracker.finished(subtasks[1])
+        assert not os.path.exists(tmp_path / "task")
+        assert tracker.removed == 1
+
+    def test_existing_directories_not_removed(self, tmp_path):
+        (tmp_path / "002").mkdir()
+        (tmp_path / "002" / "user_file.txt").write_text("keep me")
+        tracker = runner_strategies.WorkingDirectoryTracker()
+        subtask = SlowEchoTask("spam", 0)
+        subtask.task_working_dir = str(tmp_path / "002")
+        subtask.subtask_working_dir = str(tmp_path / "002" / "subtask")
+        tracker.add(subtask)
+        assert os.path.isdir(subtask.subtask_working_dir)
+        tracker.finished(subtask)
+        assert (tmp_path / "002" / "user_file.txt").read_text() == "keep me"
+        assert not os.path.exists(tmp_path / "002" / "subtask")
+
+    def test_unused_directories_not_removed(self, tmp_path):
+        (tmp_path / "002").mkdir()
+        tracker = runner_strategies.WorkingDirectoryTracker()
+        subtask = SlowEchoTask("spam", 0)
+        subtask.task_working_dir = str(tmp_path / "002")
+        subtask.subtask_working_dir = str(tmp_path / "002" / "subtask")
+        tracker.add(subtask)
+        tracker.finished(subtask)
+        assert os.path.isdir(tmp_path / "002")
+        assert tracker.removed == 0
+
+    def test_task_generator_keeps_directories_by_default(self, tmp_path):
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=WorkingDirectoryWorkflow(),
+            options={},
+            working_directory=str(tmp_path),
+            caller=Mock(request_more_info=Mock(return_value={})),
+        )
+        task_working_dirs = set()
+        for task in task_generator.tasks():
+            task.exec()
+            task_working_dirs.add(task.task_working_dir)
+        assert len(task_working_dirs) == 3
+        assert all(os.path.isdir(path) for path in task_working_dirs)
+
+    @pytest.mark.parametrize("clean", [True, False])
+    def test_task_generator_cleans_up(self, tmp_path, clean):
+        task_generator = runner_strategies.TaskGenerator(
+            workflow=WorkingDirectoryWorkflow(),
+            options={},
+            working_directory=str(tmp_path),
+            clean_working_directories=clean,
+            caller=Mock(request_more_info=Mock(return_value={})),
+        )
+        task_working_dirs = set()
+        for task in task_generator.tasks():
+            task.exec()
+            task_working_dirs.add(task.task_working_dir)
+        assert len(task_working_dirs) == 3
+        assert all(
+            os.path.exists(path) is not clean for path in task_working_dirs
+        )
+
+
+class TestProcessPoolSubtaskExecutor:
+    def test_runs_in_another_process(self):
+        task = ProcessIdTask()
+        task.parent_task_log_q = []
+        with runner_strategies.ProcessPoolSubtaskExecutor(1) as executor:
+            executor.exec(task)
+        assert task.status == speedwagon.tasks.tasks.TaskStatus.SUCCESS
+        assert task.results != os.getpid()
+        assert task.parent_task_log_q == ["reporting process id"]
+
+    def test_unpicklable_task_runs_in_process(self):
+        class LocalTask(speedwagon.tasks.Subtask):
+            def work(self) -> bool:
+                self.set_results(os.getpid())
+                return True
+
+        task = LocalTask()
+        with runner_strategies.ProcessPoolSubtaskExecutor(1) as executor:
+            with pytest.warns(RuntimeWarning):
+                executor.exec(task)
+        assert task.results == os.getpid()
+
+    def test_task_exception_raised(self):
+        with runner_strategies.ProcessPoolSubtaskExecutor(1) as executor:
+            with pytest.raises(FileNotFoundError):
+                executor.exec(ProcessFailingTask())
+
+    def test_with_task_scheduler(self, monkeypatch):
+        scheduler = runner_strategies.TaskScheduler(
+            working_directory="some_dir", workers=2
+        )
+        scheduler.subtask_executor = \
+            runner_strategies.ProcessPoolSubtaskExecutor(2)
+        scheduler.request_more_info = lambda *_: {}
+        workflow = SlowEchoWorkflow()
+        generate_report = Mock(return_value=None)
+        monkeypatch.setattr(workflow, "generate_report", generate_report)
+        scheduler.run(workflow, {})
+        results = generate_report.call_args[0][0]
+        assert [result.data for result in results] == list(range(10))
+
+
 class SpamTask(speedwagon.tasks.Subtask):
     name = "Spam"
 
@@ -610,6 +1296,99 @@ class TestBackgroundJobManager:
                 )
 
 
+class BlockingJobTask(speedwagon.tasks.Subtask):
+    release = threading.Event()
+
+    def work(self) -> bool:
+        self.set_results(self.subtask_working_dir)
+        return self.release.wait(5)
+
+
+class BlockingJobWorkflow(speedwagon.Workflow):
+    name = "blocking"
+
+    def create_new_task(self, task_builder, job_args) -> None:
+        task_builder.add_subtask(BlockingJobTask())
+
+    def discover_task_metadata(self, *args, **kwargs) -> List[dict]:
+        return [{}]
+
+
+class TestBackgroundJobManagerConcurrency:
+    @pytest.fixture(autouse=True)
+    def app_data_dir(self, monkeypatch):
+        monkeypatch.setattr(
+            speedwagon.config.StandardConfigFileLocator,
+            "get_app_data_dir",
+            lambda *_: "."
+        )
+        BlockingJobTask.release = threading.Event()
+
+    @staticmethod
+    def submit(manager):
+        return manager.submit_job(
+            workflow_name="blocking",
+            options={},
+            app=Mock(),
+            liaison=runner_strategies.JobManagerLiaison(
+                callbacks=Mock(), events=Mock()
+            )
+        )
+
+    @staticmethod
+    def wait_for(condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.01)
+
+    def test_invalid_max_concurrent_jobs(self):
+        with pytest.raises(ValueError):
+            runner_strategies.BackgroundJobManager(max_concurrent_jobs=0)
+
+    def test_second_job_queued(self):
+        with runner_strategies.BackgroundJobManager() as manager:
+            manager.valid_workflows = {"blocking": BlockingJobWorkflow}
+            first = self.submit(manager)
+            second = self.submit(manager)
+            assert manager.running_jobs() == [first]
+            assert manager.queued_jobs() == [second]
+            BlockingJobTask.release.set()
+        assert manager.finished_jobs() == [first, second]
+        assert all(
+            job.result == runner_strategies.JobSuccess.SUCCESS
+            for job in manager.jobs()
+        )
+
+    def test_jobs_run_concurrently(self):
+        with runner_strategies.BackgroundJobManager(
+            max_concurrent_jobs=2
+        ) as manager:
+            manager.valid_workflows = {"blocking": BlockingJobWorkflow}
+            jobs = [self.submit(manager), self.submit(manager)]
+            assert manager.running_jobs() == jobs
+            self.wait_for(
+                lambda: all(job.working_directory for job in jobs)
+            )
+            BlockingJobTask.release.set()
+        assert manager.queued_jobs() == []
+        assert len(manager.finished_jobs()) == 2
+
+    def test_jobs_use_separate_working_directories(self):
+        with runner_strategies.BackgroundJobManager(
+            max_concurrent_jobs=2
+        ) as manager:
+            manager.valid_workflows = {"blocking": BlockingJobWorkflow}
+            jobs = [self.submit(manager), self.submit(manager)]
+            self.wait_for(
+                lambda: all(job.working_directory for job in jobs)
+            )
+            BlockingJobTask.release.set()
+        first, second = [job.working_directory for job in jobs]
+        assert first != second
+        assert not os.path.exists(first) and not os.path.exists(second)
+
+
 class TestThreadedEvents:
     def test_done(self):
         events = runner_strategies.ThreadedEvents()
@@ -0,0 +1,183 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+import speedwagon
+import speedwagon.job
+from speedwagon import workflow_metadata
+from speedwagon.exceptions import SpeedwagonException
+from speedwagon.workflow import TextLineEditData
+
+
+class SpamWorkflow(speedwagon.Workflow):
+    name = "spam"
+    description = "Makes spam"
+
+    def discover_task_metadata(self, *args, **kwargs):
+        return []
+
+    def job_options(self):
+        return [TextLineEditData("Input", required=True)]
+
+
+class InactiveWorkflow(SpamWorkflow):
+    name = "inactive"
+    active = False
+
+
+def make_entry_point(version="1.0", workflows=None):
+    plugin = Mock(
+        registered_workflows=Mock(
+            return_value=workflows or {"spam": SpamWorkflow}
+        )
+    )
+    entry_point = Mock(
+        module="spam_plugin",
+        value="spam_plugin:plugin",
+        dist=Mock(version=version, metadata={"Name": "spam-plugin"}),
+        load=Mock(return_value=plugin),
+    )
+    entry_point.name = "plugin"
+    return entry_point
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "workflow_metadata.json")
+
+
+class TestWorkflowMetadataCache:
+    def test_metadata(self, cache_path):
+        cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+        metadata, = cache.plugin_workflows(make_entry_point())
+        assert metadata == {
+            "name": "spam",
+            "description": "Makes spam",
+            "options": [
+                {
+                    "widget_type": "TextInput",
+                    "label": "Input",
+                    "required": True,
+                    "setting_name": "Input",
+                }
+            ],
+            "module": SpamWorkflow.__module__,
+            "qualname": "SpamWorkflow",
+            "plugin": "spam_plugin:plugin",
+            "distribution": "spam-plugin",
+            "version": "1.0",
+        }
+
+    def test_plugin_not_loaded_again(self, cache_path):
+        cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+        cache.plugin_workflows(make_entry_point())
+        cache.save()
+        entry_point = make_entry_point()
+        reopened = workflow_metadata.WorkflowMetadataCache(cache_path)
+        assert reopened.plugin_workflows(entry_point)[0]["name"] == "spam"
+        entry_point.load.assert_not_called()
+
+    def test_new_version_loaded_again(self, cache_path):
+        cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+        cache.plugin_workflows(make_entry_point())
+        entry_point = make_entry_point(version="2.0")
+        assert cache.plugin_workflows(entry_point)[0]["version"] == "2.0"
+        entry_point.load.assert_called_once()
+
+    def test_clear(self, cache_path):
+        cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+        cache.plugin_workflows(make_entry_point())
+        cache.clear()
+        entry_point = make_entry_point()
+        cache.plugin_workflows(entry_point)
+        entry_point.load.assert_called_once()
+
+    def test_save_only_when_changed(self, cache_path):
+        cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+        cache.save()
+        with pytest.raises(FileNotFoundError):
+            open(cache_path, encoding="utf-8")
+
+    def test_unreadable_cache_ignored(self, cache_path):
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            cache_file.write("{not json")
+        cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+        entry_point = make_entry_point()
+        cache.plugin_workflows(entry_point)
+        cache.save()
+        entry_point.load.assert_called_once()
+        with open(cache_path, encoding="utf-8") as cache_file:
+            assert json.load(cache_file)["format"] == \
+                workflow_metadata.CACHE_FORMAT_VERSION
+
+
+def test_load_workflow_class():
+    metadata = workflow_metadata.workflow_metadata("spam", SpamWorkflow)
+    assert workflow_metadata.load_workflow_class(metadata) is SpamWorkflow
+
+
+def test_load_missing_workflow_class():
+    metadata = workflow_metadata.workflow_metadata("spam", SpamWorkflow)
+    metadata["qualname"] = "NotAWorkflow"
+    with pytest.raises(SpeedwagonException):
+        workflow_metadata.load_workflow_class(metadata)
+
+
+def test_locate_metadata(cache_path):
+    entry_point = make_entry_point(
+        workflows={"spam": SpamWorkflow, "inactive": InactiveWorkflow}
+    )
+    finder = speedwagon.job.OnlyActivatedPluginsWorkflows(
+        plugin_settings={"spam_plugin": {"plugin": True}}
+    )
+    finder.iter_plugins = Mock(return_value=[entry_point])
+    cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+    assert list(finder.locate_metadata(cache)) == ["spam"]
+    reopened = workflow_metadata.WorkflowMetadataCache(cache_path)
+    assert reopened.plugin_workflows(make_entry_point())[0]["name"] == "spam"
+
+
+def test_locate_metadata_skips_deactivated_plugins(cache_path):
+    entry_point = make_entry_point()
+    finder = speedwagon.job.OnlyActivatedPluginsWorkflows(
+        plugin_settings={"spam_plugin": {"plugin": False}}
+    )
+    finder.iter_plugins = Mock(return_value=[entry_point])
+    cache = workflow_metadata.WorkflowMetadataCache(cache_path)
+    assert finder.locate_metadata(cache) == {}
+    entry_point.load.assert_not_called()
+
+
+class TestWorkflowDescriptor:
+    @pytest.fixture
+    def descriptor(self):
+        return workflow_metadata.WorkflowDescriptor(
+            workflow_metadata.workflow_metadata("spam", SpamWorkflow)
+        )
+
+    def test_metadata_without_loading(self, descriptor):
+        assert descriptor.name == "spam"
+        assert descriptor.description == "Makes spam"
+        assert descriptor.options[0]["label"] == "Input"
+        assert descriptor.__name__ == "SpamWorkflow"
+        assert descriptor.loaded is False
+
+    def test_equal_to_class_without_loading(self, descriptor):
+        assert descriptor == SpamWorkflow
+        assert SpamWorkflow == descriptor
+        assert descriptor != InactiveWorkflow
+        assert descriptor.loaded is False
+
+    def test_call_creates_workflow(self, descriptor):
+        assert isinstance(descriptor(global_settings={}), SpamWorkflow)
+        assert descriptor.loaded is True
+
+    def test_other_attributes_from_class(self, descriptor):
+        assert descriptor.active is True
+        assert descriptor.load() is SpamWorkflow
+
+    def test_missing_class(self, descriptor):
+        descriptor.metadata["module"] = "not_a_module"
+        with pytest.raises(SpeedwagonException):
+            descriptor(global_settings={})
@@ -0,0 +1,115 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+import speedwagon
+from speedwagon import workflow_metadata, workflow_validation
+from speedwagon.exceptions import MissingConfiguration
+
+
+class ValidWorkflow(speedwagon.Workflow):
+    name = "valid"
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        type(self).created += 1
+
+    def discover_task_metadata(self, *args, **kwargs):
+        return []
+
+
+class MisconfiguredWorkflow(ValidWorkflow):
+    name = "misconfigured"
+
+    def __init__(self, *args, global_settings=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not (global_settings or {}).get("tesseract_path"):
+            raise MissingConfiguration("tesseract_path not set")
+
+
+@pytest.fixture(autouse=True)
+def reset_counts():
+    ValidWorkflow.created = 0
+    MisconfiguredWorkflow.created = 0
+
+
+def test_validate():
+    validator = workflow_validation.WorkflowValidator()
+    assert validator.validate(
+        {"valid": ValidWorkflow, "misconfigured": MisconfiguredWorkflow},
+        {},
+    ) == {"valid": None, "misconfigured": "tesseract_path not set"}
+
+
+def test_results_reported_as_they_finish():
+    on_result = Mock()
+    workflow_validation.WorkflowValidator().validate(
+        {"valid": ValidWorkflow}, {}, on_result=on_result
+    )
+    on_result.assert_called_once_with("valid", None)
+
+
+def test_results_cached_until_settings_change():
+    validator = workflow_validation.WorkflowValidator()
+    workflows = {"misconfigured": MisconfiguredWorkflow}
+    for _ in range(2):
+        validator.validate(workflows, {})
+    assert MisconfiguredWorkflow.created == 1
+    assert validator.validate(workflows, {"tesseract_path": "/bin"}) == {
+        "misconfigured": None
+    }
+    assert MisconfiguredWorkflow.created == 2
+
+
+def test_invalidate():
+    validator = workflow_validation.WorkflowValidator()
+    validator.validate({"valid": ValidWorkflow}, {})
+    validator.invalidate()
+    validator.validate({"valid": ValidWorkflow}, {})
+    assert ValidWorkflow.created == 2
+
+
+def test_descriptor_keyed_by_version():
+    validator = workflow_validation.WorkflowValidator()
+    metadata = workflow_metadata.workflow_metadata("valid", ValidWorkflow)
+    ValidWorkflow.created = 0
+    for version in ["1.0", "1.0", "2.0"]:
+        metadata = dict(metadata, version=version)
+        validator.validate(
+            {"valid": workflow_metadata.WorkflowDescriptor(metadata)}, {}
+        )
+    assert ValidWorkflow.created == 2
+
+
+def test_timeout():
+    release = threading.Event()
+
+    class HangingWorkflow(ValidWorkflow):
+        def __init__(self, *args, **kwargs):
+            release.wait(5)
+            super().__init__(*args, **kwargs)
+
+    validator = workflow_validation.WorkflowValidator(timeout=0.05)
+    try:
+        results = validator.validate(
+            {"hanging": HangingWorkflow, "valid": ValidWorkflow}, {}
+        )
+    finally:
+        release.set()
+    assert results == {
+        "hanging": "Timed out after 0.05 seconds",
+        "valid": None,
+    }
+
+
+def test_unexpected_errors_raised():
+    class BrokenWorkflow(ValidWorkflow):
+        def __init__(self, *args, **kwargs):
+            raise ZeroDivisionError()
+
+    with pytest.raises(ZeroDivisionError):
+        workflow_validation.WorkflowValidator().validate(
+            {"broken": BrokenWorkflow}, {}
+        )